@@ -1,6 +1,5 @@
 import pygame
 pygame.init()
-pygame.display.set_mode((1, 1))  # Temporärer Display für convert_alpha()
 
 # View Scale (Skalierungsfaktor): Passe diesen Wert an (z. B. 1 für klein, 1.5 für mittel, 2 für groß)
 VIEW_SCALE = 1.5
@@ -12,6 +11,8 @@ WINDOW_HEIGHT = int(620 * VIEW_SCALE)
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
 FPS = 60
+SIM_TICK_RATE = FPS          # Simulationsticks pro Sekunde (feste Schrittweite, unabhängig von der Renderrate)
+MAX_SIM_TICKS_PER_FRAME = 5  # Obergrenze nachgeholter Ticks pro Frame bei Einbrüchen
 
 # Neue Konstanten für UI und Randflächen:
 BORDER_SIZE = 20          # Breite/Höhe der Randflächen (links, rechts, unten; ggf. auch oberer Rand am Spielfeld)
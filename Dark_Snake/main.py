@@ -5,8 +5,6 @@ def main():
     pygame.init()
     pygame.font.init()
     pygame.mixer.init()
-    # Kleines Fenster, um convert_alpha() zu ermöglichen
-    pygame.display.set_mode((1, 1))
     game = Game()
     game.run()
 
@@ -2,7 +2,7 @@ import pygame
 import time
 from modules.ui import Button
 from modules.enums import ItemType
-from modules.graphics import load_image
+from modules.graphics import load_image, projectile_cache_stats
 
 class AdminPanel:
     def __init__(self, game):
@@ -49,6 +49,8 @@ class AdminPanel:
     def toggle(self):
         self.active = not self.active
         self.debug_log("AdminPanel toggled: {}".format("Aktiv" if self.active else "Inaktiv"))
+        if self.active:
+            self.debug_log("Projektil-Sprite-Cache: {}".format(projectile_cache_stats()))
 
     
     def spawn_bolbu_item(self):
@@ -7,38 +7,148 @@ Erweitert für Boss-AoE mit Quelle ("source") und Debug-Darstellung.
 
 import os
 import random
+from collections import OrderedDict
 import pygame
-import time
 import math
 from pygame.math import Vector2
 from config import GRID_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT
+from modules.sim_clock import sim_time
+from modules.graphics import decode_image, asset_exists
 
 # --------------------------------------------------
-# Hilfsfunktionen zum Laden von Effektbildern
+# Effekt-Registry: jedes Effektbild wird einmal dekodiert und skaliert,
+# alle Zonen teilen sich die Surfaces (nur lesen, nicht verändern)
 # --------------------------------------------------
 
-def get_effect_by_type(effect_type):
-    effect_folder = os.path.join("assets", "graphics", "AOEEffekte")
-    type_map = {
-        "damage": "FireAOE1.png",
-        "heal": "HolyAOE1.png",
-        "slow": "DarkAOE1.png",
-        "aura": "MagicAOE1.png"
-    }
-    filename = type_map.get(effect_type)
-    if not filename:
-        return None
-    path = os.path.join(effect_folder, filename)
-    if os.path.exists(path):
+EFFECT_FOLDER = os.path.join("assets", "graphics", "AOEEffekte")
+EFFECT_SIZE = (int(GRID_SIZE * 3), int(GRID_SIZE * 3))
+EFFECT_TYPE_FILES = {
+    "damage": "FireAOE1.png",
+    "heal": "HolyAOE1.png",
+    "slow": "DarkAOE1.png",
+    "aura": "MagicAOE1.png"
+}
+# Auswahl für zufällige Boss-/Spezial-Effekte
+AOE_EFFECT_FILES = [
+    "AcidAOE1.png", "AcidAOE2.png", "AcidAOE3.png", "AcidAOE4.png",
+    "AcidBlop1.png", "AcidBlop2.png", "AcidBlop3.png", "AcidBlop4.png",
+    "DarkAOE1.png", "DarkAOE2.png", "DarkAOE3.png", "DarkAOE4.png",
+    "DarkBlob1.png", "DarkBlop2.png", "DarkBlop3.png",
+    "DungeonAOE.png", "DungeonAOE2.png", "DungeonAOE3.png", "DungeonAOE4.png",
+    "FigurAOE1.png", "FigurAOE2.png", "FigurAOE3.png",
+    "FireAOE1.png", "FireAOE2.png", "FireAOE3.png", "FireAOE4.png",
+    "Fire-FeuerHoch.png", "Fire-FireHoch2.png",
+    "GhostAOE1.png", "GhostAOE2.png", "GhostAOE3.png", "GhostAOE4.png",
+    "GhostAOE6.png", "GhostAOE7.png", "GhostAOE8.png", "GhostAOE9.png",
+    "GohstAOE5.png",
+    "HolyAOE1.png", "HolyAOE2.png", "HolyAOE3.png",
+    "IceAOE1.png",
+    "LightAOE.png", "LightAOE2.png", "LightAOE3.png",
+    "MagicAOE1.png", "MagicAOE2.png",
+    "MetallAOE1.png",
+    "ParadoxAOE1.png",
+    "WaterAOE1.png", "WaterAOE2.png",
+    "WindAOE1.png", "WindAOE2.png"
+]
+_EFFECT_CACHE = {}
+_AOE_EFFECT_LIBRARY = None
+
+def load_effect(filename, size=EFFECT_SIZE):
+    """
+    Effektbild aus AOEEffekte, skaliert auf `size` (None = Originalgröße).
+    Schlüssel ist (Datei, Größe); fehlende oder defekte Dateien werden ebenfalls gemerkt (None).
+    """
+    key = (filename, size)
+    if key in _EFFECT_CACHE:
+        return _EFFECT_CACHE[key]
+    img = None
+    path = os.path.join(EFFECT_FOLDER, filename)
+    if asset_exists(path):
         try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, (int(GRID_SIZE * 3), int(GRID_SIZE * 3)))
-            print("DEBUG: Effektbild geladen für", effect_type, ":", img)
-            return img
+            img = decode_image(path)
+            if size:
+                img = pygame.transform.scale(img, size)
         except Exception as e:
             print(f"Fehler beim Laden von {filename}: {e}")
+            img = None
+    _EFFECT_CACHE[key] = img
+    return img
+
+def get_effect_by_type(effect_type):
+    filename = EFFECT_TYPE_FILES.get(effect_type)
+    if not filename:
+        return None
+    return load_effect(filename)
+
+def _aoe_effect_library():
+    global _AOE_EFFECT_LIBRARY
+    if _AOE_EFFECT_LIBRARY is None:
+        _AOE_EFFECT_LIBRARY = [img for img in map(load_effect, AOE_EFFECT_FILES) if img]
+        print("DEBUG: AoE-Effektbibliothek geladen:", len(_AOE_EFFECT_LIBRARY), "Bilder")
+    return _AOE_EFFECT_LIBRARY
+
+def get_aoe_effect():
+    """Zufälliges Effektbild aus AOE_EFFECT_FILES (geteilte Surface aus der Registry)."""
+    library = _aoe_effect_library()
+    if library:
+        return random.choice(library)
+    print("DEBUG: Kein Effektbild gefunden im Ordner", EFFECT_FOLDER)
     return None
 
+# --------------------------------------------------
+# Skalierungsleiter: vorskalierte Größen je Effektbild (Alpha bereits gesetzt),
+# damit Zonen beim Zeichnen nicht jeden Frame transform.scale aufrufen
+# --------------------------------------------------
+
+AOE_SCALE_STEPS = 16   # Größenstufen zwischen Start- und Endgröße wachsender Effekte
+SCALE_LADDER_SIZE = 64  # LRU-Grenze (große Zonen und der Vollbild-Effekt belegen einige MB)
+_SCALE_LADDER = OrderedDict()
+
+def quantise_size(size, start, end, steps=AOE_SCALE_STEPS):
+    """Größe auf eine von `steps` Stufen zwischen start und end runden (start == end -> unverändert)."""
+    if end == start:
+        return int(size)
+    t = round((size - start) / (end - start) * (steps - 1))
+    t = max(0, min(steps - 1, t))
+    return int(start + (end - start) * t / (steps - 1))
+
+def scaled_effect(image, size, alpha=255):
+    """
+    `image` auf `size` (Breite, Höhe) skaliert und mit `alpha`, aus der Skalierungsleiter.
+    Die Surface ist geteilt – nicht verändern.
+    """
+    key = (image, size, alpha)
+    surf = _SCALE_LADDER.get(key)
+    if surf is None:
+        surf = pygame.transform.scale(image, size)
+        surf.set_alpha(alpha)
+        _SCALE_LADDER[key] = surf
+        if len(_SCALE_LADDER) > SCALE_LADDER_SIZE:
+            _SCALE_LADDER.popitem(last=False)
+    else:
+        _SCALE_LADDER.move_to_end(key)
+    return surf
+
+def circle_overlay(color, radius):
+    """Halbtransparenter Kreis für Zonen ohne Effektbild (ebenfalls gecacht)."""
+    key = ("circle", tuple(color), radius)
+    surf = _SCALE_LADDER.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        _SCALE_LADDER[key] = surf
+        if len(_SCALE_LADDER) > SCALE_LADDER_SIZE:
+            _SCALE_LADDER.popitem(last=False)
+    else:
+        _SCALE_LADDER.move_to_end(key)
+    return surf
+
+def preload_effects():
+    """Alle Effekte vorab laden (z. B. beim Spielstart), damit AoE-Spawns nie die Platte anfassen."""
+    for filename in EFFECT_TYPE_FILES.values():
+        load_effect(filename)
+    _aoe_effect_library()
+
 # --------------------------------------------------
 # Basiszone
 # --------------------------------------------------
@@ -50,25 +160,27 @@ class AoEZone:
         self.duration = duration
         self.color = color
         self.effect_type = effect_type
-        self.created_time = time.time()
+        self.created_time = sim_time()
         self.alive = True
         self.image = None
         self.source = "neutral"
 
     def update(self):
-        if time.time() - self.created_time >= self.duration:
+        if sim_time() - self.created_time >= self.duration:
             self.alive = False
 
+    def draw_radius(self):
+        """Radius, mit dem gezeichnet wird (wachsende Zonen runden auf eine Stufe der Skalierungsleiter)."""
+        return self.radius
+
     def draw(self, surface):
-        diameter = self.radius * 2
+        radius = self.draw_radius()
         if self.image:
-            scaled_img = pygame.transform.scale(self.image, (diameter, diameter))
-            scaled_img.set_alpha(self.color[3] if len(self.color) == 4 else 255)
-            surface.blit(scaled_img, (self.pos.x - self.radius, self.pos.y - self.radius))
+            scaled_img = scaled_effect(self.image, (radius * 2, radius * 2),
+                                       self.color[3] if len(self.color) == 4 else 255)
+            surface.blit(scaled_img, (self.pos.x - radius, self.pos.y - radius))
         else:
-            overlay = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-            pygame.draw.circle(overlay, self.color, (self.radius, self.radius), self.radius)
-            surface.blit(overlay, (self.pos.x - self.radius, self.pos.y - self.radius))
+            surface.blit(circle_overlay(self.color, radius), (self.pos.x - radius, self.pos.y - radius))
 
     def draw_hitbox(self, screen):
         pygame.draw.circle(screen, (255, 255, 255), (int(self.pos.x), int(self.pos.y)), self.radius, 2)
@@ -137,8 +249,8 @@ class BackgroundEffectZone(AoEZone):
         self.image = image
 
     def draw(self, surface):
-        scaled_img = pygame.transform.scale(self.image, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        scaled_img.set_alpha(self.color[3] if len(self.color) == 4 else 255)
+        scaled_img = scaled_effect(self.image, (WINDOW_WIDTH, WINDOW_HEIGHT),
+                                   self.color[3] if len(self.color) == 4 else 255)
         surface.blit(scaled_img, (0, 0))
 # --------------------------------------------------
 # Boss-AOE (dynamisch wachsend, mit Quelle)
@@ -155,10 +267,14 @@ class GrowingBossAOEZone(AoEZone):
     def update(self):
         super().update()
         if self.alive:
-            elapsed = time.time() - self.created_time
+            elapsed = sim_time() - self.created_time
             progress = min(1.0, elapsed / self.duration)
             self.radius = int(self.base_radius + (self.max_radius - self.base_radius) * progress)
 
+    def draw_radius(self):
+        # Trefferradius wächst stufenlos, gezeichnet wird eine von AOE_SCALE_STEPS Stufen
+        return quantise_size(self.radius, self.base_radius, self.max_radius)
+
     def draw_hitbox(self, screen):
         if self.alive:
             pygame.draw.circle(screen, (255, 0, 0), (int(self.pos.x), int(self.pos.y)), self.radius, 2)
@@ -168,45 +284,3 @@ class GrowingBossAOEZone(AoEZone):
             return
         if hasattr(entity, "pos") and self.is_inside((entity.pos.x, entity.pos.y)):
             entity.health -= 0.8
-
-
-
-def get_aoe_effect():
-    effect_folder = os.path.join("assets", "graphics", "AOEEffekte")
-    effect_files = [
-        "AcidAOE1.png", "AcidAOE2.png", "AcidAOE3.png", "AcidAOE4.png",
-        "AcidBlop1.png", "AcidBlop2.png", "AcidBlop3.png", "AcidBlop4.png",
-        "DarkAOE1.png", "DarkAOE2.png", "DarkAOE3.png", "DarkAOE4.png",
-        "DarkBlob1.png", "DarkBlop2.png", "DarkBlop3.png",
-        "DungeonAOE.png", "DungeonAOE2.png", "DungeonAOE3.png", "DungeonAOE4.png",
-        "FigurAOE1.png", "FigurAOE2.png", "FigurAOE3.png",
-        "FireAOE1.png", "FireAOE2.png", "FireAOE3.png", "FireAOE4.png",
-        "Fire-FeuerHoch.png", "Fire-FireHoch2.png",
-        "GhostAOE1.png", "GhostAOE2.png", "GhostAOE3.png", "GhostAOE4.png",
-        "GhostAOE6.png", "GhostAOE7.png", "GhostAOE8.png", "GhostAOE9.png",
-        "GohstAOE5.png",
-        "HolyAOE1.png", "HolyAOE2.png", "HolyAOE3.png",
-        "IceAOE1.png",
-        "LightAOE.png", "LightAOE2.png", "LightAOE3.png",
-        "MagicAOE1.png", "MagicAOE2.png",
-        "MetallAOE1.png",
-        "ParadoxAOE1.png",
-        "WaterAOE1.png", "WaterAOE2.png",
-        "WindAOE1.png", "WindAOE2.png"
-    ]
-    available_effects = []
-    for fname in effect_files:
-        path = os.path.join(effect_folder, fname)
-        if os.path.exists(path):
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.scale(img, (int(GRID_SIZE * 3), int(GRID_SIZE * 3)))
-                available_effects.append(img)
-            except Exception as e:
-                print(f"Fehler beim Laden von {fname}: {e}")
-    if available_effects:
-        effect = random.choice(available_effects)
-        print("DEBUG: Effektbild geladen:", effect)
-        return effect
-    print("DEBUG: Kein Effektbild gefunden im Ordner", effect_folder)
-    return None
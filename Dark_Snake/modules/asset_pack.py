@@ -0,0 +1,136 @@
+"""
+Modul: asset_pack.py
+Zweck: Build-Schritt und Format für das gepackte Grafikarchiv. Alle PNGs unter assets/graphics
+       werden einmal dekodiert und als rohe RGBA-Pixelblöcke in eine einzige Datei geschrieben
+       (Namensindex als JSON im Kopf). modules.graphics mappt die Datei per mmap und baut
+       Surfaces direkt aus den Puffern – ohne PNG-Dekodierung und ohne hunderte Einzeldateien.
+
+Aufbau:  MAGIC (8 Byte) | Indexlänge (uint32, little endian) | Index (JSON, UTF-8) | Pixelblöcke
+         Index: {"files": {"relativer/pfad.png": [offset, breite, höhe], ...},
+                 "folders": {"ordner": [Anzahl PNGs, Ordner-mtime_ns,
+                                        CRC32 über Name/Größe/mtime/ctime je PNG], ...}}
+         Offsets absolut, 16-Byte-aligned. "folders" ist der Fingerabdruck der losen Dateien beim
+         Packen; weicht er beim Öffnen ab, wird das Archiv ignoriert (lose PNGs + Warnung).
+
+Aufruf (aus dem Ordner Dark_Snake, nach jeder Änderung an assets/graphics):
+    python -m modules.asset_pack
+"""
+
+import os
+import json
+import mmap
+import struct
+import zlib
+
+PACK_MAGIC = b"DSPACK2\0"
+PACK_ALIGN = 16
+GRAPHICS_ROOT = os.path.join("assets", "graphics")
+ASSET_PACK_PATH = os.path.join("assets", "graphics.pack")
+
+
+def pack_key(path, root=GRAPHICS_ROOT):
+    """Dateipfad -> Indexschlüssel relativ zu assets/graphics (mit "/"), None wenn außerhalb."""
+    rel = os.path.relpath(os.path.normpath(path), root)
+    if rel.startswith(".."):
+        return None
+    return rel.replace(os.sep, "/")
+
+
+def folder_fingerprint(root=GRAPHICS_ROOT):
+    """
+    Je Ordner (relativ zu `root`): [Anzahl PNGs, Ordner-mtime, CRC über alle PNGs] – billig, nur
+    stat(). Der CRC läuft über (Name, Größe, mtime, ctime) jeder Datei: Umbenennen, Hinzufügen,
+    Löschen und auch eine ersetzte Datei mit zurückgesetzter mtime (ctime ändert sich) fallen auf.
+    """
+    folders = {}
+    for folder, dirs, files in os.walk(root):
+        pngs = sorted(f for f in files if f.lower().endswith(".png"))
+        if pngs:
+            crc = 0
+            for fname in pngs:
+                st = os.stat(os.path.join(folder, fname))
+                entry = f"{fname}:{st.st_size}:{st.st_mtime_ns}:{st.st_ctime_ns}\n"
+                crc = zlib.crc32(entry.encode("utf-8"), crc)
+            folders[pack_key(folder, root)] = [len(pngs), os.stat(folder).st_mtime_ns, crc]
+    return folders
+
+
+def build_pack(root=GRAPHICS_ROOT, out=ASSET_PACK_PATH):
+    """Alle PNGs unter `root` dekodieren und nach `out` packen. Liefert (Anzahl, Bytes)."""
+    import pygame  # nur für den Build-Schritt nötig
+
+    folders = folder_fingerprint(root)
+    blocks = []
+    for folder, dirs, files in os.walk(root):
+        dirs.sort()
+        for fname in sorted(files):
+            if not fname.lower().endswith(".png"):
+                continue
+            path = os.path.join(folder, fname)
+            try:
+                img = pygame.image.load(path)
+            except Exception as e:
+                print(f"[Fehler] Grafik nicht gepackt: {path} ({e})")
+                continue
+            blocks.append((pack_key(path, root), img.get_size(), pygame.image.tobytes(img, "RGBA")))
+
+    # Index zweimal bauen: die Offsets hängen von der Länge des Index selbst ab
+    index, header_len = {}, 0
+    for _ in range(2):
+        offset = _align(len(PACK_MAGIC) + 4 + header_len)
+        index = {}
+        for key, (w, h), pixels in blocks:
+            index[key] = [offset, w, h]
+            offset = _align(offset + len(pixels))
+        header_len = len(json.dumps({"files": index, "folders": folders}, separators=(",", ":")).encode("utf-8"))
+    header = json.dumps({"files": index, "folders": folders}, separators=(",", ":")).encode("utf-8")
+
+    tmp = out + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for key, _, pixels in blocks:
+            f.write(b"\0" * (index[key][0] - f.tell()))
+            f.write(pixels)
+        size = f.tell()
+    os.replace(tmp, out)
+    return len(blocks), size
+
+
+def open_pack(path=ASSET_PACK_PATH, root=GRAPHICS_ROOT):
+    """
+    Archiv per mmap öffnen. Liefert (mmap, index) oder None, wenn es kein (aktuelles) Archiv gibt –
+    neue, gelöschte oder geänderte PNGs unter `root` machen das Archiv veraltet.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+    if data[:len(PACK_MAGIC)] != PACK_MAGIC:
+        print(f"[Fehler] {path} ist kein Dark-Snake-Grafikarchiv (oder altes Format) – lade einzelne PNGs.")
+        data.close()
+        return None
+    (header_len,) = struct.unpack_from("<I", data, len(PACK_MAGIC))
+    start = len(PACK_MAGIC) + 4
+    header = json.loads(bytes(data[start:start + header_len]).decode("utf-8"))
+    if os.path.isdir(root):
+        current = folder_fingerprint(root)
+        stale = sorted(k for k in set(current) | set(header["folders"])
+                       if current.get(k) != header["folders"].get(k))
+        if stale:
+            print(f"[WARN] {path} ist veraltet (geändert: {', '.join(stale)}) – lade einzelne PNGs. "
+                  "Neu bauen mit: python -m modules.asset_pack")
+            data.close()
+            return None
+    return data, header["files"]
+
+
+def _align(offset):
+    return (offset + PACK_ALIGN - 1) // PACK_ALIGN * PACK_ALIGN
+
+
+if __name__ == "__main__":
+    count, size = build_pack()
+    print(f"{count} Grafiken nach {ASSET_PACK_PATH} gepackt ({size / 1e6:.1f} MB)")
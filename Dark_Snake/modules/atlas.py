@@ -0,0 +1,94 @@
+"""
+Modul: atlas.py
+Zweck: Laufzeit-Texturatlas für kleine, oft gezeichnete Sprites (Tiles, Item-Icons, Gegner).
+       Sprites werden beim ersten Zeichnen per Shelf-Packing in wenige große Seiten kopiert;
+       gezeichnet wird dann gesammelt über SpriteBatch -> Surface.blits mit Teilbereichen,
+       statt hunderter einzelner blit()-Aufrufe aus Python.
+"""
+
+import pygame
+from modules.graphics import get_tile, ITEM_IMAGES
+
+ATLAS_PAGE_SIZE = 1024
+ATLAS_PADDING = 1  # Abstand zwischen Sprites, damit skalierte Nachbarn nicht ineinander laufen
+
+
+class TextureAtlas:
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.entries = {}
+        self._x = self._y = self._shelf_h = 0
+
+    def get(self, key, loader):
+        """
+        (Seite, Bereich) für `key`. Beim ersten Zugriff liefert `loader()` die Surface, die in
+        den Atlas kopiert wird; None (kein Bild) wird ebenfalls gemerkt.
+        """
+        if key in self.entries:
+            return self.entries[key]
+        surface = loader()
+        entry = self.entries[key] = self._place(surface) if surface else None
+        return entry
+
+    def _place(self, surface):
+        w, h = surface.get_size()
+        pad = self.padding
+        if w + pad > self.page_size or h + pad > self.page_size:
+            # Zu groß für eine Seite: unverändert als eigene Quelle verwenden
+            return surface, surface.get_rect()
+        if not self.pages or self._x + w + pad > self.page_size:
+            # neue Zeile (Shelf) beginnen
+            self._x = 0
+            self._y += self._shelf_h
+            self._shelf_h = 0
+        if not self.pages or self._y + h + pad > self.page_size:
+            self._new_page()
+        page = self.pages[-1]
+        area = pygame.Rect(self._x, self._y, w, h)
+        # BLEND_RGBA_MAX auf leerer Seite = exakte Kopie inkl. Alpha (normales Blit würde mischen)
+        page.blit(surface, area.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        self._x += w + pad
+        self._shelf_h = max(self._shelf_h, h + pad)
+        return page, area
+
+    def _new_page(self):
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface():
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._x = self._y = self._shelf_h = 0
+
+
+class SpriteBatch:
+    """Sammelt (Quelle, Ziel, Bereich)-Blits in Zeichenreihenfolge und gibt sie mit einem blits() aus."""
+    def __init__(self, target):
+        self.target = target
+        self.items = []
+
+    def add(self, source, dest, area=None):
+        self.items.append((source, dest, area) if area else (source, dest))
+
+    def add_sprite(self, entry, dest):
+        page, area = entry
+        self.items.append((page, dest, area))
+
+    def flush(self):
+        """Gesammelte Blits ausgeben – auch vor direktem Zeichnen (Fallback-Formen), damit die Reihenfolge stimmt."""
+        if self.items:
+            self.target.blits(self.items, doreturn=False)
+            self.items.clear()
+
+
+# [KS_TAG: SPRITE_ATLAS] – gemeinsamer Atlas für Tiles, Items und Gegner
+SPRITE_ATLAS = TextureAtlas()
+
+
+def atlas_tile(name):
+    return SPRITE_ATLAS.get(("tile", name), lambda: get_tile(name))
+
+
+def atlas_item(key):
+    return SPRITE_ATLAS.get(("item", key), lambda: ITEM_IMAGES.get(key))
@@ -15,14 +15,15 @@ Benötigte Assets:
 assets/graphics/bolbugeg1/1bolbugeg.png … 6bolbugeg.png  
 assets/graphics/projectiles/bolbu_projectile.png
 """.format(datetime.date.today(), 2.5)
-import pygame, random, time, math, datetime
+import pygame, random, math, datetime
 
 from pygame.math import Vector2
 
 from config import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, PROJECTILE_SPEED_FACTOR
 from modules.enemies import NormalEnemy
-from modules.graphics import load_image
+from modules.graphics import BOLBU_FRAME_NAMES, get_enemy_frames, get_projectile_sprite
 from modules.audio import SOUNDS
+from modules.sim_clock import sim_time
 
 class BolbuProjectile:
     """Eigenes Projektil für BolbuEnemy."""
@@ -32,13 +33,14 @@ class BolbuProjectile:
         self.speed = PROJECTILE_SPEED_FACTOR * speed_mul
         self.damage = damage
         self.lifetime = lifetime
-        self.image = load_image("bolbu_projectile.png", "projectiles")
         size = int(GRID_SIZE * 1.2)
+        # Skalierte Grafik wird von allen Bolbu-Projektilen geteilt
+        self.image = get_projectile_sprite("bolbu_projectile.png", "projectiles", size=(size, size))
         if self.image:
-            self.image = pygame.transform.scale(self.image, (size, size))
             self.rect = self.image.get_rect()
         else:
             self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.topleft = (self.pos.x * GRID_SIZE, self.pos.y * GRID_SIZE)
 
     def update(self):
         self.pos.x += self.direction.x * self.speed
@@ -60,15 +62,16 @@ class BolbuEnemy(NormalEnemy):
 
     def __init__(self):
         super().__init__()
-        self.frames = [load_image(f"bolbugeg1/{i}bolbugeg.png") for i in range(1,7)]
+        # Frames aus der Registry, einmal skaliert und von allen Bolbus geteilt
+        self.frames = get_enemy_frames(BOLBU_FRAME_NAMES, (GRID_SIZE, GRID_SIZE))
         self.anim_index = 0
         if self.frames[0]:
-            self.frames = [pygame.transform.scale(f, (GRID_SIZE, GRID_SIZE)) for f in self.frames]
             self.image = self.frames[0]
-        self.anim_timer = time.time()
-        self.projectiles = []
-        self.last_shot = time.time()
-        self.last_dice = time.time()
+            self.atlas_key = ("bolbu", 0)
+        self.anim_timer = sim_time()
+        self.projectiles = []  # neu abgefeuert; das Spiel übernimmt sie nach jedem update()
+        self.last_shot = sim_time()
+        self.last_dice = sim_time()
 
     # ------------------------------------------------------------
     # KI  – Bewegungs‑Update + Angriffs‑/Würfel‑Mechanik
@@ -76,12 +79,13 @@ class BolbuEnemy(NormalEnemy):
     def update(self, player_x=None, player_y=None):
         super().update(player_x, player_y)
 
-        now = time.time()
+        now = sim_time()
 
         # kleine Animation
         if now - self.anim_timer >= 0.15:
             self.anim_index = (self.anim_index + 1) % len(self.frames)
             self.image = self.frames[self.anim_index]
+            self.atlas_key = ("bolbu", self.anim_index)
             self.anim_timer = now
 
         # Projektil‑Beschuss
@@ -94,9 +98,6 @@ class BolbuEnemy(NormalEnemy):
             self.roll_dice(player_x, player_y)
             self.last_dice = now
 
-        # Update eigene Projektile
-        self.projectiles = [p for p in self.projectiles if p.update()]
-
     # ------------------------------------------------------------
     # Attacken
     # ------------------------------------------------------------
@@ -117,7 +118,7 @@ class BolbuEnemy(NormalEnemy):
         if roll == 6:
             # Geschwindigkeits‑Sprint
             self.sprint_active = True
-            self.sprint_end_time = time.time() + 0.7
+            self.sprint_end_time = sim_time() + 0.7
         elif roll in (4,5):
             # Dreifachschuss in Fächerform
             for offset in (-0.25, 0, 0.25):
@@ -126,14 +127,6 @@ class BolbuEnemy(NormalEnemy):
             # Einfachem Schuss
             self.shoot_projectile(target_x, target_y)
 
-    # ------------------------------------------------------------
-    # Rendering
-    # ------------------------------------------------------------
-    def draw(self, surface):
-        super().draw(surface)
-        for p in self.projectiles:
-            p.draw(surface)
-
     # ------------------------------------------------------------
     # Zugriff für Game‑Loop (Collision)
     # ------------------------------------------------------------
@@ -3,8 +3,21 @@
 # Enthält alle Boss-Projektilklassen für Dark Snake
 
 import pygame
-from modules.graphics import load_image
-from math import atan2, degrees
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from modules.graphics import get_projectile_sprite
+
+# Spielfeld = Fenstergröße; nicht über pygame.display, damit es auch headless ohne Fenster gilt
+SCREEN_RECT = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+
+_SPAWN_FLASH = None  # Glow beim Spawnen – einmal gebaut, von allen BossFlameProjectiles geteilt
+
+
+def get_spawn_flash():
+    global _SPAWN_FLASH
+    if _SPAWN_FLASH is None:
+        _SPAWN_FLASH = pygame.Surface((90, 90), pygame.SRCALPHA)
+        pygame.draw.circle(_SPAWN_FLASH, (255, 120, 0, 100), (45, 45), 40)
+    return _SPAWN_FLASH
 
 class BossProjectile:
     """
@@ -17,9 +30,8 @@ class BossProjectile:
         self.lifetime = lifetime
         self.from_boss = True
 
-        self.image_orig = load_image(image_name)
-        angle = degrees(atan2(-self.direction[1], self.direction[0]))
-        self.image = pygame.transform.rotate(self.image_orig, angle)
+        self.image_orig = get_projectile_sprite(image_name)
+        self.image = get_projectile_sprite(image_name, direction=self.direction)
         self.rect = self.image.get_rect(center=(x, y))
 
     def update(self):
@@ -29,8 +41,7 @@ class BossProjectile:
         return self.lifetime > 0 and self.is_on_screen()
 
     def is_on_screen(self):
-        screen_rect = pygame.Rect(0, 0, pygame.display.get_surface().get_width(), pygame.display.get_surface().get_height())
-        return self.rect.colliderect(screen_rect)
+        return self.rect.colliderect(SCREEN_RECT)
 
     def draw(self, screen):
         screen.blit(self.image, self.rect)
@@ -52,9 +63,8 @@ class BossFlameProjectile:
         self.from_boss = True
 
         # Bild laden und ausrichten
-        self.image_orig = load_image(image_name)
-        angle = degrees(atan2(-direction[1], direction[0]))
-        self.image = pygame.transform.rotate(self.image_orig, angle)
+        self.image_orig = get_projectile_sprite(image_name)
+        self.image = get_projectile_sprite(image_name, direction=direction)
         self.rect = self.image.get_rect(center=(x, y))
 
         # DEBUG
@@ -62,8 +72,7 @@ class BossFlameProjectile:
 
         # Spezialeffekt beim Spawnen (z. B. Glow)
         self.spawn_effect_done = False
-        self.spawn_flash_surface = pygame.Surface((90, 90), pygame.SRCALPHA)
-        pygame.draw.circle(self.spawn_flash_surface, (255, 120, 0, 100), (45, 45), 40)
+        self.spawn_flash_surface = get_spawn_flash()
 
     def update(self):
         self.rect.x += self.speed * self.direction[0]
@@ -72,8 +81,7 @@ class BossFlameProjectile:
         return self.lifetime > 0 and self.is_on_screen()
 
     def is_on_screen(self):
-        screen_rect = pygame.Rect(0, 0, pygame.display.get_surface().get_width(), pygame.display.get_surface().get_height())
-        return self.rect.colliderect(screen_rect)
+        return self.rect.colliderect(SCREEN_RECT)
 
     def draw(self, screen):
         screen.blit(self.image, self.rect)
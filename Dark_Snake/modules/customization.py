@@ -2,17 +2,19 @@ import pygame
 import os
 from config import WINDOW_WIDTH, WINDOW_HEIGHT, FONT_MEDIUM, DARK_GREY, WHITE, PURPLE, GRID_SIZE
 from modules.ui import Button
-from modules.graphics import SNAKE_HEAD_IMG, SNAKE_HEAD1G20, SNAKE_HEAD2G20, SNAKE_HEAD3G20, scale_to_thumbnail
+from modules.graphics import get_image, scale_to_thumbnail
+
+HEAD_IMAGE_NAMES = ["SNAKE_HEAD_IMG", "SNAKE_HEAD1G20", "SNAKE_HEAD2G20", "SNAKE_HEAD3G20"]
 
 class CustomizationMenu:
     def __init__(self, game):
         self.game = game
         # Kopfoptionen (wie bisher, hier werden Thumbnails erzeugt)
         self.head_options = [
-            ("Standard", scale_to_thumbnail(SNAKE_HEAD_IMG, 0.75)),
-            ("Option 1", scale_to_thumbnail(SNAKE_HEAD1G20, 0.75)),
-            ("Option 2", scale_to_thumbnail(SNAKE_HEAD2G20, 0.75)),
-            ("Option 3", scale_to_thumbnail(SNAKE_HEAD3G20, 0.75))
+            ("Standard", scale_to_thumbnail(get_image("SNAKE_HEAD_IMG"), 0.75)),
+            ("Option 1", scale_to_thumbnail(get_image("SNAKE_HEAD1G20"), 0.75)),
+            ("Option 2", scale_to_thumbnail(get_image("SNAKE_HEAD2G20"), 0.75)),
+            ("Option 3", scale_to_thumbnail(get_image("SNAKE_HEAD3G20"), 0.75))
         ]
         # Lade die Körperoptionen aus dem vorbereiteten Ordner
         self.body_options = self.load_body_options()
@@ -77,8 +79,7 @@ class CustomizationMenu:
 
     def select_head(self, index):
         self.selected_head_index = index
-        original_heads = [SNAKE_HEAD_IMG, SNAKE_HEAD1G20, SNAKE_HEAD2G20, SNAKE_HEAD3G20]
-        self.game.settings['custom_head'] = original_heads[index]
+        self.game.settings['custom_head'] = get_image(HEAD_IMAGE_NAMES[index])
         print(f"Schlangenkopf ausgewählt: Option {index}")
 
     def select_body(self, index):
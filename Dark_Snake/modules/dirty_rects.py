@@ -0,0 +1,158 @@
+"""
+Modul: dirty_rects.py
+Zweck: Dirty-Rect-Renderer für die Spielansicht. Gezeichnet wird in einen Rückpuffer, der sich
+       jeden blit()/blits()-Aufruf (Quelle + Zielrechteck) merkt. Im nächsten Frame wird nur
+       unter diesen Rechtecken der Hintergrund wiederhergestellt, und an pygame.display.update
+       gehen nur Bereiche, deren Inhalt sich geändert hat: neue/verschwundene Blits (Kopf- und
+       Schwanzzelle der Snake, bewegte Gegner, Projektile ...) sowie die HUD-Panels, deren
+       Werte sich geändert haben. Unveränderte Körpersegmente oder Items landen nicht im Update.
+
+Grenzen: pygame.draw.* läuft an der Aufzeichnung vorbei – solche Bereiche gibt der Aufrufer
+         über `extra` in present() an.
+"""
+
+import pygame
+from modules.ui import render_text
+
+# Ab diesem Flächenanteil ist ein komplettes Update günstiger als viele kleine Rechtecke
+FULL_UPDATE_RATIO = 0.5
+DIRTY_OVERLAY_COLOR = (0, 255, 255)
+
+
+class RecordingSurface(pygame.Surface):
+    """Rückpuffer, der sich zu jedem blit/blits/fill (Quelle, Ziel, Bereich) merkt."""
+    def __init__(self, size, like):
+        super().__init__(size, 0, like)
+        self.records = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = super().blit(source, dest, area, special_flags)
+        self.records.append((source, tuple(rect), tuple(area) if area else None, special_flags))
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        seq = list(blit_sequence)
+        rects = super().blits(seq, doreturn=True)
+        self.records.extend((item[0], tuple(rect), tuple(item[2]) if len(item) > 2 and item[2] else None,
+                             item[3] if len(item) > 3 else 0)
+                            for item, rect in zip(seq, rects))
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = super().fill(color, rect, special_flags)
+        self.records.append((tuple(color) if not isinstance(color, int) else color,
+                             tuple(rect), None, special_flags))
+        return rect
+
+
+class DirtyRectRenderer:
+    """
+    Ablauf pro Frame:  frame = begin(background) -> Welt zeichnen -> begin_hud() -> HUD zeichnen
+                       -> present(hud_changed, extra, hud_signature)
+    invalidate() erzwingt einen kompletten Frame (Zustandswechsel, Hintergrund geändert ...).
+    """
+    def __init__(self):
+        self.frame = None
+        self.background = None
+        self._restore = None        # deckende Kopie des Hintergrunds zum Wiederherstellen
+        self._world = set()         # Blits der Welt im letzten Frame
+        self._pending_world = []
+        self._painted = []          # alle im letzten Frame bemalten Rechtecke (werden wiederhergestellt)
+        self._extra = []            # unaufgezeichnete Welt-Bereiche des letzten Frames
+        self._hud = []
+        self._hud_signature = None
+        self._overlay_rects = []    # Debug-Rahmen des letzten Frames, müssen übermalt werden
+        self.full = True
+        self.show_overlay = False
+        self.last_update_ratio = 1.0
+
+    def invalidate(self):
+        self.full = True
+
+    def begin(self, background):
+        """Rückpuffer für einen neuen Frame vorbereiten; der Aufrufer zeichnet die Welt hinein."""
+        screen = pygame.display.get_surface()
+        if self.frame is None or self.frame.get_size() != screen.get_size():
+            self.frame = RecordingSurface(screen.get_size(), screen)
+            self.full = True
+        if background is not self.background:
+            self.full = True
+        if self.full:
+            self.background = background
+            # Editor-Karten haben Alpha – wiederhergestellt wird aus einer deckenden Kopie
+            self._restore = pygame.Surface(screen.get_size(), 0, screen)
+            self._restore.fill((0, 0, 0))
+            self._restore.blit(background, (0, 0))
+            pygame.Surface.blit(self.frame, self._restore, (0, 0))
+        else:
+            pygame.Surface.blits(self.frame, [(self._restore, r, r) for r in self._painted], doreturn=False)
+        self.frame.records = []
+        return self.frame
+
+    def begin_hud(self):
+        """Ab hier Gezeichnetes gehört zum HUD; aktualisiert werden nur die gemeldeten Änderungen."""
+        self._pending_world = self.frame.records
+        self.frame.records = []
+
+    def present(self, hud_changed=None, extra=(), hud_signature=None):
+        """
+        Rückpuffer ins Fenster übertragen und pygame.display.update mit den geänderten Bereichen aufrufen.
+        hud_changed: geänderte HUD-Bereiche (None = ganzes HUD). hud_signature: Werte der übrigen
+        HUD-Texte – ändert sie sich, wird ebenfalls das ganze HUD aktualisiert.
+        """
+        screen = pygame.display.get_surface()
+        world_records = self._pending_world
+        hud_records = self.frame.records
+        extra = [pygame.Rect(r) for r in extra]
+        hud = [pygame.Rect(r[1]) for r in hud_records]
+
+        world = set(world_records)
+        if self.full:
+            rects = None
+        else:
+            # Nur was in genau einem der beiden Frames gezeichnet wurde, hat sich geändert
+            rects = [pygame.Rect(r[1]) for r in world.symmetric_difference(self._world)]
+            rects += self._extra + extra + self._overlay_rects
+            if hud_changed is None or hud_signature != self._hud_signature:
+                rects += self._hud + hud
+            else:
+                rects += hud_changed
+            rects = [r for r in rects if r.width and r.height]
+            area = sum(r.width * r.height for r in rects)
+            self.last_update_ratio = area / float(screen.get_width() * screen.get_height())
+            if self.last_update_ratio > FULL_UPDATE_RATIO:
+                rects = None
+        if rects is None:
+            self.last_update_ratio = 1.0
+
+        # Stand für den nächsten Frame merken (Quellen bleiben referenziert -> ids eindeutig)
+        self._world = world
+        self._extra = extra
+        self._hud = hud
+        self._hud_signature = hud_signature
+        self._painted = [pygame.Rect(r[1]) for r in world_records] + extra + hud
+        self.full = False
+
+        if rects is None:
+            screen.blit(self.frame, (0, 0))
+        else:
+            screen.blits([(self.frame, r, r) for r in rects], doreturn=False)
+        self._overlay_rects = self.draw_overlay(screen, rects) if self.show_overlay else []
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+
+    def draw_overlay(self, screen, rects):
+        """Debug: Dirty-Rects umrahmen; liefert die bemalten Bereiche (im nächsten Frame zu übermalen)."""
+        painted = []
+        if rects is None:
+            painted.append(pygame.draw.rect(screen, DIRTY_OVERLAY_COLOR, screen.get_rect(), 2))
+            count = "voll"
+        else:
+            for r in rects:
+                painted.append(pygame.draw.rect(screen, DIRTY_OVERLAY_COLOR, r, 1))
+            count = len(rects)
+        txt = render_text(f"Dirty: {count} ({self.last_update_ratio * 100:.1f} %)", DIRTY_OVERLAY_COLOR, 16, bold=True)
+        painted.append(screen.blit(txt, (screen.get_width() - txt.get_width() - 10, screen.get_height() - 26)))
+        return painted
@@ -1,33 +1,37 @@
 import pygame
 import random
-import time
+from modules.sim_clock import sim_time
 from config import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, RED
-from modules.graphics import ENEMY_TIM_IMG, ENEMY_SPOONG_IMG, ENEMY_OMNI_IMG, ENEMY_GLUBS_IMG
+from modules.graphics import get_enemy_sprite
+from modules.atlas import SPRITE_ATLAS
+
+ENEMY_IMAGE_NAMES = ["ENEMY_TIM_IMG", "ENEMY_SPOONG_IMG", "ENEMY_OMNI_IMG", "ENEMY_GLUBS_IMG"]
 
 class NormalEnemy:
     def __init__(self):
         self.x = random.randint(0, GRID_WIDTH - 1)
         self.y = random.randint(0, GRID_HEIGHT - 1)
-        self.spawn_time = time.time()
+        self.spawn_time = sim_time()
         self.speed = random.uniform(0.5, 1.5)
         self.health = random.randint(1, 3)
-        self.last_move = time.time()
+        self.last_move = sim_time()
         self.sprint_chance = 0.05
         self.sprint_speed_multiplier = 3
         self.sprint_duration = 0.5
         self.sprint_active = False
         self.sprint_end_time = 0
 
-        self.image = random.choice([ENEMY_TIM_IMG, ENEMY_SPOONG_IMG, ENEMY_OMNI_IMG, ENEMY_GLUBS_IMG])
+        image_name = random.choice(ENEMY_IMAGE_NAMES)
+        size = random.choice([GRID_SIZE, int(GRID_SIZE * 1.5)])
+        self.image = get_enemy_sprite(image_name, (size, size))
         if self.image:
-            size = random.choice([GRID_SIZE, int(GRID_SIZE * 1.5)])
-            self.image = pygame.transform.scale(self.image, (size, size))
+            self.atlas_key = ("enemy", image_name, size)
             self.width, self.height = self.image.get_size()
         else:
             self.width = self.height = GRID_SIZE
 
     def update(self, player_x=None, player_y=None):
-        current_time = time.time()
+        current_time = sim_time()
         if not self.sprint_active and random.random() < self.sprint_chance:
             self.sprint_active = True
             self.sprint_end_time = current_time + self.sprint_duration
@@ -58,5 +62,14 @@ class NormalEnemy:
         else:
             pygame.draw.rect(screen, RED, (self.x * GRID_SIZE, self.y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
 
+    def add_to_batch(self, batch):
+        """Wie draw(), aber über den Sprite-Atlas in einen SpriteBatch."""
+        if self.image:
+            image = self.image
+            batch.add_sprite(SPRITE_ATLAS.get(self.atlas_key, lambda: image), (self.x * GRID_SIZE, self.y * GRID_SIZE))
+        else:
+            batch.flush()
+            NormalEnemy.draw(self, batch.target)
+
     def get_rect(self):
         return pygame.Rect(self.x * GRID_SIZE, self.y * GRID_SIZE, self.width, self.height)
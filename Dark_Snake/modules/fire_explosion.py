@@ -1,31 +1,60 @@
 # modules/fire_explosion.py
 import pygame
-import os
+from modules.graphics import decode_image, asset_exists
 
 # Globale Konstante für die Anzahl der Frames
 EXPLOSION_FRAMES = 9
 
-class FireExplosionAnimation:
-    def __init__(self, center_pos, scale_factor=3):
-        self.frames = []
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_delay = 4  # niedrigere Werte = schnellere Animation
+# [KS_TAG: EXPLOSION_FRAME_CACHE] – Frames einmal pro Skalierung laden, von allen Explosionen geteilt
+_EXPLOSION_FRAME_CACHE = {}
+# Abgelaufene Explosionen zur Wiederverwendung (Bolbu-Dreifachschuss u. ä. ohne neue Objekte)
+_EXPLOSION_POOL = []
 
-        # Bilder laden
+def get_explosion_frames(scale_factor=3):
+    frames = _EXPLOSION_FRAME_CACHE.get(scale_factor)
+    if frames is None:
+        frames = []
         for i in range(1, EXPLOSION_FRAMES + 1):
             filename = f"assets/graphics/FlameExplosion/FireExplosionDetail_Centered_{i}.png"
-            if os.path.exists(filename):
+            if asset_exists(filename):
                 try:
-                    img = pygame.image.load(filename).convert_alpha()
+                    img = decode_image(filename)
                     size = img.get_width() * scale_factor
                     img = pygame.transform.scale(img, (size, size))
-                    self.frames.append(img)
+                    frames.append(img)
                 except Exception as e:
                     print(f"[Fehler] Explosion-Bild konnte nicht geladen werden: {filename} ({e})")
             else:
                 print(f"[Fehler] Grafik nicht gefunden: {filename}")
+        _EXPLOSION_FRAME_CACHE[scale_factor] = frames
+    return frames
+
+def spawn_explosion(center_pos, scale_factor=3):
+    """Explosion aus dem Pool holen (oder neu anlegen) und auf Frame 0 setzen."""
+    if _EXPLOSION_POOL:
+        explosion = _EXPLOSION_POOL.pop()
+        explosion.reset(center_pos, scale_factor)
+        return explosion
+    return FireExplosionAnimation(center_pos, scale_factor)
+
+def preload_explosions(scale_factor=3, pool_size=8):
+    """Frames laden und den Pool vorfüllen (z. B. beim Spielstart)."""
+    get_explosion_frames(scale_factor)
+    while len(_EXPLOSION_POOL) < pool_size:
+        explosion = FireExplosionAnimation((0, 0), scale_factor)
+        explosion.finished = True
+        _EXPLOSION_POOL.append(explosion)
 
+class FireExplosionAnimation:
+    def __init__(self, center_pos, scale_factor=3):
+        self.frame_delay = 4  # niedrigere Werte = schnellere Animation
+        self.reset(center_pos, scale_factor)
+
+    def reset(self, center_pos, scale_factor=3):
+        # Nur Frame-Index und Position sind pro Explosion; die Frames selbst sind geteilt
+        self.frames = get_explosion_frames(scale_factor)
+        self.frame_index = 0
+        self.frame_timer = 0
         self.position = center_pos
         self.finished = False
 
@@ -38,6 +67,8 @@ class FireExplosionAnimation:
             self.frame_timer = 0
             if self.frame_index >= len(self.frames):
                 self.finished = True
+                # Der Aufrufer verwirft die Explosion bei False – ab hier ist sie wieder frei
+                _EXPLOSION_POOL.append(self)
                 return False
         return True
 
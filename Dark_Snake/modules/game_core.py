@@ -0,0 +1,1311 @@
+"""
+Modul: game_core.py
+Zweck: Anzeige-freier Simulationskern von Dark-Snake. GameCore enthält Spielzustand und
+       Regeln (Bewegung, Kollisionen, Items, Gegner, Boss, AoE, Projektile) und wird über
+       `step()` getaktet, ohne dass ein Fenster oder eine Zeichenfläche nötig ist.
+       Game (modules/game.py) erbt davon und ergänzt Fenster, Menüs, Eingabe und Zeichnen.
+
+Headless-Betrieb (z. B. Soak-Tests, Balancing, Bots auf CI ohne GPU):
+    SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python -c "from modules.game_core import simulate; print(simulate().score)"
+Hinweis: pygame wird weiterhin für Rect/Vector2 und das Laden der Sprites gebraucht,
+         der Dummy-Treiber genügt dafür.
+"""
+
+import pygame, random
+from math import sqrt, atan2, cos, sin
+from pygame.math import Vector2
+
+from modules.enums import GameState, Direction, ItemType
+from config import (WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT,
+                    GREEN, WHITE, RED, PURPLE, ORANGE,
+                    START_SPEED, MAX_SPEED, PROJECTILE_SPEED_FACTOR, AUTO_SHOOT_INTERVAL)
+from modules.graphics import (PORTAL_IMAGES, ITEM_IMAGES,
+                              BOSS_FILES, BOSS_ANIMATIONS, get_boss_frames, get_boss_image,
+                              get_projectile_sprite, SpriteHandle)
+from modules.audio import SOUNDS
+from modules.aoe_zones import GrowingBossAOEZone, get_aoe_effect, quantise_size, scaled_effect  # [KS_TAG: BOSS_AOE]
+from modules.enemies import NormalEnemy
+from modules.snake_body import OccupancyGrid, SnakeBody
+from modules.spatial_hash import SpatialHash
+from modules.atlas import atlas_item
+from modules.sim_clock import SIM_CLOCK, sim_time
+
+
+# [KS_TAG: PROJECTILE_SPRITE_HANDLES] Dict-Projektile bekommen beim Spawn einen Sprite-Handle in
+# der fertigen Zeichengröße – draw_game blittet nur noch, ohne transform.scale pro Projektil
+PLAYER_PROJECTILE_SPRITE = SpriteHandle("Projektil.png", (int(GRID_SIZE * 1.5), int(GRID_SIZE * 1.5)))
+# Boss-Projektil-Grafiken (zufällige Auswahl)
+BOSS_PROJECTILE_SPRITES = [SpriteHandle(name, (GRID_SIZE * 2, GRID_SIZE * 2))
+                           for name in ("Projektil2.png", "Projektil3.png", "Projektil4.png", "Projektil5.png")]
+
+def get_random_projectile_color():
+    return (random.randint(0,255), random.randint(0,255), random.randint(0,255))
+
+# [KS_TAG: ITEM_RULES] – Item-Regeln als Tabellen; GameCore.handle_item_pickup und
+# modules/vec_env.py (Bot-Training) lesen beide hieraus.
+# Punkte und Erfahrung pro Item (Würfel und SPAWN_BOLBU haben eigene Regeln)
+ITEM_REWARDS = {
+    ItemType.FOOD: (10, 10),
+    ItemType.SPEED_BOOST: (15, 15),
+    ItemType.SPEED_REDUCTION: (15, 15),
+    ItemType.SCORE_BOOST: (50, 20),
+    ItemType.INVINCIBILITY: (25, 25),
+    ItemType.LOOT_BOX: (20, 20),
+    ItemType.LENGTH_SHORTENER: (30, 15),
+    ItemType.LENGTH_DOUBLE: (30, 15),
+    ItemType.PROJECTILE_SHOOT: (40, 20),
+}
+# Zeitlich begrenzte Effekte: Item → (Schlüssel in GameCore.effects, Dauer in Sekunden)
+ITEM_EFFECTS = {
+    ItemType.SPEED_BOOST: ('speed_boost', 5),
+    ItemType.SPEED_REDUCTION: ('speed_reduction', 5),
+    ItemType.INVINCIBILITY: ('invincibility', 10),
+    ItemType.LENGTH_SHORTENER: ('length_shortener', 8),
+    ItemType.LENGTH_DOUBLE: ('length_double', 8),
+}
+# Gleichmäßiger Item-Spawn – Mehrfacheinträge = höhere Chance (jedes Item ≈ 9 %, 11 Einträge)
+SPAWN_ITEM_TYPES = [
+    ItemType.FOOD,
+    ItemType.SPEED_BOOST,
+    ItemType.SPEED_REDUCTION,
+    ItemType.SCORE_BOOST,
+    ItemType.INVINCIBILITY,
+    ItemType.LENGTH_SHORTENER,
+    ItemType.LENGTH_DOUBLE,
+    ItemType.LOOT_BOX,
+    ItemType.SPAWN_BOLBU,      #  → unsere Bolbu-Kapsel
+    ItemType.DICE_EVENT,
+    ItemType.SPECIAL_DAMAGE,
+]
+# Mögliche Inhalte einer Lootbox (alle Items außer SPAWN_BOLBU)
+LOOT_ITEM_TYPES = list(ItemType)[:-1]
+BOLBU_SPAWN_RANGE = (1, 3)
+BOLBU_SPAWN_SCORE = 25
+ITEM_SPAWN_CHANCE = 0.005  # pro Schlangenschritt, mal settings['difficulty'], solange < MAX_ITEMS
+MAX_ITEMS = 5
+
+
+def dice_outcome(roll):
+    """Würfelwurf (W20) → (Meldung, Punkte, Erfahrung); Erfahrung None = bis zum Level-Up auffüllen."""
+    if roll == 1:
+        return "Kritischer Fehlschlag!", 1, 0
+    if roll == 20:
+        return "Kritischer Erfolg!", 300, None
+    if roll > 15:
+        return "Großer Erfolg!", roll * 5, roll * 2
+    if roll > 10:
+        return "Erfolg!", roll * 3, roll
+    if roll > 5:
+        return "Kleiner Erfolg!", roll * 2, roll // 2
+    return "Fehlschlag!", roll, 0
+
+
+# === Boss-Klassen ===
+class Boss:
+    def __init__(self, level, health_multiplier=1.0):
+        self.x = random.randint(5, GRID_WIDTH - 5)
+        self.y = random.randint(5, GRID_HEIGHT - 5)
+        self.size = 3 + level // 2
+        base_health = max(30, 3 + level * 5)
+        self.health = int(base_health * health_multiplier)
+        self.speed = 1 + level * 0.2 + random.uniform(0, 0.5)
+        self.last_move = sim_time()
+        self.chase_speed = 0.5
+        self.attack_mode = "normal"
+        self.spawn_time = sim_time()  # Zeitpunkt des Spawns
+        self.image = None
+        fname = random.choice(BOSS_FILES)
+        if fname in BOSS_ANIMATIONS:
+            # Frames kommen aus dem prozessweiten Cache – kein Laden beim Boss-Spawn
+            self.frames = get_boss_frames(*BOSS_ANIMATIONS[fname])
+            self.current_frame = 0
+            self.last_frame_time = sim_time()
+            if self.frames:
+                self.image = self.frames[0]
+        else:
+            self.image = get_boss_image(fname, (self.size * GRID_SIZE, self.size * GRID_SIZE))
+        if SOUNDS.get("boss"):
+            SOUNDS["boss"].play()
+        self.special_attack_timer = sim_time() + random.randint(5, 10)
+        self.next_aoe = sim_time() + 5
+        self.next_proj = sim_time() + 3
+        self.aoe_effect = None
+        self.announcement = "Boss Down Easy Going !!"
+
+    def update(self, current_time):
+        if current_time - self.last_move >= self.chase_speed:
+            self.last_move = current_time
+            self.x += random.choice([-1, 0, 1])
+            self.y += random.choice([-1, 0, 1])
+            self.x = max(0, min(self.x, GRID_WIDTH - self.size))
+            self.y = max(0, min(self.y, GRID_HEIGHT - self.size))
+        if hasattr(self, 'frames') and self.frames:
+            self.update_animation(current_time)
+        if current_time >= self.next_aoe:
+            self.next_aoe = current_time + 5
+            self.aoe_effect = {
+                "image": get_aoe_effect(),
+                "start_time": current_time,
+                "duration": 7,
+                "max_size": self.size * GRID_SIZE * 3
+            }
+            # Schaden erst nach 3 Sekunden Spawn-Zeit
+            if current_time - self.spawn_time >= 3:
+                return "aoe"
+        if current_time >= self.next_proj:
+            self.next_proj = current_time + 3
+            if current_time - self.spawn_time >= 3:
+                return "boss_shoot"
+        return None
+
+    def update_animation(self, current_time):
+        if current_time - self.last_frame_time > 0.1:
+            self.current_frame = (self.current_frame + 1) % len(self.frames)
+            self.image = self.frames[self.current_frame]
+            self.last_frame_time = current_time
+
+    def draw(self, screen):
+        if self.image:
+            screen.blit(self.image, (self.x * GRID_SIZE, self.y * GRID_SIZE))
+        else:
+            pygame.draw.rect(screen, RED, (self.x * GRID_SIZE, self.y * GRID_SIZE,
+                                           self.size * GRID_SIZE, self.size * GRID_SIZE))
+        bar_width = self.size * GRID_SIZE
+        bar_height = 5
+        life_ratio = self.health / max(30, 3 + self.health)
+        life_bar = pygame.Rect(self.x * GRID_SIZE, self.y * GRID_SIZE - 10,
+                               int(bar_width * life_ratio), bar_height)
+        pygame.draw.rect(screen, GREEN, life_bar)
+        pygame.draw.rect(screen, WHITE, (self.x * GRID_SIZE, self.y * GRID_SIZE - 10,
+                                         bar_width, bar_height), 1)
+        if self.aoe_effect:
+            elapsed = sim_time() - self.aoe_effect["start_time"]
+            if elapsed < self.aoe_effect["duration"]:
+                scale = 1 + elapsed * ((self.aoe_effect["max_size"] / (self.size * GRID_SIZE) - 1)
+                                       / self.aoe_effect["duration"])
+                # [KS_TAG: AOE_SCALE_LADDER] Größe auf eine Leiterstufe runden statt jeden Frame neu zu skalieren
+                side = quantise_size(self.size * GRID_SIZE * scale, self.size * GRID_SIZE,
+                                     self.aoe_effect["max_size"])
+                aoe_img = scaled_effect(self.aoe_effect["image"], (side, side), 204)
+                pos_x = self.x * GRID_SIZE + (self.size * GRID_SIZE - aoe_img.get_width()) // 2
+                pos_y = self.y * GRID_SIZE + (self.size * GRID_SIZE - aoe_img.get_height()) // 2
+                screen.blit(aoe_img, (pos_x, pos_y))
+            else:
+                self.aoe_effect = None
+
+    def get_rect(self):
+        rect = pygame.Rect(self.x * GRID_SIZE, self.y * GRID_SIZE,
+                           self.size * GRID_SIZE, self.size * GRID_SIZE)
+        return rect
+
+    def take_damage(self):
+        self.health -= 1
+        if SOUNDS.get("powerup"):
+            SOUNDS["powerup"].play()
+        return self.health <= 0
+
+class Boss2(Boss):
+    def __init__(self, level, health_multiplier=1.0):
+        super().__init__(level, health_multiplier)
+        self.size = 4 + level // 2
+        base_health = max(30, 5 + level * 5)
+        self.health = int(base_health * health_multiplier)
+        self.speed = 1 + level * 0.25 + random.uniform(0, 0.5)
+        self.chase_speed = 0.4
+        self.attack_mode = "shield"
+        self.spawn_time = sim_time()
+        self.image = get_boss_image(random.choice(BOSS_FILES), (self.size * GRID_SIZE, self.size * GRID_SIZE))
+        self.special_attack_timer = sim_time() + random.randint(5, 10)
+        self.next_aoe = sim_time() + 6
+        self.next_proj = sim_time() + 4
+        self.announcement = "Boss2 Down Easy Going !!"
+
+# === Portal-Klasse ===
+class Portal:
+    def __init__(self):
+        self.x = random.randint(0, GRID_WIDTH - 1)
+        self.y = random.randint(0, GRID_HEIGHT - 1)
+        self.image = random.choice(PORTAL_IMAGES)
+        self.event = random.choice(["teleport", "boss", "loot", "color_change", "dice_event"])
+        self.duration = 60
+        self.start_time = sim_time()
+        self.width, self.height = 40, 40
+
+    def draw(self, screen):
+        if self.image:
+            img = pygame.transform.scale(self.image, (self.width, self.height))
+            screen.blit(img, (self.x * GRID_SIZE, self.y * GRID_SIZE))
+        else:
+            pygame.draw.rect(screen, ORANGE, (self.x * GRID_SIZE, self.y * GRID_SIZE, self.width, self.height))
+
+    def get_rect(self):
+        return pygame.Rect(self.x * GRID_SIZE, self.y * GRID_SIZE, self.width, self.height)
+
+# === Item-Klasse ===
+class Item:
+    def __init__(self, item_type, x=None, y=None):
+        self.x = random.randint(0, GRID_WIDTH - 1) if x is None else x
+        self.y = random.randint(0, GRID_HEIGHT - 1) if y is None else y
+        self.type = item_type
+        self.activation_time = 0
+        self.duration = 0
+
+    def draw(self, screen):
+        key = self.type.name
+        img = ITEM_IMAGES.get(key, None)
+        if img:
+            screen.blit(img, (self.x * GRID_SIZE, self.y * GRID_SIZE))
+        else:
+            if self.type == ItemType.SPECIAL_DAMAGE:
+                pygame.draw.circle(screen, PURPLE, (self.x * GRID_SIZE + GRID_SIZE // 2,
+                                                     self.y * GRID_SIZE + GRID_SIZE // 2), GRID_SIZE // 2)
+            elif self.type == ItemType.PROJECTILE_SHOOT:
+                pygame.draw.circle(screen, (0, 255, 255), (self.x * GRID_SIZE + GRID_SIZE // 2,
+                                                            self.y * GRID_SIZE + GRID_SIZE // 2), GRID_SIZE // 2)
+            else:
+                pygame.draw.circle(screen, RED, (self.x * GRID_SIZE + GRID_SIZE // 2,
+                                                  self.y * GRID_SIZE + GRID_SIZE // 2), GRID_SIZE // 2)
+
+    def add_to_batch(self, batch):
+        """Wie draw(), aber das Icon kommt aus dem Atlas und landet im SpriteBatch."""
+        entry = atlas_item(self.type.name)
+        if entry:
+            batch.add_sprite(entry, (self.x * GRID_SIZE, self.y * GRID_SIZE))
+        else:
+            batch.flush()
+            self.draw(batch.target)
+
+
+class FlameProjectile:
+    """
+    Erweiterte Version eines Flammenprojektils mit parametrisierbaren Attributen.
+    """
+    def __init__(self, x, y, direction, image_name="projectiles/FlameProjectile1.png", speed=6, damage=3, lifetime=180):
+        self.direction = direction
+        self.speed = speed
+        self.damage = damage
+        self.lifetime = lifetime
+        self.image_orig = get_projectile_sprite(image_name)
+        self.image = get_projectile_sprite(image_name, direction=self.direction)
+        self.rect = self.image.get_rect(center=(x, y))
+        self.prev_pos = self.rect.topleft  # Position zum Beginn des letzten Ticks (Interpolation)
+
+    def update(self):
+        self.rect.x += self.speed * self.direction[0]
+        self.rect.y += self.speed * self.direction[1]
+        self.lifetime -= 1
+        return self.lifetime > 0
+
+    def draw(self, screen):
+        alpha = SIM_CLOCK.alpha
+        px, py = self.prev_pos
+        screen.blit(self.image, (px + (self.rect.x - px) * alpha, py + (self.rect.y - py) * alpha))
+
+
+# === Simulationskern ===
+class GameCore:
+    """
+    Spielzustand und Regeln ohne Anzeige. Die Simulationsuhr (SIM_CLOCK) ist global –
+    pro Prozess sollte immer nur ein Kern gleichzeitig gesteppt werden.
+    """
+    def __init__(self):
+        self.settings = {
+            'initial_speed': START_SPEED,
+            'fullscreen': False,
+            'music_volume': 0.2,
+            'sfx_volume': 2.0,
+            'bg_music_volume': 0.3,
+            'difficulty': 1.0,
+            'field_scale': 1.0,
+            'snake_design': 0,
+            'custom_head_p1': None,
+            'custom_body_p1': None,
+            'custom_head_p2': None,
+            'custom_body_p2': None,
+            'projectile_speed_factor': PROJECTILE_SPEED_FACTOR,
+            'auto_shoot_interval': AUTO_SHOOT_INTERVAL,  # Neuer konfigurierbarer Parameter für die Schussfrequenz
+            'enemy_spawn_rate': 0.002,  # pro Tick, solange Auto-Shoot aktiv ist
+            'boss_health_multiplier': 1.0,
+            'dirty_rects': False  # Spielansicht nur in geänderten Bereichen aktualisieren (F3)
+        }
+        self.player_count = 1
+        self.leaderboard = []
+        self.reset_game()
+        self.last_auto_shoot = sim_time()
+        self.last_auto_shoot1 = sim_time()
+        self.last_auto_shoot2 = sim_time()
+        self.respawn_invincible_until = 0
+        self.last_head_pos = None
+        self.still_timer = None
+        self.still_countdown = None  # Restzeit bis zum Stillstand-Respawn (nur zur Anzeige)
+
+        # Health-Variablen
+        self.player_health = 100
+        self.player_health_p1 = 100
+        self.player_health_p2 = 100
+
+        self.special_level_timer = sim_time() + 120
+        self.boss_effect_cooldown = 30
+        self.explosions = []  # list of active explosion animations
+        self.game_state = GameState.INTRO
+        self.next_direction = Direction.RIGHT
+        self.snake_direction = Direction.RIGHT
+        self.enemy_hash = SpatialHash()
+        self.projectile_hash = SpatialHash()
+        self.enemy_projectile_hash = SpatialHash()
+        self.boss_flame_hash = SpatialHash()
+        self.boss_fight_active = False  # [KS_TAG: ADMIN_BOSS_INIT]
+
+    def start_game(self, players):
+        self.player_count = players
+        self.reset_game()
+        self.set_state(GameState.GAME)
+
+    # Anzeige-Hooks – im Kern ohne Wirkung, Game überschreibt sie
+    def on_portal_activated(self):
+        pass
+
+    def on_portal_effect_end(self):
+        pass
+
+
+    def intro_state(self):
+        return GameState.INTRO
+
+    def set_state(self, state):
+        self.game_state = state
+        if state == GameState.GAME:
+            self.last_update_time = sim_time()
+
+    def reset_game(self):
+        self.leaderboard_mode = False
+        self.name_input = ""
+        self.set_state(self.intro_state())
+        # Respawn-Unbesiegbarkeit setzen: 3 Sekunden nach Reset
+        self.respawn_invincible_until = sim_time() + 3
+        # Gemeinsames Belegungsraster für alle aktiven Schlangen
+        self.occupancy = OccupancyGrid()
+        if self.player_count == 2:
+            self.snake1 = SnakeBody(self.occupancy, (GRID_WIDTH // 2, GRID_HEIGHT // 2))
+            self.snake2 = SnakeBody(self.occupancy, (GRID_WIDTH // 2, GRID_HEIGHT // 2 + 2))
+            self.snake_direction1 = Direction.RIGHT
+            self.snake_direction2 = Direction.RIGHT
+            self.next_direction1 = Direction.RIGHT
+            self.next_direction2 = Direction.RIGHT
+            self.last_auto_shoot1 = sim_time()
+            self.last_auto_shoot2 = sim_time()
+            self.player_health_p1 = 100
+            self.player_health_p2 = 100
+        else:
+            self.snake = SnakeBody(self.occupancy, (GRID_WIDTH // 2, GRID_HEIGHT // 2))
+            self.snake_direction = Direction.RIGHT
+            self.next_direction = Direction.RIGHT
+            self.last_auto_shoot = sim_time()
+            self.player_health = 100
+        self.items = []
+        self.spawn_food()
+        self.score = 0
+        self.level = 1
+        self.experience = 0
+        self.exp_to_next_level = 100
+        self.speed = self.settings['initial_speed']
+        self.last_update_time = sim_time()
+        self.effects = {k: 0 for k in ('speed_boost', 'speed_reduction', 'score_boost',
+                                       'invincibility', 'length_shortener', 'length_double', 'projectile_shoot')}
+        self.boss = None
+        self.boss_spawn_timer = sim_time() + 60
+        self.game_over_time = 0
+        # Statistik für Headless-Läufe (modules/rollout.py)
+        self.game_start_time = sim_time()
+        self.first_boss_time = None   # Sekunden Spielzeit bis zum ersten Boss
+        self.last_damage_cause = None
+        self.death_cause = None
+        self.pause_time = 0
+        self.lives = 3
+        self.dice_result = None
+        self.dice_display_until = 0
+        self.last_boss_effect_time = 0
+        self.portal = None
+        self.portal_effect_active = False
+        self.portal_effect_end = 0
+        self.portal_effect_type = None
+        self.portal_spawn_cooldown = sim_time() + 30
+        self.projectiles = []
+        self.boss_flame_projectiles = []  # [KS_TAG: BOSS_FLAME_LIST]
+        self.enemy_projectiles = []
+        # FlameProjectile-System initialisieren
+        self.flame_projectiles = []
+        self.fireball_cooldown = 0
+        self.fireball_cooldown_p1 = 0
+        self.fireball_cooldown_p2 = 0
+        self.achievement_messages = []
+        self.enemies = []
+        self.last_auto_shoot = sim_time()
+        self.extra_auto_shots = 0
+        self.aoe_zones = []
+
+    def spawn_food(self):
+        cell = self.occupancy.random_free_cell()
+        if cell is None:
+            print("[DEBUG] Spielfeld voll – kein Platz für Futter.")
+            return False
+        self.add_item(Item(ItemType.FOOD, *cell))
+        return True
+
+    # [KS_TAG: FREE_CELL_INDEX] – Items/Gegner immer über diese Helfer ein- und austragen
+    def add_item(self, item):
+        self.items.append(item)
+        self.occupancy.add((item.x, item.y))
+
+    def remove_item(self, index):
+        item = self.items.pop(index)
+        self.occupancy.remove((item.x, item.y))
+        return item
+
+    def add_enemy(self, enemy):
+        enemy.grid_cell = (enemy.x, enemy.y)
+        self.enemies.append(enemy)
+        self.occupancy.add(enemy.grid_cell)
+
+    def remove_enemy(self, enemy):
+        self.enemies.remove(enemy)
+        self.occupancy.remove(enemy.grid_cell)
+        self.enemy_hash.remove(enemy)
+
+    def sync_enemy_cell(self, enemy):
+        cell = (enemy.x, enemy.y)
+        if cell != enemy.grid_cell:
+            self.occupancy.remove(enemy.grid_cell)
+            self.occupancy.add(cell)
+            enemy.grid_cell = cell
+
+    # --------------------------------------------------------------------
+    # Gleichmäßiger Item-Spawn  –  jedes Item ≈ 9 %  (11 Einträge)
+    # --------------------------------------------------------------------
+    def spawn_new_item(self):
+        itype = random.choice(SPAWN_ITEM_TYPES)
+        if itype == ItemType.SPAWN_BOLBU:
+            print("[DEBUG] Zufälliges SPAWN_BOLBU-Item erzeugt")
+
+        # freie Feld­position aus dem Free-Cell-Index ziehen
+        cell = self.occupancy.random_free_cell()
+        if cell is None:
+            print("[DEBUG] Spielfeld voll – Item-Spawn übersprungen.")
+            return False
+        self.add_item(Item(itype, *cell))
+        return True
+
+    def level_up(self):
+        self.level += 1
+        self.experience -= self.exp_to_next_level
+        self.exp_to_next_level = int(self.exp_to_next_level * 1.5)
+        self.speed = min(MAX_SPEED, self.speed + 0.5)
+        self.start_boss_fight()
+        self.score += 50 * self.level
+        self.add_achievement(f"Level {self.level} erreicht!")
+
+    def start_boss_fight(self):
+        boss_class = random.choice([Boss, Boss2])
+        self.boss = boss_class(self.level, health_multiplier=self.settings['boss_health_multiplier'])
+        if self.first_boss_time is None:
+            self.first_boss_time = sim_time() - self.game_start_time
+        self.add_item(Item(ItemType.PROJECTILE_SHOOT))
+        self.add_achievement(self.boss.announcement)
+        self.game_state = GameState.BOSS_FIGHT
+
+    def add_achievement(self, message):
+        self.achievement_messages.append((message, sim_time() + 10))
+
+    def activate_portal(self, event):
+        self.portal_effect_active = True
+        self.portal_effect_end = sim_time() + 60
+        self.portal_spawn_cooldown = sim_time() + 300
+        self.portal_effect_type = event
+        self.on_portal_activated()
+        if event == "teleport":
+            if self.player_count == 2:
+                self.snake1[0] = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
+                self.snake2[0] = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
+            else:
+                self.snake[0] = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
+            self.add_achievement("Teleport!")
+        elif event == "boss":
+            self.start_boss_fight()
+            for _ in range(3):
+                self.spawn_new_item()
+            self.add_achievement("Boss-Portal!")
+        elif event == "loot":
+            self.effects['score_boost'] = sim_time() + 60
+            self.add_achievement("Loot Boost!")
+        elif event == "color_change":
+            self.add_achievement("Mystery Colors!")
+        elif event == "dice_event":
+            self.dice_result = random.randint(1,20)
+            self.dice_display_until = sim_time() + 5
+            if SOUNDS.get("dice"):
+                SOUNDS["dice"].play()
+            self.add_achievement(f"Portal Dice: {self.dice_result}")
+            if self.dice_result > 10:
+                self.score += self.dice_result * 5
+
+    def spawn_independent_aoe_zone(self):
+        from modules.aoe_zones import DamageZone, HealZone, DebuffZone
+        pos = (random.randint(0, GRID_WIDTH - 1) * GRID_SIZE,
+               random.randint(0, GRID_HEIGHT - 1) * GRID_SIZE)
+        zone_radius = int(sqrt(0.1 * WINDOW_WIDTH * WINDOW_HEIGHT / 3.14))
+        zone_type = random.choice(["damage", "heal", "slow"])
+        duration = random.randint(5, 10)
+        if zone_type == "damage":
+            zone = DamageZone(pos, zone_radius, duration, (255, 0, 0, 128), effect_type="damage")
+        elif zone_type == "heal":
+            zone = HealZone(pos, zone_radius, duration, (0, 255, 0, 128), effect_type="heal")
+        elif zone_type == "slow":
+            zone = DebuffZone(pos, zone_radius, duration, (0, 0, 255, 128), effect_type="slow")
+        else:
+            zone = DamageZone(pos, zone_radius, duration, (255, 0, 0, 128), effect_type="damage")
+        self.aoe_zones.append(zone)
+        print(f"DEBUG: Independent {zone_type} zone spawned at {pos}")
+
+    # [KS_TAG: SPATIAL_HASH]
+    def enemy_hitbox(self, enemy):
+        rect = enemy.get_rect()
+        rect.x += (GRID_SIZE - rect.width) // 2
+        rect.y += (GRID_SIZE - rect.height) // 2
+        return rect
+
+    def rebuild_projectile_hash(self):
+        self.projectile_hash.clear()
+        for proj in self.projectiles:
+            self.projectile_hash.insert(proj, pygame.Rect(proj['pos'][0] * GRID_SIZE, proj['pos'][1] * GRID_SIZE,
+                                                          GRID_SIZE, GRID_SIZE))
+
+    def rebuild_collision_hashes(self):
+        """Trägt Gegner und alle Projektilarten einmal pro Tick in ihre Spatial-Hashes ein."""
+        self.enemy_hash.clear()
+        for enemy in self.enemies:
+            self.enemy_hash.insert(enemy, self.enemy_hitbox(enemy))
+        self.rebuild_projectile_hash()
+        self.enemy_projectile_hash.clear()
+        for proj in self.enemy_projectiles:
+            self.enemy_projectile_hash.insert(proj, proj.rect)
+        self.boss_flame_hash.clear()
+        for proj in self.boss_flame_projectiles:
+            self.boss_flame_hash.insert(proj, proj.rect)
+
+    def player_heads(self):
+        """(Health-Attribut, Kopf-Rechteck) für jeden aktiven Spieler."""
+        if self.player_count == 1:
+            snakes = [(self.snake, 'player_health')]
+        elif self.player_count == 2:
+            snakes = [(self.snake1, 'player_health_p1'), (self.snake2, 'player_health_p2')]
+        else:
+            snakes = []
+        return [(attr, pygame.Rect(snake[0][0] * GRID_SIZE, snake[0][1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+                for snake, attr in snakes if snake]
+
+    def update_projectiles(self):
+        current_time = sim_time()
+
+        # ---- Portal Effect Timeout ----
+        if self.portal_effect_active and current_time >= self.portal_effect_end:
+            print("[DEBUG] Portal-Effekt endet")
+            self.portal_effect_active = False
+            self.portal_effect_type = None
+        # Flammenprojektile und Cooldown aktualisieren
+        if self.fireball_cooldown > 0:
+            self.fireball_cooldown -= 1
+        self.flame_projectiles = [p for p in self.flame_projectiles if p.update()]
+        self.boss_flame_projectiles = [p for p in self.boss_flame_projectiles if p.update()]
+        self.explosions = [e for e in self.explosions if e.update()]
+        self.enemy_projectiles = [p for p in self.enemy_projectiles if p.update()]
+        new_proj = []
+        for proj in self.projectiles:
+            dx, dy = proj['dir']
+            new_x = proj['pos'][0] + dx
+            new_y = proj['pos'][1] + dy
+            proj['pos'] = (new_x, new_y)
+            if new_x < 0 or new_x >= GRID_WIDTH or new_y < 0 or new_y >= GRID_HEIGHT:
+                continue
+            proj_rect = pygame.Rect(new_x * GRID_SIZE, new_y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+            if self.boss and (not proj.get("from_boss", False)) and self.boss.get_rect().colliderect(proj_rect):
+                self.boss.health -= 10
+                if self.boss.health <= 0:
+                    self.boss = None
+                    self.game_state = GameState.GAME
+                    self.boss_spawn_timer = current_time + 60 + random.randint(0,30)
+                    self.score += 100 * self.level
+                    self.add_achievement("Boss besiegt! Boss Down Easy Going !!")
+                    self.effects['boss_loot'] = current_time + 10
+                continue
+            if not proj.get("from_boss", False):
+                size = GRID_SIZE // 2
+            else:
+                size = int(GRID_SIZE * proj.get("scale", 2))
+            if new_x < 0 or new_x >= GRID_WIDTH or new_y < 0 or new_y >= GRID_HEIGHT:
+                continue
+            proj_rect = pygame.Rect(new_x * GRID_SIZE, new_y * GRID_SIZE, size, size)
+            target = self.snake1[0] if self.player_count == 2 and self.snake1 else (self.snake[0] if self.snake else None)
+            if target:
+                head_rect = pygame.Rect(target[0] * GRID_SIZE, target[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+                if head_rect.colliderect(proj_rect) and not proj.get("from_boss", False):
+                    continue
+            new_proj.append(proj)
+        self.projectiles = new_proj
+
+    def check_boss_collision(self, snake_head):
+        if self.boss:
+            boss_rect = self.boss.get_rect()
+            head_x = snake_head[0] * GRID_SIZE + GRID_SIZE // 2
+            head_y = snake_head[1] * GRID_SIZE + GRID_SIZE // 2
+            return boss_rect.collidepoint(head_x, head_y)
+        return False
+
+    def auto_shoot_for_head(self, head, current_direction):
+        target = None
+        min_dist = float("inf")
+        for enemy in self.enemies:
+            if sim_time() - getattr(enemy, 'spawn_time', 0) < 3:
+                continue
+            dist = sqrt((head[0] - enemy.x) ** 2 + (head[1] - enemy.y) ** 2)
+            if dist < min_dist:
+                min_dist = dist
+                target = enemy
+        if target:
+            dx = target.x - head[0]
+            dy = target.y - head[1]
+            angle = atan2(dy, dx)
+            dir_x = cos(angle) * self.settings['projectile_speed_factor']
+            dir_y = sin(angle) * self.settings['projectile_speed_factor']
+        else:
+            dir_x = current_direction.value[0] * self.settings['projectile_speed_factor']
+            dir_y = current_direction.value[1] * self.settings['projectile_speed_factor']
+        proj = {'pos': (head[0], head[1]), 'dir': (dir_x, dir_y), "effect": "damage",
+                "sprite": PLAYER_PROJECTILE_SPRITE}
+        self.projectiles.append(proj)
+        for _ in range(self.extra_auto_shots):
+            deviation = random.uniform(-0.3, 0.3)
+            proj_extra = {'pos': (head[0], head[1]),
+                          'dir': (dir_x + deviation, dir_y + deviation),
+                          "effect": "damage",
+                          "sprite": PLAYER_PROJECTILE_SPRITE}
+            self.projectiles.append(proj_extra)
+
+    def auto_shoot(self):
+        current_time = sim_time()
+            # Prüft, ob der Effekt noch aktiv ist
+        if self.effects['projectile_shoot'] > current_time:
+            if self.player_count == 1:
+                # Verwende den konfigurierten Auto-Shoot-Intervall statt 3 Sekunden
+                if current_time - self.last_auto_shoot < self.settings.get('auto_shoot_interval', 0.5):
+                    return
+                self.last_auto_shoot = current_time
+                self.auto_shoot_for_head(self.snake[0], self.snake_direction)
+            elif self.player_count == 2:
+                if self.snake1 and current_time - self.last_auto_shoot1 >= self.settings.get('auto_shoot_interval', 0.5):
+                    self.last_auto_shoot1 = current_time
+                    self.auto_shoot_for_head(self.snake1[0], self.snake_direction1)
+                if self.snake2 and current_time - self.last_auto_shoot2 >= self.settings.get('auto_shoot_interval', 0.5):
+                    self.last_auto_shoot2 = current_time
+                    self.auto_shoot_for_head(self.snake2[0], self.snake_direction2)
+
+    # === Haupt‑Update‑Schleife ===============================================
+    def update(self):
+        current_time = sim_time()
+        # === [KS_FIX: PORTAL VISUAL RESTORE] ===
+        if self.portal_effect_active and sim_time() >= self.portal_effect_end:
+            print("[DEBUG] Portal-Effekt endet")
+            self.portal_effect_active = False
+            self.portal_effect_type = None
+            self.on_portal_effect_end()
+
+        # ───────────────────────── 1) Cooldowns & Auto‑Shoot ─────────────────────────
+        if self.fireball_cooldown_p1 > 0:
+            self.fireball_cooldown_p1 -= 1
+        if self.fireball_cooldown_p2 > 0:
+            self.fireball_cooldown_p2 -= 1
+        if self.fireball_cooldown > 0:
+            self.fireball_cooldown -= 1
+        # Flammen­geschosse leben lassen / entfernen
+        self.flame_projectiles = [p for p in self.flame_projectiles if p.update()]
+        self.boss_flame_projectiles = [p for p in self.boss_flame_projectiles if p.update()]
+
+        invincible = current_time < self.respawn_invincible_until
+        if self.effects['projectile_shoot'] > current_time:
+            self.auto_shoot()
+            # -- Gegner-Spawn ---------------------------------------------
+            if random.random() < self.settings['enemy_spawn_rate']:
+                enemy = NormalEnemy()
+                enemy.spawn_time = sim_time()
+                self.add_enemy(enemy)
+#             enemy.spawn_time = sim_time()    # removed by patch to avoid UnboundLocalError
+#             self.enemies.append(enemy)    # removed by patch to avoid UnboundLocalError
+
+        for enemy in self.enemies:
+            # Pass Spielerposition für smartere Gegner
+            if self.player_count == 1 and self.snake:
+                px, py = self.snake[0]
+            elif self.player_count == 2 and self.snake1:
+                px, py = self.snake1[0]
+            else:
+                px = py = None
+            enemy.update(px, py)
+            self.sync_enemy_cell(enemy)
+            if getattr(enemy, 'projectiles', None):
+                # Neue Projektile übergeben – ab hier bewegt, zeichnet und entfernt nur noch das Spiel sie
+                self.enemy_projectiles.extend(enemy.projectiles)
+                enemy.projectiles.clear()
+
+        # ───────────────────────── 3) Kollisions­prüfungen ───────────────────────────
+        # Alle Abfragen laufen über die Spatial-Hashes (einmal pro Tick aufgebaut)
+        self.rebuild_collision_hashes()
+            # --- Sichere Kollisionsprüfung für klassische Projektile ---
+        for enemy in self.enemies[:]:
+            if current_time - getattr(enemy, 'spawn_time', 0) < 3:
+                continue
+            if self.projectile_hash.query(self.enemy_hitbox(enemy)):
+                enemy.health -= 1
+                if enemy.health <= 0 and enemy in self.enemies:
+                    self.remove_enemy(enemy)
+                    self.score += 20
+                    self.add_achievement("!")
+                if SOUNDS.get("gegner"):
+                    SOUNDS["gegner"].play()
+                if self.portal is None and current_time >= self.portal_spawn_cooldown:
+                    self.portal = Portal()
+
+        # ---------- 3a)  **FlameProjectile**  ----------
+        for flame in self.flame_projectiles[:]:
+            # → Boss treffen
+            if self.boss:
+                boss_rect = self.boss.get_rect().inflate(-10, -10)
+                if flame.rect.colliderect(boss_rect):
+                    self.boss.health -= flame.damage
+                    self.spawn_fire_explosion(flame.rect.center)
+                    self.flame_projectiles.remove(flame)
+                    break  # <-- korrekt beendet
+
+            # → normalen Gegner treffen
+            for enemy in self.enemy_hash.query(flame.rect):
+                if current_time - getattr(enemy, 'spawn_time', 0) < 2:
+                    continue
+
+                enemy.health -= flame.damage
+                self.spawn_fire_explosion(flame.rect.center)
+                if enemy.health <= 0:
+                    if enemy in self.enemies:
+                        self.remove_enemy(enemy)
+                    self.score += 20
+                    self.add_achievement("Enemy roasted!")
+                if flame in self.flame_projectiles:
+                    self.flame_projectiles.remove(flame)
+                break
+
+        # [KS_TAG: BOSS_FLAME_COLLISION]        # ----- ENEMY PROJECTILE COLLISION -----
+        for attr, head_rect in self.player_heads():
+            for proj in self.enemy_projectile_hash.query(head_rect):
+                self.spawn_fire_explosion(proj.rect.center)
+                setattr(self, attr, getattr(self, attr) - proj.damage)
+                self.last_damage_cause = "enemy_projectile"
+                if proj in self.enemy_projectiles:
+                    self.enemy_projectiles.remove(proj)
+        for attr, head_rect in self.player_heads():
+            for proj in self.boss_flame_hash.query(head_rect):
+                print(f"[DEBUG] BossFlameProjectile trifft {attr}!")
+                self.spawn_fire_explosion(proj.rect.center)
+                setattr(self, attr, getattr(self, attr) - proj.damage)
+                self.last_damage_cause = "boss_flame"
+                if proj in self.boss_flame_projectiles:
+                    self.boss_flame_projectiles.remove(proj)
+
+        # … (Spieler‑ und Boss‑Kollisionen, AoE‑Handling, Bewegung,
+        #     Item‑Aufnahme, Boss‑Logik, Projektil‑Update usw. – unverändert wie besprochen) …
+        # Kollisionsprüfung Spieler (Singleplayer)
+        if self.player_count == 1 and self.snake:
+            head_rect = pygame.Rect(self.snake[0][0] * GRID_SIZE,
+                                    self.snake[0][1] * GRID_SIZE,
+                                    GRID_SIZE, GRID_SIZE)
+            if self.portal and head_rect.colliderect(self.portal.get_rect()):
+                self.activate_portal(self.portal.event)
+                self.portal_effect_active = True
+                self.portal = None
+            # Prüfe, ob der Spieler stillsteht (kein Positionswechsel)
+            current_head = self.snake[0]
+            if self.last_head_pos is None or current_head != self.last_head_pos:
+                # Bewegung festgestellt → Timer zurücksetzen
+                self.last_head_pos = current_head
+                self.still_timer = None
+                self.still_countdown = None
+            else:
+                # Kein Positionswechsel – Timer starten bzw. fortschreiben
+                if self.still_timer is None:
+                    self.still_timer = current_time
+                else:
+                    still_elapsed = current_time - self.still_timer
+                    # Countdown für die Anzeige merken (2,5 Sek. Gesamtzeit) – gezeichnet wird in Game.draw_game
+                    self.still_countdown = max(0.0, 2.5 - still_elapsed)
+                    # Wenn der Spieler insgesamt 2,5 Sek. stillgestanden hat → Respawn auslösen
+                    if still_elapsed >= 2.5:
+                        self.handle_self_collision(cause="stall")
+                        self.still_timer = None  # Timer zurücksetzen, damit nicht mehrfach ausgelöst wird
+                        self.still_countdown = None
+
+            # Zusätzlich die herkömmliche Kollisionsprüfung mit Gegnern:
+            # (Falls der Kopf mit einem Gegner kollidiert)
+            if not invincible and self.enemy_hash.query(head_rect):
+                self.player_health -= 10
+                self.last_damage_cause = "enemy"
+                if self.player_health <= 0:
+                    self.handle_death()
+        elif self.player_count == 2:
+            # Mehrspieler-Kollisionen (unverändert)
+            for snake, health_attr in [(self.snake1, 'player_health_p1'),
+                                         (self.snake2, 'player_health_p2')]:
+                if snake:
+                    head_rect = pygame.Rect(snake[0][0] * GRID_SIZE,
+                                            snake[0][1] * GRID_SIZE,
+                                            GRID_SIZE, GRID_SIZE)
+                    if self.portal and head_rect.colliderect(self.portal.get_rect()):
+                        self.activate_portal(self.portal.event)
+                        self.portal_effect_active = True
+                        self.portal = None
+                    if not invincible and self.snake.hits_body(snake[0], skip_head=True):
+                        self.handle_self_collision(cause="self_collision")
+                    elif not invincible and self.enemy_hash.query(head_rect):
+                        current_health = getattr(self, health_attr)
+                        current_health -= 10
+                        setattr(self, health_attr, current_health)
+                        self.last_damage_cause = "enemy"
+                        if current_health <= 0:
+                            self.handle_death()
+        # Boss-Projektile (Dict-Variante) gegen Spielerköpfe
+        # (ersetzt zwei identische Prüfschleifen mit je 10 Schaden pro Treffer)
+        if not invincible:
+            for attr, head_rect in self.player_heads():
+                for proj in self.projectile_hash.query(head_rect):
+                    if proj.get("from_boss", False):
+                        current_health = getattr(self, attr) - 20
+                        setattr(self, attr, current_health)
+                        self.last_damage_cause = "boss_projectile"
+                        if current_health <= 0:
+                            self.handle_death()
+        self.update_projectiles()
+        if self.player_count == 1 and self.snake:
+            player_obj = type("Player", (), {})()
+            player_obj.pos = Vector2(self.snake[0][0] * GRID_SIZE, self.snake[0][1] * GRID_SIZE)
+            player_obj.health = self.player_health
+            player_obj.base_speed = 5
+            player_obj.speed = 5
+            for zone in self.aoe_zones:
+                zone.update()
+                if zone.is_inside(player_obj.pos) and not invincible:
+                    zone.apply_effect(player_obj)
+                    if not hasattr(zone, "debug_triggered"):
+                        print(f"DEBUG: AoE-Effekt '{zone.effect_type}' auf Singleplayer angewendet.")
+                        zone.debug_triggered = True
+            if player_obj.health < self.player_health:
+                self.last_damage_cause = "aoe"
+            self.player_health = player_obj.health
+            if self.player_health <= 0:
+                self.handle_death()
+        elif self.player_count == 2 and self.snake1 and self.snake2:
+            p1_obj = type("Player", (), {})()
+            p1_obj.pos = Vector2(self.snake1[0][0] * GRID_SIZE, self.snake1[0][1] * GRID_SIZE)
+            p1_obj.health = self.player_health_p1
+            p1_obj.base_speed = 5
+            p1_obj.speed = 5
+            for zone in self.aoe_zones:
+                zone.update()
+                if zone.is_inside(p1_obj.pos) and not invincible:
+                    zone.apply_effect(p1_obj)
+                    if not hasattr(zone, "debug_triggered_p1"):
+                        print(f"DEBUG: AoE-Effekt '{zone.effect_type}' auf Spieler 1 angewendet.")
+                        zone.debug_triggered_p1 = True
+            if p1_obj.health < self.player_health_p1:
+                self.last_damage_cause = "aoe"
+            self.player_health_p1 = p1_obj.health
+            if self.player_health_p1 <= 0:
+                self.handle_death()
+            p2_obj = type("Player", (), {})()
+            p2_obj.pos = Vector2(self.snake2[0][0] * GRID_SIZE, self.snake2[0][1] * GRID_SIZE)
+            p2_obj.health = self.player_health_p2
+            p2_obj.base_speed = 5
+            p2_obj.speed = 5
+            for zone in self.aoe_zones:
+                zone.update()
+                if zone.is_inside(p2_obj.pos) and not invincible:
+                    zone.apply_effect(p2_obj)
+                    if not hasattr(zone, "debug_triggered_p2"):
+                        print(f"DEBUG: AoE-Effekt '{zone.effect_type}' auf Spieler 2 angewendet.")
+                        zone.debug_triggered_p2 = True
+            if p2_obj.health < self.player_health_p2:
+                self.last_damage_cause = "aoe"
+            self.player_health_p2 = p2_obj.health
+            if self.player_health_p2 <= 0:
+                self.handle_death()
+        self.aoe_zones = [zone for zone in self.aoe_zones if zone.alive]
+        if random.random() < 0.001 and len(self.aoe_zones) < 5:
+            self.spawn_independent_aoe_zone()
+        delta = current_time - self.last_update_time
+        if delta >= 1.0 / self.speed:
+            self.last_update_time = current_time
+            if self.player_count == 2:
+                if self.portal and self.snake1:
+                    head_rect = pygame.Rect(self.snake1[0][0] * GRID_SIZE, self.snake1[0][1] * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+                    if head_rect.colliderect(self.portal.get_rect()):
+                        self.activate_portal(self.portal.event)
+                        self.portal_effect_active = True
+                        self.portal = None
+                if self.snake1:
+                    head1 = self.snake1[0]
+                    self.snake_direction1 = self.next_direction1 if hasattr(self, 'next_direction1') else Direction.RIGHT
+                    new_head1 = ((head1[0] + self.snake_direction1.value[0]) % GRID_WIDTH,
+                                 (head1[1] + self.snake_direction1.value[1]) % GRID_HEIGHT)
+                    if new_head1 in self.snake1:
+                        if not invincible:
+                            self.handle_death(cause="self_collision")
+                            return
+                    self.snake1.push_head(new_head1)
+                    for i, item in enumerate(self.items[:]):
+                        if new_head1[0] == item.x and new_head1[1] == item.y:
+                            self.handle_item_pickup(item)
+                            self.remove_item(i)
+                            break
+                    else:
+                        self.snake1.pop_tail()
+                if self.snake2:
+                    head2 = self.snake2[0]
+                    self.snake_direction2 = self.next_direction2 if hasattr(self, 'next_direction2') else Direction.RIGHT
+                    new_head2 = ((head2[0] + self.snake_direction2.value[0]) % GRID_WIDTH,
+                                 (head2[1] + self.snake_direction2.value[1]) % GRID_HEIGHT)
+                    if new_head2 in self.snake2:
+                        if not invincible:
+                            self.handle_death(cause="self_collision")
+                            return
+                    self.snake2.push_head(new_head2)
+                    for i, item in enumerate(self.items[:]):
+                        if new_head2[0] == item.x and new_head2[1] == item.y:
+                            self.handle_item_pickup(item)
+                            self.remove_item(i)
+                            break
+                    else:
+                        self.snake2.pop_tail()
+            else:
+                if self.portal and self.snake:
+                    head_rect = pygame.Rect(self.snake[0][0] * GRID_SIZE, self.snake[0][1] * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+                    if head_rect.colliderect(self.portal.get_rect()):
+                        self.activate_portal(self.portal.event)
+                        self.portal_effect_active = True
+                        self.portal = None
+                if self.snake:
+                    head = self.snake[0]
+                    self.snake_direction = self.next_direction if hasattr(self, 'next_direction') else Direction.RIGHT
+                    new_head = ((head[0] + self.snake_direction.value[0]) % GRID_WIDTH,
+                               (head[1] + self.snake_direction.value[1]) % GRID_HEIGHT)
+                    if self.snake.hits_body(new_head, skip_tail=True):
+                        if not invincible:
+                            self.handle_death(cause="self_collision")
+                            return
+                    self.snake.push_head(new_head)
+                    for i, item in enumerate(self.items[:]):
+                        if new_head[0] == item.x and new_head[1] == item.y:
+                            self.handle_item_pickup(item)
+                            self.remove_item(i)
+                            break
+                    else:
+                        self.snake.pop_tail()
+            if self.boss:
+                if current_time - self.boss.spawn_time >= 3:
+                    target = self.snake[0] if self.player_count == 1 and self.snake else (self.snake1[0] if self.player_count == 2 and self.snake1 else None)
+                    if target and self.check_boss_collision(target) and not invincible:
+                        if SOUNDS.get("damage"):
+                            SOUNDS["damage"].play()
+                        self.handle_death(cause="boss")
+                    else:
+                        act = self.boss.update(current_time)
+                        if act == "aoe":
+
+                            from modules.aoe_zones import GrowingBossAOEZone
+                            zone = GrowingBossAOEZone(
+                                (self.boss.x * GRID_SIZE + (self.boss.size * GRID_SIZE) // 2,
+                                 self.boss.y * GRID_SIZE + (self.boss.size * GRID_SIZE) // 2),
+                                int(GRID_SIZE * 1.2),
+                                int(GRID_SIZE * 2.5),
+                                duration=4.0,
+                                color=(255, 0, 0, 150),
+                                effect_type="damage",
+                                source="boss"
+                            )
+                            self.aoe_zones.append(zone)
+                            boss_rect = self.boss.get_rect()
+                            target = self.snake[0] if self.player_count == 1 and self.snake else (self.snake1[0] if self.player_count == 2 and self.snake1 else None)
+                            if target:
+                                head_pixel = (target[0] * GRID_SIZE + GRID_SIZE // 2, target[1] * GRID_SIZE + GRID_SIZE // 2)
+                                if boss_rect.inflate(40, 40).collidepoint(head_pixel) and not invincible:
+                                    if SOUNDS.get("damage"):
+                                        SOUNDS["damage"].play()
+                                    self.handle_death(cause="boss_aoe")
+                        elif act == "boss_shoot":
+                            self.boss_shoots_flame()
+                            target = self.snake[0] if self.player_count == 1 and self.snake else (self.snake1[0] if self.player_count == 2 and self.snake1 else None)
+                            if target and not invincible:
+                                dx = 1 if target[0] > self.boss.x else -1 if target[0] < self.boss.x else 0
+                                dy = 1 if target[1] > self.boss.y else -1 if target[1] < self.boss.y else 0
+                                proj = {'pos': (self.boss.x, self.boss.y),
+                                        'dir': (dx * self.settings['projectile_speed_factor'], dy * self.settings['projectile_speed_factor']),
+                                        "effect": "damage",
+                                        "from_boss": True,
+                                        "sprite": random.choice(BOSS_PROJECTILE_SPRITES),
+                                        "scale": self.boss.size}
+                                self.projectiles.append(proj)
+            if random.random() < ITEM_SPAWN_CHANCE * self.settings['difficulty'] and len(self.items) < MAX_ITEMS:
+                self.spawn_new_item()
+            self.update_projectiles()
+        # Projektile haben sich bewegt → Projektil-Hash für die letzte Prüfung neu aufbauen
+        self.rebuild_projectile_hash()
+        if not invincible:
+            for _, head_rect in self.player_heads():
+                for proj in self.projectile_hash.query(head_rect):
+                    if proj.get("from_boss", False):
+                        if SOUNDS.get("damage"):
+                            SOUNDS["damage"].play()
+                        self.handle_death(cause="boss_projectile")
+
+             #  Admin-Shortcut: Item exakt an Koordinate spawnen
+    def spawn_item_at(self, item_type, grid_x, grid_y):
+        """
+        Wird vom Admin-Panel (Button 6) benutzt, um z.B. ein SPAWN_BOLBU-Item
+        direkt neben dem Schlangenkopf zu erzeugen.
+        """
+        if not hasattr(self, "items"):
+            return
+        # Spielfeldbegrenzung
+        grid_x = max(0, min(int(grid_x), GRID_WIDTH  - 1))
+        grid_y = max(0, min(int(grid_y), GRID_HEIGHT - 1))
+
+        # Vermeide Spawn auf Kopf-Segment
+        if self.occupancy.is_occupied((grid_x, grid_y)):
+            grid_y = (grid_y + 1) % GRID_HEIGHT
+
+        item = Item(item_type, grid_x, grid_y)
+        self.add_item(item)
+        print(f"[ADMIN] Item {item_type.name} gespawnt an ({grid_x},{grid_y})")
+
+        # Ende Update
+    def handle_item_pickup(self, item):
+        current_time = sim_time()
+        if SOUNDS.get("eat"):
+            SOUNDS["eat"].play()
+        if item.type in ITEM_EFFECTS:
+            key, duration = ITEM_EFFECTS[item.type]
+            self.effects[key] = current_time + duration
+        if item.type == ItemType.FOOD:
+            self.spawn_food()
+        elif item.type == ItemType.SPEED_BOOST:
+            self.speed = min(MAX_SPEED, self.speed + 3)
+        elif item.type == ItemType.SPEED_REDUCTION:
+            self.speed = max(1, self.speed - 3)
+        elif item.type == ItemType.LOOT_BOX:
+            if SOUNDS.get("powerup"):
+                SOUNDS["powerup"].play()
+            self.handle_item_pickup(Item(random.choice(LOOT_ITEM_TYPES)))
+        elif item.type == ItemType.DICE_EVENT:
+            if SOUNDS.get("dice"):
+                SOUNDS["dice"].play()
+            self.dice_result = random.randint(1, 20)
+            self.dice_display_until = current_time + 5
+            message, score, exp = dice_outcome(self.dice_result)
+            self.add_achievement(message)
+            self.score += score
+            if exp is None:
+                self.experience = self.exp_to_next_level
+            else:
+                self.experience += exp
+        elif item.type == ItemType.SPECIAL_DAMAGE:
+            if self.boss is not None:
+                if current_time - self.last_boss_effect_time >= self.boss_effect_cooldown:
+                    dmg = 5 * self.level
+                    self.boss.health -= dmg
+                    self.last_boss_effect_time = current_time
+                    if SOUNDS.get("powerup"):
+                        SOUNDS["powerup"].play()
+                    self.score += 100
+        
+        elif item.type == ItemType.SPAWN_BOLBU:
+            print('[DEBUG] SPAWN_BOLBU Item aufgenommen')
+            from modules.bolbu_enemy import BolbuEnemy
+            spawn_count = random.randint(*BOLBU_SPAWN_RANGE)
+            for _ in range(spawn_count):
+                bolbu = BolbuEnemy()
+                bolbu.spawn_time = current_time
+                self.add_enemy(bolbu)
+            self.score += BOLBU_SPAWN_SCORE * spawn_count
+            self.add_achievement(f"{spawn_count} Bolbu gespawnt!")
+
+        elif item.type == ItemType.PROJECTILE_SHOOT:
+            self.effects['projectile_shoot'] = max(self.effects['projectile_shoot'], current_time) + 900
+            self.extra_auto_shots = min(6, self.extra_auto_shots + 1)
+            self.add_achievement("Multi-Shoot aktiviert!")
+        score, exp = ITEM_REWARDS.get(item.type, (0, 0))
+        self.score += score
+        self.experience += exp
+        if self.experience >= self.exp_to_next_level:
+            self.level_up()
+
+    def handle_self_collision(self, cause="self_collision"):
+        # Spiele den Schadens-Sound (sofern vorhanden)
+        if SOUNDS.get("damage"):
+            SOUNDS["damage"].play()
+        # Ziehe ein Leben ab, aber nur, wenn noch Leben übrig sind
+        self.lives -= 1
+        print("DEBUG: Selbstkollision erkannt – Leben abgezogen, verbleibende Leben:", self.lives)
+    
+        # Falls noch Leben vorhanden, respawne die Schlange (nur im Singleplayer; in Mehrspieler anpassen)
+        if self.lives > 0:
+            if self.player_count == 1:
+                self.snake.reset((GRID_WIDTH // 2, GRID_HEIGHT // 2))
+                self.snake_direction = Direction.RIGHT
+                self.next_direction = Direction.RIGHT
+                self.player_health = 100  # Setze den Gesundheitswert zurück
+            else:
+                # Für Mehrspieler können ähnlich beide Schlangen zurückgesetzt werden
+                self.snake1.reset((GRID_WIDTH // 2, GRID_HEIGHT // 2))
+                self.snake2.reset((GRID_WIDTH // 2, GRID_HEIGHT // 2))
+                self.snake_direction1 = Direction.RIGHT
+                self.snake_direction2 = Direction.RIGHT
+                self.next_direction1 = Direction.RIGHT
+                self.next_direction2 = Direction.RIGHT
+                self.player_health_p1 = 100
+                self.player_health_p2 = 100
+            # Setze eine kurze Invincibility, um erneute sofortige Kollision zu vermeiden
+            self.respawn_invincible_until = sim_time() + 3
+        else:
+            # Falls keine Leben mehr vorhanden sind, gehe auf Game Over
+            self.game_state = GameState.GAME_OVER
+            self.game_over_time = sim_time()
+            self.death_cause = cause
+        if len(self.leaderboard) < 10 or self.score > self.leaderboard[-1][1]:
+            self.leaderboard_mode = True
+
+    def handle_death(self, cause=None):
+        """`cause` gilt für Tode ohne vorherigen Schaden; sonst zählt der letzte Schadensgrund."""
+        if self.player_count == 1:
+            if self.player_health > 0:
+                return
+        elif self.player_count == 2:
+            if self.player_health_p1 > 0 and self.player_health_p2 > 0:
+                return
+        if SOUNDS.get("gameover"):
+            SOUNDS["gameover"].play()
+        self.lives -= 1
+        if self.lives <= 0:
+            self.game_state = GameState.GAME_OVER
+            self.game_over_time = sim_time()
+            self.death_cause = self.last_damage_cause or cause or "unknown"
+            if len(self.leaderboard) < 10 or self.score > self.leaderboard[-1][1]:
+                self.leaderboard_mode = True
+        else:
+            if self.player_count == 2:
+                self.snake1.reset((GRID_WIDTH // 2, GRID_HEIGHT // 2))
+                self.snake2.reset((GRID_WIDTH // 2, GRID_HEIGHT // 2))
+                self.snake_direction1 = Direction.RIGHT
+                self.snake_direction2 = Direction.RIGHT
+                self.next_direction1 = Direction.RIGHT
+                self.next_direction2 = Direction.RIGHT
+                self.player_health_p1 = 100
+                self.player_health_p2 = 100
+            else:
+                self.snake.reset((GRID_WIDTH // 2, GRID_HEIGHT // 2))
+                self.snake_direction = Direction.RIGHT
+                self.next_direction = Direction.RIGHT
+                self.player_health = 100
+            self.respawn_invincible_until = sim_time() + 3
+
+    # [KS_TAG: SPAWN_BOSS_AOE]
+    def spawn_boss_aoe_zone(self, center_pos):
+        radius_start = int(GRID_SIZE * 1.2)
+        radius_max = int(GRID_SIZE * 2.5)
+        duration = 3.0  # Sekunden
+        zone = GrowingBossAOEZone(center_pos, radius_start, radius_max, duration, (255, 0, 0, 180), "damage")
+        self.aoe_zones.append(zone)
+
+    # [KS_TAG: SIM_CLOCK]
+    def step(self):
+        """
+        Ein fester Simulationstick: Positionen für die Render-Interpolation sichern,
+        Spielzustand aktualisieren und die Simulationsuhr weiterstellen.
+        """
+        for proj in self.projectiles:
+            proj['prev_pos'] = proj['pos']
+        for flame in self.flame_projectiles:
+            flame.prev_pos = flame.rect.topleft
+        self.update()
+        SIM_CLOCK.advance()
+
+    # [KS_TAG: BOSS_FLAME_PROJECTILE]
+    def boss_shoots_flame(self):
+        from modules.boss_projectiles import BossFlameProjectile
+        if not self.boss:
+            print("[DEBUG] Kein Boss vorhanden – BossFlameProjectile nicht erzeugt.")
+            return
+
+        if self.player_count == 1 and self.snake:
+            target = self.snake[0]
+        elif self.player_count == 2 and self.snake1:
+            target = self.snake1[0]
+        else:
+            print("[DEBUG] Kein Ziel vorhanden – BossFlameProjectile nicht erzeugt.")
+            return
+
+        dx = target[0] - self.boss.x
+        dy = target[1] - self.boss.y
+        distance = max(1, (dx**2 + dy**2)**0.5)
+        direction = (dx / distance, dy / distance)
+
+        center_x = self.boss.x * GRID_SIZE + (self.boss.size * GRID_SIZE) // 2
+        center_y = self.boss.y * GRID_SIZE + (self.boss.size * GRID_SIZE) // 2
+
+        proj = BossFlameProjectile(center_x, center_y, direction)
+        self.boss_flame_projectiles.append(proj)
+        print("[DEBUG] BossFlameProjectile aktiv mit Explosion bei Treffer!")
+
+    def spawn_custom_projectile(self, x, y, direction, speed=6, damage=3, lifetime=180, image_name="projectiles/FlameProjectile1.png"):
+        image = get_projectile_sprite(image_name, direction=direction)
+        rect = image.get_rect(center=(x, y))
+        projectile = {
+            "image": image,
+            "rect": rect,
+            "speed": speed,
+            "dir": direction,
+            "damage": damage,
+            "lifetime": lifetime,
+            "from_boss": False,
+            "effect": "custom"
+        }
+        self.projectiles.append(projectile)
+        print(f"[DEBUG] Benutzerdefiniertes Projektil gespawnt: {image_name}, Dmg: {damage}, Speed: {speed}")
+
+        # ------------------------------------------------------
+    # Explosion Animation Handling
+    # ------------------------------------------------------
+    def spawn_fire_explosion(self, center_pos):
+        """Explosionen sind reine Darstellung – der Kern erzeugt keine, Game überschreibt das."""
+        pass
+
+
+# [KS_TAG: HEADLESS_SIM]
+def simulate(players=1, max_ticks=SIM_CLOCK.tick_rate * 600, controller=None):
+    """
+    Ein komplettes Spiel ohne Anzeige durchrechnen – so schnell wie die CPU erlaubt.
+    `controller(core)` wird vor jedem Tick aufgerufen und darf die next_direction*-Felder setzen.
+    Liefert den Kern im Endzustand (Game Over oder max_ticks erreicht).
+    """
+    core = GameCore()
+    core.start_game(players)
+    for _ in range(max_ticks):
+        if core.game_state not in (GameState.GAME, GameState.BOSS_FIGHT):
+            break
+        if controller:
+            controller(core)
+        core.step()
+    return core
+
@@ -1,15 +1,58 @@
 
 # [KS_TAG: GRAPHICS_INIT]
 import os
+import time
 import pygame
-from config import WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE
+from collections.abc import Mapping, Sequence
+from math import atan2, degrees
+from config import GRID_SIZE
+from modules.asset_pack import open_pack, pack_key
+
+# [KS_TAG: ASSET_PACK] – gepacktes Archiv (python -m modules.asset_pack), wird beim ersten Bild gemappt
+_PACK = None
+
+def _asset_pack():
+    global _PACK
+    if _PACK is None:
+        _PACK = open_pack() or False
+        if _PACK:
+            # memoryview-Slices sind Sichten ins mmap, keine Kopien
+            _PACK = (*_PACK, memoryview(_PACK[0]))
+            print(f"[DEBUG] Grafikarchiv gemappt: {len(_PACK[1])} Grafiken")
+    return _PACK
+
+def asset_exists(path):
+    pack = _asset_pack()
+    return (pack and pack_key(path) in pack[1]) or os.path.exists(path)
+
+def list_assets(folder):
+    """Dateinamen in assets/graphics/<folder> – aus dem Archivindex, sonst per os.listdir."""
+    pack = _asset_pack()
+    if pack:
+        prefix = folder.strip("/") + "/"
+        return [key[len(prefix):] for key in pack[1] if key.startswith(prefix) and "/" not in key[len(prefix):]]
+    path = os.path.join("assets", "graphics", folder)
+    return os.listdir(path) if os.path.isdir(path) else []
+
+def decode_image(path):
+    """
+    Grafik laden: aus dem Archiv direkt aus dem RGBA-Puffer, sonst PNG dekodieren.
+    convert_alpha() nur, wenn bereits ein Fenster existiert (headless: eigene Kopie/Original).
+    """
+    pack = _asset_pack()
+    entry = pack and pack[1].get(pack_key(path))
+    if entry:
+        offset, w, h = entry
+        image = pygame.image.frombuffer(pack[2][offset:offset + w * h * 4], (w, h), "RGBA")
+        return image.convert_alpha() if pygame.display.get_surface() else image.copy()
+    image = pygame.image.load(path)
+    return image.convert_alpha() if pygame.display.get_surface() else image
 
 # Einheitliche Ladefunktion für Grafiken aus Kategorieordnern
 def load_image(name, category=""):
     path = os.path.join("assets", "graphics", category, name)
     try:
-        image = pygame.image.load(path).convert_alpha()
-        return image
+        return decode_image(path)
     except Exception as e:
         print(f"[Fehler] Grafik nicht gefunden: {path} ({e})")
         return pygame.Surface((32, 32), pygame.SRCALPHA)
@@ -22,86 +65,316 @@ def scale_to_thumbnail(image, factor=0.75):
         return pygame.transform.scale(image, (width, height))
     return image
 
+# [KS_TAG: ASSET_REGISTRY] – Grafiken werden erst beim ersten Zugriff dekodiert
+class AssetRegistry:
+    """
+    Name -> (Datei, Kategorie, Zielgröße). `get()` dekodiert beim ersten Zugriff und merkt sich
+    die Surface; `prewarm()` lädt Offenes schrittweise nach (Ladebildschirm, Menü-Frames).
+    Beim Import wird nichts dekodiert – es braucht dafür also auch kein Fenster.
+    """
+    def __init__(self):
+        self.specs = {}
+        self.images = {}
+
+    def register(self, name, filename, category="", size=None):
+        self.specs[name] = (filename, category, size)
+
+    def get(self, name):
+        image = self.images.get(name)
+        if image is None:
+            spec = self.specs.get(name)
+            if spec is None:
+                return None
+            filename, category, size = spec
+            image = load_image(filename, category)
+            if size:
+                image = pygame.transform.scale(image, size)
+            self.images[name] = image
+        return image
+
+    def pending(self):
+        return [name for name in self.specs if name not in self.images]
+
+    def prewarm(self, budget=None):
+        """
+        Noch nicht geladene Grafiken dekodieren, höchstens `budget` Sekunden lang (None = alle).
+        Liefert die Anzahl der danach noch offenen Grafiken.
+        """
+        pending = self.pending()
+        deadline = None if budget is None else time.perf_counter() + budget
+        for done, name in enumerate(pending):
+            if deadline is not None and time.perf_counter() >= deadline:
+                return len(pending) - done
+            self.get(name)
+        return 0
+
+
+class LazyImages(Mapping):
+    """Dict-Sicht (Schlüssel -> Registry-Name), z. B. ITEM_IMAGES['FOOD']; lädt erst beim Zugriff."""
+    def __init__(self, registry, names):
+        self.registry = registry
+        self.names = names
+
+    def __getitem__(self, key):
+        return self.registry.get(self.names[key])
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+class LazyImageList(Sequence):
+    """Listen-Sicht auf Registry-Namen (z. B. PORTAL_IMAGES für random.choice)."""
+    def __init__(self, registry, names):
+        self.registry = registry
+        self.names = list(names)
+
+    def __getitem__(self, index):
+        return self.registry.get(self.names[index])
+
+    def __len__(self):
+        return len(self.names)
+
+
+ASSETS = AssetRegistry()
+PREWARM_BUDGET = 0.004  # Sekunden pro Menü-Frame für ASSETS.prewarm()
+
 # Snake-Grafiken
-SNAKE_HEAD_IMG = load_image("SnakeHeadAlpha1.png")
-if SNAKE_HEAD_IMG:
-    SNAKE_HEAD_IMG = pygame.transform.scale(SNAKE_HEAD_IMG, (GRID_SIZE, GRID_SIZE))
-SNAKE_HEAD1G20 = load_image("SnakeHead1G20.png")
-SNAKE_HEAD2G20 = load_image("SnakeHead2G20.png")
-SNAKE_HEAD3G20 = load_image("SnakeHead3G20.png")
-SNAKE_HEAD_BETA = load_image("SnakeHeadBetaG20.png")
-SNAKE_BODY_IMG = load_image("SnakeBodyAlpha1.png")
-SNAKE_BODY_BETA = load_image("SnakeBodyBeta.png")
-SNAKE_BODY_Body7 = load_image("SnakeBody7.png")
-SNAKE_BODY_Body5 = load_image("SnakeBody5.png")
-SNAKE_BODY_Body4 = load_image("SnakeBody4.png")
-SNAKE_BODY_Body2 = load_image("SnakeBody2.png")
-SNAKE_BODY_Body6 = load_image("SnakeBody6.png")
+SNAKE_HEAD_FILE = "SnakeHeadAlpha1.png"
+SNAKE_HEAD_P2_FILE = "SnakeHeadBetaG20.png"
+SNAKE_BODY_FILE = "SnakeBodyAlpha1.png"
+ASSETS.register("SNAKE_HEAD_IMG", SNAKE_HEAD_FILE, size=(GRID_SIZE, GRID_SIZE))
+ASSETS.register("SNAKE_HEAD1G20", "SnakeHead1G20.png")
+ASSETS.register("SNAKE_HEAD2G20", "SnakeHead2G20.png")
+ASSETS.register("SNAKE_HEAD3G20", "SnakeHead3G20.png")
+ASSETS.register("SNAKE_HEAD_BETA", SNAKE_HEAD_P2_FILE)
+ASSETS.register("SNAKE_BODY_IMG", SNAKE_BODY_FILE)
+ASSETS.register("SNAKE_BODY_BETA", "SnakeBodyBeta.png")
+ASSETS.register("SNAKE_BODY_Body7", "SnakeBody7.png")
+ASSETS.register("SNAKE_BODY_Body5", "SnakeBody5.png")
+ASSETS.register("SNAKE_BODY_Body4", "SnakeBody4.png")
+ASSETS.register("SNAKE_BODY_Body2", "SnakeBody2.png")
+ASSETS.register("SNAKE_BODY_Body6", "SnakeBody6.png")
+
+# [KS_TAG: SNAKE_SPRITE_CACHE] – vorskalierte und vorrotierte Snake-Sprites
+_SNAKE_SPRITE_CACHE = {}
+
+def get_snake_sprite(filename, direction=None):
+    """
+    Liefert ein auf GRID_SIZE skaliertes Snake-Sprite (Kopf: zusätzlich nach Richtung rotiert).
+    Schlüssel ist (Datei, GRID_SIZE, Richtung) – jede Kombination wird genau einmal geladen
+    und transformiert, danach ist das Zeichnen eines Segments ein reiner Blit.
+    """
+    key = (filename, GRID_SIZE, direction)
+    sprite = _SNAKE_SPRITE_CACHE.get(key)
+    if sprite is None:
+        if direction is None:
+            sprite = pygame.transform.scale(load_image(filename), (GRID_SIZE, GRID_SIZE))
+        else:
+            sprite = pygame.transform.rotate(get_snake_sprite(filename), -direction.value[0] * 90)
+        _SNAKE_SPRITE_CACHE[key] = sprite
+    return sprite
+
+# [KS_TAG: PROJECTILE_SPRITE_CACHE] – geteilte, vorrotierte Projektil-Sprites
+PROJECTILE_ANGLE_STEPS = 64  # Winkelauflösung: 360° / 64 = 5,625° (0/90/180/270° bleiben exakt)
+_PROJECTILE_SPRITE_CACHE = {}
+PROJECTILE_CACHE_STATS = {"hits": 0, "misses": 0}
+
+def get_projectile_sprite(image_name, category="", direction=None, size=None):
+    """
+    Projektilgrafik aus dem Cache. `size` skaliert die Grundgrafik, `direction` (dx, dy) dreht
+    sie auf den nächsten von PROJECTILE_ANGLE_STEPS Winkeln. Schlüssel ist
+    (Datei, Kategorie, Größe, Winkelstufe); die Surface wird geteilt und darf nicht verändert werden.
+    """
+    step = None
+    if direction is not None:
+        angle = degrees(atan2(-direction[1], direction[0]))
+        step = round(angle * PROJECTILE_ANGLE_STEPS / 360) % PROJECTILE_ANGLE_STEPS
+    key = (image_name, category, size, step)
+    sprite = _PROJECTILE_SPRITE_CACHE.get(key)
+    if sprite is not None:
+        PROJECTILE_CACHE_STATS["hits"] += 1
+        return sprite
+    PROJECTILE_CACHE_STATS["misses"] += 1
+    if step is None:
+        sprite = load_image(image_name, category)
+        if size:
+            sprite = pygame.transform.scale(sprite, size)
+    else:
+        base = get_projectile_sprite(image_name, category, None, size)
+        sprite = pygame.transform.rotate(base, step * 360 / PROJECTILE_ANGLE_STEPS)
+    _PROJECTILE_SPRITE_CACHE[key] = sprite
+    return sprite
+
+class SpriteHandle:
+    """
+    Verweis auf eine Projektilgrafik in fester Größe. Wird beim Spawn ins Projektil gelegt;
+    die Surface wird beim ersten Zeichnen über den Projektil-Cache aufgelöst und gemerkt,
+    danach ist `surface` ein reiner Attributzugriff (headless wird nie etwas geladen).
+    """
+    __slots__ = ("image_name", "size", "_surface")
+
+    def __init__(self, image_name, size=None):
+        self.image_name = image_name
+        self.size = size
+        self._surface = None
+
+    @property
+    def surface(self):
+        if self._surface is None:
+            self._surface = get_projectile_sprite(self.image_name, size=self.size)
+        return self._surface
+
+def projectile_cache_stats():
+    """Trefferzähler des Projektil-Caches (für Admin-Panel/Debug-Ausgaben)."""
+    hits, misses = PROJECTILE_CACHE_STATS["hits"], PROJECTILE_CACHE_STATS["misses"]
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "entries": len(_PROJECTILE_SPRITE_CACHE),
+            "hit_rate": hits / total if total else 0.0}
 
 # Projektile
-PROJECTILE_IMG = load_image("Projektil.png")
-PROJECTILE2_IMG = load_image("Projektil2.png")
-PROJECTILE3_IMG = load_image("Projektil3.png")
-PROJECTILE4_IMG = load_image("Projektil4.png")
-PROJECTILE5_IMG = load_image("Projektil5.png")
+ASSETS.register("PROJECTILE_IMG", "Projektil.png")
+ASSETS.register("PROJECTILE2_IMG", "Projektil2.png")
+ASSETS.register("PROJECTILE3_IMG", "Projektil3.png")
+ASSETS.register("PROJECTILE4_IMG", "Projektil4.png")
+ASSETS.register("PROJECTILE5_IMG", "Projektil5.png")
 
 # Titelbild
-TITLE_IMG = load_image("titel1.png")
+ASSETS.register("TITLE_IMG", "titel1.png")
 
 # Bosse
-BOSS_IMG = load_image("Boss-RingG60.png")
-BOSS_ALT_IMG = load_image("Boss-SkullPurPurG60.png")
-BOSS_ALEX_IMG = load_image("Boss-AlexG60.png")
-BOSS_BOLGI_IMG = load_image("Boss-BolgiG60.png")
-BOSS_DEMUS_IMG = load_image("Boss-DemusG60.png")
-BOSS_FIN_IMG = load_image("Boss-FinG60.png")
-BOSS_GLOBY_IMG = load_image("Boss-GlobyG60.png")
-BOSS_NEO_IMG = load_image("Boss-NeoG60.png")
+ASSETS.register("BOSS_IMG", "Boss-RingG60.png")
+ASSETS.register("BOSS_ALT_IMG", "Boss-SkullPurPurG60.png")
+ASSETS.register("BOSS_ALEX_IMG", "Boss-AlexG60.png")
+ASSETS.register("BOSS_BOLGI_IMG", "Boss-BolgiG60.png")
+ASSETS.register("BOSS_DEMUS_IMG", "Boss-DemusG60.png")
+ASSETS.register("BOSS_FIN_IMG", "Boss-FinG60.png")
+ASSETS.register("BOSS_GLOBY_IMG", "Boss-GlobyG60.png")
+ASSETS.register("BOSS_NEO_IMG", "Boss-NeoG60.png")
+
+# [KS_TAG: BOSS_FRAME_CACHE] – Bossgrafiken prozessweit einmal laden und skalieren
+BOSS_FILES = ["Boss-AlexG60.png", "Boss-BolgiG60.png", "Boss-DemusG60.png",
+              "Boss-FinG60.png", "Boss-GlobyG60.png", "Boss-NeoG60.png",
+              "Boss-RingG60.png", "Boss-SkullPurPurG60.png"]
+# Bosse mit Animation: Bossdatei -> (Frame-Ordner, Anzahl Frames)
+BOSS_ANIMATIONS = {
+    "Boss-DemusG60.png": ("Boss001", 49),
+    "Boss-RingG60.png": ("Boss002", 15),
+    "Boss-FinG60.png": ("Boss003", 15),
+}
+BOSS_FRAME_SIZE = (int(60 * (GRID_SIZE / 20)), int(60 * (GRID_SIZE / 20)))
+_BOSS_FRAME_CACHE = {}
+
+def get_boss_frames(folder, count, size=BOSS_FRAME_SIZE):
+    """
+    Animationsframes eines Bosses, skaliert auf `size`. Schlüssel ist (Ordner, Größe) –
+    die Frames werden einmal pro Prozess geladen und von allen Boss-Instanzen geteilt
+    (nur lesen, nicht verändern).
+    """
+    key = (folder, size)
+    frames = _BOSS_FRAME_CACHE.get(key)
+    if frames is None:
+        frames = []
+        path = os.path.join("assets", "graphics", folder)
+        for i in range(count):
+            frame_filename = os.path.join(path, f"frame{i:04d}.png")
+            try:
+                img = decode_image(frame_filename)
+                frames.append(pygame.transform.scale(img, size))
+            except Exception as e:
+                print(f"Fehler beim Laden von {frame_filename}: {e}")
+        # Leeres Ergebnis nicht merken, damit ein späterer Versuch (z. B. mit Fenster) erneut lädt
+        if frames:
+            _BOSS_FRAME_CACHE[key] = frames
+    return frames
+
+def get_boss_image(fname, size):
+    """Statische Bossgrafik, skaliert auf `size` (Schlüssel: Datei, Größe). None bei Fehler."""
+    key = (fname, size)
+    image = _BOSS_FRAME_CACHE.get(key)
+    if image is None:
+        path = os.path.join("assets", "graphics", fname)
+        try:
+            img = decode_image(path)
+        except Exception as e:
+            print(f"Fehler beim Laden von Bossgrafik {fname}: {e}")
+            return None
+        image = _BOSS_FRAME_CACHE[key] = pygame.transform.scale(img, size)
+    return image
+
+def preload_boss_graphics(max_level=10):
+    """
+    Cache vorwärmen (z. B. beim Start/Ladebildschirm): alle Animationen sowie die statischen
+    Bossgrafiken in den Größen, die Boss/Boss2 bis `max_level` verwenden.
+    """
+    for folder, count in BOSS_ANIMATIONS.values():
+        get_boss_frames(folder, count)
+    sizes = {3 + level // 2 for level in range(1, max_level + 1)}
+    sizes |= {4 + level // 2 for level in range(1, max_level + 1)}
+    for fname in BOSS_FILES:
+        for tiles in sizes:
+            get_boss_image(fname, (tiles * GRID_SIZE, tiles * GRID_SIZE))
 
 # Portale
-PORTAL_IMAGES = [
-    load_image("PortalBlauG40.png"),
-    load_image("PortalG40.png"),
-    load_image("PortalTempelG60.png")
-]
-
-ITEM_IMAGES = {
-    "FOOD":             load_image("ItemgruenG20.png"),
-    "SPEED_BOOST":      load_image("ItemOrangeradG20.png"),
-    "SPEED_REDUCTION":  load_image("ItemGrauradG20.png"),
-    "SCORE_BOOST":      load_image("ItemblauG20.png"),
-    "INVINCIBILITY":    load_image("ItemDiamantG20.png"),
-    "LOOT_BOX":         load_image("ItemLavaG20.png"),
-    "LENGTH_SHORTENER": load_image("ItemRotradG20.png"),
-    "LENGTH_DOUBLE":    load_image("ItemTrank1G20.png"),
-    "DICE_EVENT":       load_image("ItemTrank2G20.png"),
-    "SPECIAL_DAMAGE":   load_image("ItemTrank3FG20.png"),
-    "PROJECTILE_SHOOT": load_image("Projektil.png"),
-    "SPAWN_BOLBU":      load_image("SPAWN_BOLBU.png", "items"),
+PORTAL_FILES = ["PortalBlauG40.png", "PortalG40.png", "PortalTempelG60.png"]
+for _fname in PORTAL_FILES:
+    ASSETS.register(_fname, _fname)
+PORTAL_IMAGES = LazyImageList(ASSETS, PORTAL_FILES)
+
+ITEM_FILES = {
+    "FOOD":             "ItemgruenG20.png",
+    "SPEED_BOOST":      "ItemOrangeradG20.png",
+    "SPEED_REDUCTION":  "ItemGrauradG20.png",
+    "SCORE_BOOST":      "ItemblauG20.png",
+    "INVINCIBILITY":    "ItemDiamantG20.png",
+    "LOOT_BOX":         "ItemLavaG20.png",
+    "LENGTH_SHORTENER": "ItemRotradG20.png",
+    "LENGTH_DOUBLE":    "ItemTrank1G20.png",
+    "DICE_EVENT":       "ItemTrank2G20.png",
+    "SPECIAL_DAMAGE":   "ItemTrank3FG20.png",
+    "PROJECTILE_SHOOT": "Projektil.png",
 }
+for _key, _fname in ITEM_FILES.items():
+    ASSETS.register("ITEM_" + _key, _fname)
+ASSETS.register("SPAWN_BOLBU", "SPAWN_BOLBU.png", "items")
+ITEM_IMAGES = LazyImages(ASSETS, {**{key: "ITEM_" + key for key in ITEM_FILES}, "SPAWN_BOLBU": "SPAWN_BOLBU"})
 
 # Gegner
-ENEMY_TIM_IMG = load_image("gegner-TimG40.png")
-ENEMY_SPOONG_IMG = load_image("gegner-SpoongG40.png")
-ENEMY_OMNI_IMG = load_image("gegner-OmniG40.png")
-ENEMY_GLUBS_IMG = load_image("gegner-glubsG40.png")
+ASSETS.register("ENEMY_TIM_IMG", "gegner-TimG40.png")
+ASSETS.register("ENEMY_SPOONG_IMG", "gegner-SpoongG40.png")
+ASSETS.register("ENEMY_OMNI_IMG", "gegner-OmniG40.png")
+ASSETS.register("ENEMY_GLUBS_IMG", "gegner-glubsG40.png")
+BOLBU_FRAME_NAMES = [f"BOLBU_FRAME_{i}" for i in range(1, 7)]
+for _i, _name in enumerate(BOLBU_FRAME_NAMES, 1):
+    ASSETS.register(_name, f"bolbugeg1/{_i}bolbugeg.png")
 
-# UI
-OPTIONS_BUTTON_IMG = load_image("optionsButton1.png")
-PLAY_BUTTON_IMG = load_image("PlayButton1.png")
+# [KS_TAG: ENEMY_SPRITE_CACHE] – skalierte Gegnergrafiken pro (Name, Größe), von allen Gegnern geteilt
+_ENEMY_SPRITE_CACHE = {}
 
-# Tile graphics
+def get_enemy_sprite(name, size):
+    key = (name, size)
+    if key not in _ENEMY_SPRITE_CACHE:
+        image = ASSETS.get(name)
+        _ENEMY_SPRITE_CACHE[key] = pygame.transform.scale(image, size) if image else None
+    return _ENEMY_SPRITE_CACHE[key]
 
-TILE_IMAGES = {}
-_tile_dir = os.path.join("assets", "graphics", "tiles")
-if os.path.isdir(_tile_dir):
-    for fname in os.listdir(_tile_dir):
-        if fname.lower().endswith(".png"):
-            key = os.path.splitext(fname)[0]
-            img = load_image(fname, "tiles")
-            if img:
-                img = pygame.transform.scale(img, (GRID_SIZE, GRID_SIZE))
-            TILE_IMAGES[key] = img
+def get_enemy_frames(names, size):
+    return [get_enemy_sprite(name, size) for name in names]
+
+# UI
+ASSETS.register("OPTIONS_BUTTON_IMG", "optionsButton1.png")
+ASSETS.register("PLAY_BUTTON_IMG", "PlayButton1.png")
+
+# Tile graphics – nur die Dateiliste wird beim Import gelesen, dekodiert wird pro Tile beim ersten Zugriff
+_tile_names = {}
+for fname in sorted(list_assets("tiles")):
+    if fname.lower().endswith(".png"):
+        key = os.path.splitext(fname)[0]
+        _tile_names[key] = "tile:" + key
+        ASSETS.register(_tile_names[key], fname, "tiles", size=(GRID_SIZE, GRID_SIZE))
+TILE_IMAGES = LazyImages(ASSETS, _tile_names)
 
 
 # Zugriffsfunktion für Tile
@@ -109,11 +382,16 @@ def get_tile(name):
     return TILE_IMAGES.get(name)
 
 # [KS_TAG: GRAPHICS_DICT] – Zentrale Mapping-Struktur
-GRAPHICS = {
-    "BOLBU_PROJECTILE": load_image("bolbu_projectile.png", "projectiles"),
-    "SPAWN_BOLBU": load_image("SPAWN_BOLBU.png", "items")
-}
+ASSETS.register("BOLBU_PROJECTILE", "bolbu_projectile.png", "projectiles")
+GRAPHICS = LazyImages(ASSETS, {"BOLBU_PROJECTILE": "BOLBU_PROJECTILE", "SPAWN_BOLBU": "SPAWN_BOLBU"})
 
-# Zugriffsfunktion für zentrale Grafiken
+# Zugriffsfunktion für zentrale Grafiken (auch alle Registry-Namen wie "TITLE_IMG")
 def get_image(name):
-    return GRAPHICS.get(name, pygame.Surface((32, 32), pygame.SRCALPHA))
+    image = ASSETS.get(name)
+    return image if image is not None else pygame.Surface((32, 32), pygame.SRCALPHA)
+
+def __getattr__(name):
+    # Frühere Modulkonstanten (SNAKE_HEAD_IMG, BOSS_IMG, ...) bleiben erreichbar, jetzt lazy
+    if name in ASSETS.specs:
+        return ASSETS.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
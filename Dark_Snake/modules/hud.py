@@ -0,0 +1,76 @@
+"""
+Modul: hud.py
+Zweck: Retained-Mode-HUD. Jede Anzeige (Score, Level, Leben, Health-Bars, Boss-Timer) ist ein
+       Panel mit vorgerenderter Surface, das nur neu gerendert wird, wenn sich sein gebundener
+       Wert ändert. Die Panels liegen in wenigen HUD-Regionen (eigene Surfaces); pro Frame wird
+       die ganze HUD-Ebene mit einem einzigen blits()-Aufruf gezeichnet.
+"""
+
+import pygame
+
+_UNSET = object()
+
+
+class HudPanel:
+    __slots__ = ("anchor", "align", "render", "value", "surface", "rect", "region")
+
+    def __init__(self, anchor, align, render, region):
+        self.anchor = anchor
+        self.align = align
+        self.render = render
+        self.region = region
+        self.value = _UNSET
+        self.surface = None
+        self.rect = None
+
+
+class HudLayer:
+    """
+    regions: Bildschirmrechtecke, in denen Panels liegen dürfen. Panels dürfen sich nicht
+    überlappen – sie werden exakt (BLEND_RGBA_MAX auf transparente Fläche) in ihre Region kopiert.
+    """
+    def __init__(self, *regions):
+        self.regions = []
+        for rect in regions:
+            rect = pygame.Rect(rect)
+            self.regions.append((rect, pygame.Surface(rect.size, pygame.SRCALPHA)))
+        self.visible = [0] * len(self.regions)  # sichtbare Panels je Region (leere Regionen nicht blitten)
+        self.panels = {}
+        self.changed = []  # seit dem letzten draw() geänderte Bereiche (Bildschirmkoordinaten)
+
+    def add_panel(self, name, anchor, render, align="topleft"):
+        """`render(value)` liefert die Surface des Panels (oder None = ausgeblendet)."""
+        point = (anchor[0] - 1, anchor[1]) if align == "topright" else anchor
+        for index, (rect, _) in enumerate(self.regions):
+            if rect.collidepoint(point):
+                self.panels[name] = HudPanel(anchor, align, render, index)
+                return
+        raise ValueError(f"HUD-Panel '{name}' liegt in keiner HUD-Region: {anchor}")
+
+    def bind(self, name, value):
+        """Wert setzen; das Panel wird nur bei geändertem Wert neu gerendert."""
+        panel = self.panels[name]
+        if value == panel.value:
+            return
+        panel.value = value
+        region_rect, region_surf = self.regions[panel.region]
+        old = panel.rect
+        if old:
+            region_surf.fill((0, 0, 0, 0), old.move(-region_rect.x, -region_rect.y))
+            self.visible[panel.region] -= 1
+        panel.surface = panel.render(value)
+        if panel.surface:
+            panel.rect = panel.surface.get_rect(**{panel.align: panel.anchor})
+            region_surf.blit(panel.surface, panel.rect.move(-region_rect.x, -region_rect.y),
+                             special_flags=pygame.BLEND_RGBA_MAX)
+            self.visible[panel.region] += 1
+        else:
+            panel.rect = None
+        self.changed += [r for r in (old, panel.rect) if r]
+
+    def draw(self, target):
+        """Ganze HUD-Ebene zeichnen; liefert die seit dem letzten Aufruf geänderten Bereiche."""
+        target.blits([(surf, rect) for (rect, surf), count in zip(self.regions, self.visible) if count],
+                     doreturn=False)
+        changed, self.changed = self.changed, []
+        return changed
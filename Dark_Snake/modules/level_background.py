@@ -0,0 +1,97 @@
+"""
+Modul: level_background.py
+Zweck: Tile-Layer-Compositor für den Level-Hintergrund aus dem Editor. Die gerenderte Karte
+       bleibt erhalten; bei einer geänderten Karte werden nur die Zellen neu gezeichnet, die sich
+       unterscheiden. Fertige Hintergründe werden nach Level-Hash gecacht – ein bereits bekanntes
+       Level (z. B. nach einem Portal-Effekt) kostet keinen Neuaufbau, nur den Blit ins Bild.
+       Ergebnis ist eine deckende Surface im Display-Format (schnelle Vollbild-Blits).
+"""
+
+from collections import OrderedDict
+
+import pygame
+from config import GRID_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT
+from modules.atlas import SpriteBatch, atlas_tile
+
+LEVEL_BASE_COLOR = (0, 0, 0)   # unter leeren/transparenten Zellen
+LEVEL_CACHE_SIZE = 4           # gecachte Hintergründe (je ~5 MB bei 1350x930)
+
+
+def level_key(level_map):
+    """Unveränderlicher Schnappschuss der Karte – dient als Level-Hash im Cache."""
+    return tuple(tuple(row) for row in level_map)
+
+
+class LevelCompositor:
+    def __init__(self, size=(WINDOW_WIDTH, WINDOW_HEIGHT), cell=GRID_SIZE,
+                 base_color=LEVEL_BASE_COLOR, cache_size=LEVEL_CACHE_SIZE):
+        self.size = size
+        self.cell = cell
+        self.base_color = base_color
+        self.cache_size = cache_size
+        self.cache = OrderedDict()   # level_key -> deckende Surface
+        self.key = None              # Karte, die `surface` zeigt
+        self.surface = None
+        self.cells_drawn = 0         # im letzten compose() neu gezeichnete Zellen (Debug)
+
+    def compose(self, level_map):
+        """Hintergrund für `level_map` liefern (gecacht oder aus dem letzten Stand abgeleitet)."""
+        key = level_key(level_map)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+            self.key, self.surface = key, cached
+            self.cells_drawn = 0
+            return cached
+
+        if self.surface is None or self.surface.get_size() != tuple(self.size):
+            surface = self._new_surface()
+            changed = [(x, y) for y, row in enumerate(key) for x, tile in enumerate(row) if tile]
+        else:
+            # Gecachte Surface bleibt unverändert – Kopie (ein Blit), dann nur die Differenz zeichnen
+            surface = self.surface.copy()
+            changed = self._diff(self.key, key)
+        self._draw_cells(surface, key, changed)
+
+        self.key, self.surface = key, surface
+        self.cache[key] = surface
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return surface
+
+    def _new_surface(self):
+        surface = pygame.Surface(self.size)
+        if pygame.display.get_surface():
+            surface = surface.convert()
+        surface.fill(self.base_color)
+        return surface
+
+    @staticmethod
+    def _diff(old, new):
+        changed = []
+        height = max(len(old), len(new))
+        for y in range(height):
+            old_row = old[y] if y < len(old) else ()
+            new_row = new[y] if y < len(new) else ()
+            if old_row == new_row:
+                continue
+            for x in range(max(len(old_row), len(new_row))):
+                a = old_row[x] if x < len(old_row) else None
+                b = new_row[x] if x < len(new_row) else None
+                if a != b:
+                    changed.append((x, y))
+        return changed
+
+    def _draw_cells(self, surface, key, cells):
+        cell = self.cell
+        batch = SpriteBatch(surface)
+        for x, y in cells:
+            dest = (x * cell, y * cell)
+            surface.fill(self.base_color, (dest[0], dest[1], cell, cell))
+            tile = key[y][x] if y < len(key) and x < len(key[y]) else None
+            if tile:
+                entry = atlas_tile(tile)
+                if entry:
+                    batch.add_sprite(entry, dest)
+        batch.flush()
+        self.cells_drawn = len(cells)
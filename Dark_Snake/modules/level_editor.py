@@ -1,6 +1,8 @@
 # modules/level_editor.py – Finales UI-Layout mit breiterem, tieferem Tile-Container
-import os, json, pygame
+import pygame
 from config import GRID_WIDTH, GRID_HEIGHT, GRID_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT
+from modules.atlas import SpriteBatch, atlas_tile
+from modules.level_format import LEVEL_PATH, save_level, load_custom_level
 
 TOOLBAR_W = 200
 BTN_H = 28
@@ -10,6 +12,12 @@ TILE_ROW_H = 600
 SCROLL_TOP = 275
 MAP_TOP = SCROLL_TOP + TILE_ROW_H - 650  # damit Spielfeld darunter bleibt
 MAX_FAV = 8
+UNDO_MAX_CELLS = 200_000  # Obergrenze aller gespeicherten Zell-Deltas (älteste Einträge fallen raus)
+PALETTE_COLS = 5
+PALETTE_STEP_X = GRID_SIZE + 6
+PALETTE_STEP_Y = GRID_SIZE + 4
+PALETTE_AREA = pygame.Rect(0, SCROLL_TOP, TOOLBAR_W, TILE_ROW_H)
+PREVIEW_SIZE = (int(GRID_WIDTH * GRID_SIZE * ZOOM), int(GRID_HEIGHT * GRID_SIZE * ZOOM))
 
 
 COLOR_BG     = (25, 25, 25)
@@ -19,37 +27,52 @@ COLOR_TEXT   = (255, 255, 255)
 COLOR_SELECT = (255, 255, 0)
 COLOR_FRAME  = (120, 0, 120)
 
+# [KS_TAG: EDITOR_PREVIEW] – auf Zellgröße gezoomte Tiles, einmal pro (Tile, Größe) skaliert
+_ZOOMED_TILES = {}
+
+
+def preview_cell_rect(x, y):
+    """Rechteck der Zelle (x, y) in der gezoomten Vorschau (gleiche Rundung wie _paint)."""
+    x0, y0 = int(x * GRID_SIZE * ZOOM), int(y * GRID_SIZE * ZOOM)
+    return pygame.Rect(x0, y0, int((x + 1) * GRID_SIZE * ZOOM) - x0, int((y + 1) * GRID_SIZE * ZOOM) - y0)
+
+
+def zoomed_tile(tiles, name, size):
+    key = (name, size)
+    if key not in _ZOOMED_TILES:
+        image = tiles.get(name)
+        _ZOOMED_TILES[key] = pygame.transform.scale(image, size) if image else None
+    return _ZOOMED_TILES[key]
+
 class LevelEditor:
     def __init__(self, game):
         self.game = game
         self.active = False
         self.drawing = False
         self.tiles = self._load_tiles()
-        self.current_tile = list(self.tiles.keys())[0] if self.tiles else None
+        self.tile_keys = list(self.tiles.keys())  # Reihenfolge der Palette
+        self.current_tile = self.tile_keys[0] if self.tile_keys else None
         self.map = [[None for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        # [KS_TAG: EDITOR_UNDO] Einträge: (Name, ((x, y, alt, neu), ...)) – nur geänderte Zellen
         self.undo_stack = []
         self.redo_stack = []
+        self.undo_cells = 0      # Summe der Deltas im Undo-Stack
+        self.stroke = None       # laufender Malstrich: {(x, y): alter Wert}
         self.favorites = []
         self.scroll = 0
         self.font = pygame.font.SysFont("Arial", 15)
         self.info = ""
         self.buttons = self._make_buttons()
         self.tile_scroll_offset = 0
+        # Persistente Kartenvorschau: nur geänderte Zellen werden neu gezeichnet
+        self.preview = pygame.Surface(PREVIEW_SIZE, pygame.SRCALPHA)
+        self.preview_dirty = set()
+        self.preview_full = True
 
     def _load_tiles(self):
-        from modules.graphics import load_image
-        path = "assets/graphics/tiles"
-        tiles = {}
-        if not os.path.isdir(path): return tiles
-        for fname in sorted(os.listdir(path)):
-            if not fname.lower().endswith(".png"): continue
-            key = os.path.splitext(fname)[0]
-            try:
-                img = load_image(fname, "tiles")
-                tiles[key] = pygame.transform.scale(img, (GRID_SIZE, GRID_SIZE))
-            except:
-                pass
-        return tiles
+        # Geteilte, lazy Tile-Sicht aus graphics: dekodiert wird erst, wenn ein Tile gezeichnet wird
+        from modules.graphics import TILE_IMAGES
+        return TILE_IMAGES
 
     def _make_buttons(self):
         labels = [
@@ -71,6 +94,7 @@ class LevelEditor:
         return buttons
 
     def toggle(self):
+        self._end_stroke()
         self.active = not self.active
         self.info = "Editor geöffnet" if self.active else ""
 
@@ -83,15 +107,20 @@ class LevelEditor:
                     if rect.collidepoint((mx, my)):
                         action()
                         return
-            elif mx > TOOLBAR_W or my > SCROLL_TOP:
+            elif PALETTE_AREA.collidepoint((mx, my)):
+                self._palette_click(self._palette_hit(mx, my), event.button)
+            elif (mx > TOOLBAR_W or my > SCROLL_TOP) and event.button == 1:
+                # Mausrad (Button 4/5) und Rechtsklick beginnen keinen neuen Strich
+                self._end_stroke()
                 self.drawing = True
+                self.stroke = {}
                 self._paint(mx, my)
-        elif event.type == pygame.MOUSEBUTTONUP:
-            self.drawing = False
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._end_stroke()
         elif event.type == pygame.MOUSEMOTION and self.drawing:
             self._paint(*event.pos)
         elif event.type == pygame.MOUSEWHEEL:
-            max_scroll = max(0, (len(self.tiles) // 5 - 6) * (GRID_SIZE + 4))
+            max_scroll = max(0, (len(self.tile_keys) // PALETTE_COLS - 6) * PALETTE_STEP_Y)
             self.tile_scroll_offset += event.y * 20
             self.tile_scroll_offset = max(-max_scroll, min(0, self.tile_scroll_offset))
 
@@ -99,8 +128,16 @@ class LevelEditor:
         gx = int((mx - TOOLBAR_W) / (GRID_SIZE * ZOOM))
         gy = int((my - MAP_TOP) / (GRID_SIZE * ZOOM))
         if 0 <= gx < GRID_WIDTH and 0 <= gy < GRID_HEIGHT and self.current_tile:
-            self._store_undo()
+            old = self.map[gy][gx]
+            if old == self.current_tile:
+                return
+            if self.stroke is None:
+                self._record("Malen", [(gx, gy, old, self.current_tile)])
+            else:
+                # Ganzer Strich = ein Undo-Eintrag; pro Zelle zählt der Wert vor dem Strich
+                self.stroke.setdefault((gx, gy), old)
             self.map[gy][gx] = self.current_tile
+            self.preview_dirty.add((gx, gy))
             self.info = f"{self.current_tile} gesetzt"
 
     def draw(self, screen):
@@ -115,88 +152,173 @@ class LevelEditor:
 
         pygame.draw.rect(screen, COLOR_FAV, (TOOLBAR_W, 0, WINDOW_WIDTH - TOOLBAR_W, FAV_ROW_H))
         for i, key in enumerate(self.favorites):
-            img = self.tiles.get(key)
-            if img:
+            entry = atlas_tile(key)
+            if entry:
                 x = TOOLBAR_W + 10 + i * (GRID_SIZE + 6)
                 y = 10
-                screen.blit(img, (x, y))
+                page, area = entry
+                screen.blit(page, (x, y), area)
                 pygame.draw.rect(screen, COLOR_SELECT, (x, y, GRID_SIZE, GRID_SIZE), 1)
 
-        scroll_area = pygame.Rect(0, SCROLL_TOP, TOOLBAR_W, TILE_ROW_H)
-        pygame.draw.rect(screen, (40, 40, 40), scroll_area)
-        pygame.draw.rect(screen, COLOR_FRAME, scroll_area, 2)
-        screen.set_clip(scroll_area)
-
-        keys = list(self.tiles.keys())
-        col_count = 5
-        for i, key in enumerate(keys):
-            col = i % col_count
-            row = i // col_count
-            x = 10 + col * (GRID_SIZE + 6)
-            y = SCROLL_TOP + 10 + row * (GRID_SIZE + 4) + self.tile_scroll_offset
-            img = self.tiles[key]
-            screen.blit(img, (x, y))
-            rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
+        pygame.draw.rect(screen, (40, 40, 40), PALETTE_AREA)
+        pygame.draw.rect(screen, COLOR_FRAME, PALETTE_AREA, 2)
+        screen.set_clip(PALETTE_AREA)
+
+        # [KS_TAG: EDITOR_PALETTE] Palette virtualisiert: nur Zeilen im sichtbaren Scrollbereich,
+        # Klicks/Favoriten laufen über handle_event statt Maus-Polling pro Tile
+        batch = SpriteBatch(screen)
+        selected_rect = None
+        first, last = self._palette_rows()
+        for i in range(first * PALETTE_COLS, min(len(self.tile_keys), last * PALETTE_COLS)):
+            key = self.tile_keys[i]
+            rect = self._palette_rect(i)
+            entry = atlas_tile(key)
+            if entry:
+                batch.add_sprite(entry, rect.topleft)
             if key == self.current_tile:
-                pygame.draw.rect(screen, COLOR_SELECT, rect, 2)
-            if rect.collidepoint(pygame.mouse.get_pos()) and pygame.mouse.get_pressed()[0]:
-                self.current_tile = key
-            if rect.collidepoint(pygame.mouse.get_pos()) and pygame.mouse.get_pressed()[2]:
-                if key not in self.favorites and len(self.favorites) < MAX_FAV:
-                    self.favorites.append(key)
-                    self.info = f"[DEBUG] {key} zu Favoriten hinzugefügt."
+                selected_rect = rect
+        batch.flush()
+        if selected_rect:
+            pygame.draw.rect(screen, COLOR_SELECT, selected_rect, 2)
         screen.set_clip(None)
 
-        surf = pygame.Surface((GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE), pygame.SRCALPHA)
-        for y, row in enumerate(self.map):
-            for x, tile in enumerate(row):
-                if tile:
-                    surf.blit(self.tiles[tile], (x * GRID_SIZE, y * GRID_SIZE))
-        scaled = pygame.transform.scale(surf, (int(GRID_WIDTH * GRID_SIZE * ZOOM), int(GRID_HEIGHT * GRID_SIZE * ZOOM)))
-        screen.blit(scaled, (TOOLBAR_W, MAP_TOP))
+        self._update_preview()
+        screen.blit(self.preview, (TOOLBAR_W, MAP_TOP))
 
         txt = self.font.render(self.info, True, COLOR_SELECT)
         screen.blit(txt, (10, WINDOW_HEIGHT - 24))
 
-    def _store_undo(self):
-        self.undo_stack.append(json.loads(json.dumps(self.map)))
+    def _palette_rect(self, index):
+        row, col = divmod(index, PALETTE_COLS)
+        return pygame.Rect(10 + col * PALETTE_STEP_X,
+                           SCROLL_TOP + 10 + row * PALETTE_STEP_Y + self.tile_scroll_offset,
+                           GRID_SIZE, GRID_SIZE)
+
+    def _palette_rows(self):
+        """Bereich [first, last) der Palettenzeilen, die im Scrollfenster sichtbar sind."""
+        top = -self.tile_scroll_offset - 10
+        first = max(0, (top - GRID_SIZE) // PALETTE_STEP_Y + 1)
+        last = (top + TILE_ROW_H + PALETTE_STEP_Y - 1) // PALETTE_STEP_Y
+        return first, last
+
+    def _palette_hit(self, mx, my):
+        """Tile unter der Mausposition (Palettenkoordinaten direkt umgerechnet) oder None."""
+        col, dx = divmod(mx - 10, PALETTE_STEP_X)
+        row, dy = divmod(my - SCROLL_TOP - 10 - self.tile_scroll_offset, PALETTE_STEP_Y)
+        if not (0 <= col < PALETTE_COLS and row >= 0 and dx < GRID_SIZE and dy < GRID_SIZE):
+            return None
+        index = row * PALETTE_COLS + col
+        return self.tile_keys[index] if index < len(self.tile_keys) else None
+
+    def _palette_click(self, key, button):
+        if key is None:
+            return
+        if button == 1:
+            self.current_tile = key
+        elif button == 3 and key not in self.favorites and len(self.favorites) < MAX_FAV:
+            self.favorites.append(key)
+            self.info = f"[DEBUG] {key} zu Favoriten hinzugefügt."
+
+    def _update_preview(self):
+        """Geänderte Zellen (oder nach Laden alles) in die gezoomte Vorschau übernehmen."""
+        if self.preview_full:
+            self.preview.fill((0, 0, 0, 0))
+            cells = [(x, y) for y, row in enumerate(self.map) for x, tile in enumerate(row) if tile]
+            self.preview_full = False
+        elif self.preview_dirty:
+            cells = self.preview_dirty
+        else:
+            return
+        blits = []
+        for x, y in cells:
+            rect = preview_cell_rect(x, y)
+            self.preview.fill((0, 0, 0, 0), rect)
+            tile = self.map[y][x]
+            image = zoomed_tile(self.tiles, tile, rect.size) if tile else None
+            if image:
+                # BLEND_RGBA_MAX auf geleerter Zelle = exakte Kopie inkl. Alpha
+                blits.append((image, rect, None, pygame.BLEND_RGBA_MAX))
+        self.preview.blits(blits, doreturn=False)
+        self.preview_dirty = set()
+
+    def _record(self, name, changes):
+        """Undo-Eintrag aus (x, y, alt, neu)-Deltas anlegen; Redo verfällt, Speicher bleibt begrenzt."""
+        changes = tuple(c for c in changes if c[2] != c[3])
+        if not changes:
+            return
+        self.undo_stack.append((name, changes))
+        self.undo_cells += len(changes)
+        self.redo_stack = []
+        while self.undo_cells > UNDO_MAX_CELLS and len(self.undo_stack) > 1:
+            self.undo_cells -= len(self.undo_stack.pop(0)[1])
+
+    def _end_stroke(self):
+        """Laufenden Strich als einen Undo-Eintrag abschließen; bis zum nächsten Drücken wird nicht gemalt."""
+        if self.stroke:
+            self._record("Malen", [(x, y, old, self.map[y][x]) for (x, y), old in self.stroke.items()])
+        self.stroke = None
+        self.drawing = False
+
+    def _apply(self, changes, index):
+        """Deltas anwenden: index 2 = alte Werte (Undo), 3 = neue Werte (Redo)."""
+        for change in changes:
+            x, y = change[0], change[1]
+            self.map[y][x] = change[index]
+            self.preview_dirty.add((x, y))
+
+    def _set_cells(self, name, cells):
+        tile = self.current_tile
+        self._record(name, [(x, y, self.map[y][x], tile) for x, y in cells])
+        for x, y in cells:
+            self.map[y][x] = tile
+            self.preview_dirty.add((x, y))
 
     def undo(self):
+        self._end_stroke()
         if self.undo_stack:
-            self.redo_stack.append(json.loads(json.dumps(self.map)))
-            self.map = self.undo_stack.pop()
-            self.info = "Undo"
+            name, changes = self.undo_stack.pop()
+            self.undo_cells -= len(changes)
+            self._apply(changes, 2)
+            self.redo_stack.append((name, changes))
+            self.info = f"Undo: {name}"
 
     def redo(self):
+        self._end_stroke()
         if self.redo_stack:
-            self.undo_stack.append(json.loads(json.dumps(self.map)))
-            self.map = self.redo_stack.pop()
-            self.info = "Redo"
+            name, changes = self.redo_stack.pop()
+            self._apply(changes, 3)
+            self.undo_stack.append((name, changes))
+            self.undo_cells += len(changes)
+            self.info = f"Redo: {name}"
 
     def fill_middle(self):
-        self._store_undo()
-        for y in range(1, GRID_HEIGHT-1):
-            for x in range(1, GRID_WIDTH-1):
-                self.map[y][x] = self.current_tile
+        self._set_cells("Mittelfeld", [(x, y) for y in range(1, GRID_HEIGHT - 1) for x in range(1, GRID_WIDTH - 1)])
         self.info = "Mittelfeld gefüllt"
 
     def set_border(self):
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if x == 0 or y == 0 or x == GRID_WIDTH - 1 or y == GRID_HEIGHT - 1:
-                    self.map[y][x] = self.current_tile
+        self._set_cells("Rand", [(x, y) for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)
+                                 if x == 0 or y == 0 or x == GRID_WIDTH - 1 or y == GRID_HEIGHT - 1])
         self.info = "Rand gesetzt"
 
     def save_map(self):
-        os.makedirs("assets/levels", exist_ok=True)
-        with open("assets/levels/custom_level.json", "w") as f:
-            json.dump(self.map, f)
+        save_level(LEVEL_PATH, self.map)  # Binärformat, siehe level_format.py
         self.info = "Level gespeichert"
 
     def load_map(self):
         try:
-            with open("assets/levels/custom_level.json") as f:
-                self.map = json.load(f)
+            loaded = load_custom_level()
+            if not loaded:
+                self.info = "Kein Level gefunden"
+                return
+            self._end_stroke()
+            if [len(row) for row in loaded] == [len(row) for row in self.map]:
+                # Laden = ein Undo-Eintrag mit den abweichenden Zellen
+                self._record("Laden", [(x, y, old, new) for y, (old_row, row) in enumerate(zip(self.map, loaded))
+                                       for x, (old, new) in enumerate(zip(old_row, row))])
+            else:
+                self.undo_stack, self.redo_stack, self.undo_cells = [], [], 0
+            self.map = loaded
+            self.preview_full = True
             self.info = "Level geladen"
         except:
             self.info = "Kein Level gefunden"
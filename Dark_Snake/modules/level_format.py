@@ -0,0 +1,180 @@
+"""
+Modul: level_format.py
+Zweck: Kompaktes, versioniertes Binärformat für Editor-Level (.dslv) statt JSON-Listen mit dem
+       Tile-Namen in jeder Zelle. Aufbau (Little Endian):
+           Kopf     "DSLV", Version (u8), Breite (u16), Höhe (u16), Ebenen (u8), Palettengröße (u16)
+           Palette  je Tile-Name: Länge (u16) + UTF-8 – Index 0 ist "leer" (None) und nicht gespeichert
+           Ebene    Anzahl verschiedener Zeilen (u16), je Zeile: Anzahl Runs (u16) + Runs als
+                    (Länge u16, Palettenindex u16); danach je Kartenzeile der Zeilenindex (u16)
+       Gleiche Zeilen (Rand, gefülltes Mittelfeld, leere Zeilen) werden nur einmal gespeichert und
+       beim Laden nur einmal dekodiert. Ebene 0 ist die Karte, die Spiel und Editor verwenden;
+       weitere Ebenen sind optional.
+
+Konvertierung alter JSON-Level (aus dem Ordner Dark_Snake):
+    python -m modules.level_format assets/levels/custom_level.json
+"""
+
+import json, os, struct, sys
+from array import array
+from itertools import groupby
+
+LEVEL_MAGIC = b"DSLV"
+LEVEL_VERSION = 1
+LEVEL_PATH = "assets/levels/custom_level.dslv"
+LEGACY_LEVEL_PATH = "assets/levels/custom_level.json"
+
+_HEADER = struct.Struct("<4sBHHBH")
+_U16 = struct.Struct("<H")
+
+
+def _u16_array(values=()):
+    data = array("H", values)
+    if data.itemsize != 2:
+        raise RuntimeError("array('H') ist auf dieser Plattform nicht 16 Bit breit")
+    return data
+
+
+def _le_bytes(values):
+    if sys.byteorder == "big":
+        values = _u16_array(values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_u16s(data, offset, count):
+    values = _u16_array()
+    values.frombytes(data[offset:offset + 2 * count])
+    if len(values) != count:
+        raise ValueError("Level-Datei ist zu kurz")
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, offset + 2 * count
+
+
+def encode_level(layers):
+    """Liste von Ebenen (je GRID_HEIGHT Zeilen mit Tile-Name oder None) -> bytes."""
+    if not layers or not layers[0]:
+        raise ValueError("Level ohne Ebenen/Zeilen kann nicht gespeichert werden")
+    height, width = len(layers[0]), len(layers[0][0])
+    for layer in layers:
+        if len(layer) != height or any(len(row) != width for row in layer):
+            raise ValueError(f"Alle Ebenen müssen {width}x{height} Zellen haben")
+
+    palette = {None: 0}
+    for layer in layers:
+        for row in layer:
+            for tile in row:
+                if tile not in palette:
+                    palette[tile] = len(palette)
+    if len(palette) > 0xFFFF or width > 0xFFFF or height > 0xFFFF or len(layers) > 0xFF:
+        raise ValueError("Level zu groß für das Format (uint16-Indizes, höchstens 255 Ebenen)")
+
+    out = [_HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, width, height, len(layers), len(palette) - 1)]
+    for name in list(palette)[1:]:
+        raw = str(name).encode("utf-8")
+        out += [_U16.pack(len(raw)), raw]
+    for layer in layers:
+        unique = {}
+        row_index = _u16_array(unique.setdefault(tuple(row), len(unique)) for row in layer)
+        out.append(_U16.pack(len(unique)))
+        for row in unique:
+            runs = _u16_array()
+            for index, group in groupby(palette[tile] for tile in row):
+                runs.extend((sum(1 for _ in group), index))
+            out.append(_U16.pack(len(runs) // 2))
+            out.append(_le_bytes(runs))
+        out.append(_le_bytes(row_index))
+    return b"".join(out)
+
+
+def decode_level(data):
+    """bytes -> Liste von Ebenen (Zeilenlisten mit Tile-Name oder None)."""
+    try:
+        return _decode(data)
+    except struct.error:
+        raise ValueError("Level-Datei ist zu kurz")
+
+
+def _decode(data):
+    magic, version, width, height, layer_count, palette_len = _HEADER.unpack_from(data)
+    if magic != LEVEL_MAGIC:
+        raise ValueError("Keine Dark-Snake-Level-Datei")
+    if version != LEVEL_VERSION:
+        raise ValueError(f"Level-Version {version} wird nicht unterstützt (erwartet {LEVEL_VERSION})")
+
+    offset = _HEADER.size
+    names = [None]
+    for _ in range(palette_len):
+        (length,) = _U16.unpack_from(data, offset)
+        offset += 2
+        names.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    singles = [[name] for name in names]
+    layers = []
+    for _ in range(layer_count):
+        (unique_count,) = _U16.unpack_from(data, offset)
+        offset += 2
+        unique = []
+        for _ in range(unique_count):
+            (run_count,) = _U16.unpack_from(data, offset)
+            runs, offset = _read_u16s(data, offset + 2, 2 * run_count)
+            row = []
+            try:
+                # Pro Run eine Listenmultiplikation – die Zellen selbst kopiert C
+                for count, index in zip(runs[0::2], runs[1::2]):
+                    row += singles[index] * count
+            except IndexError:
+                raise ValueError("Level-Datei verweist auf einen unbekannten Paletteneintrag")
+            if len(row) != width:
+                raise ValueError("Level-Datei ist beschädigt (Zeilenlänge passt nicht)")
+            unique.append(row)
+        row_index, offset = _read_u16s(data, offset, height)
+        try:
+            layers.append([unique[i][:] for i in row_index])
+        except IndexError:
+            raise ValueError("Level-Datei verweist auf eine unbekannte Zeile")
+    return layers
+
+
+def save_level(path, level_map, *extra_layers):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(encode_level([level_map, *extra_layers]))
+
+
+def load_level(path):
+    """Alle Ebenen einer .dslv-Datei."""
+    with open(path, "rb") as f:
+        return decode_level(f.read())
+
+
+def load_custom_level():
+    """Karte (Ebene 0) des Editor-Levels: Binärdatei bevorzugt, sonst altes JSON; None wenn keins da ist."""
+    if os.path.exists(LEVEL_PATH):
+        return load_level(LEVEL_PATH)[0]
+    if os.path.exists(LEGACY_LEVEL_PATH):
+        with open(LEGACY_LEVEL_PATH) as f:
+            return json.load(f)
+    return None
+
+
+def convert_json_level(json_path, out_path=None):
+    """Altes JSON-Level (Zeilenlisten) ins Binärformat umwandeln; liefert den Zielpfad."""
+    with open(json_path) as f:
+        level_map = json.load(f)
+    out_path = out_path or os.path.splitext(json_path)[0] + ".dslv"
+    save_level(out_path, level_map)
+    return out_path
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Dark-Snake JSON-Level ins Binärformat (.dslv) umwandeln")
+    parser.add_argument("json_path", nargs="?", default=LEGACY_LEVEL_PATH)
+    parser.add_argument("out_path", nargs="?")
+    args = parser.parse_args()
+    target = convert_json_level(args.json_path, args.out_path)
+    print(f"[INFO] {args.json_path} -> {target} ({os.path.getsize(args.json_path)} -> {os.path.getsize(target)} Bytes)")
@@ -0,0 +1,79 @@
+"""
+Modul: render_bench.py
+Zweck: Headless-Render-Benchmark für die Spielansicht. Startet ein Spiel, füllt es mit einer
+       festen Zahl lebender Dict-Projektile (Spieler- und Boss-Schüsse gemischt) und misst die
+       Zeit von Game.draw_game pro Frame. Die Projektile werden nur verschoben (am Rand
+       umgebrochen), damit ihre Anzahl über alle Frames konstant bleibt.
+
+Aufruf (aus dem Ordner Dark_Snake):
+    python -m modules.render_bench --projectiles 500 --frames 300
+"""
+
+import os
+# Kein Fenster und kein Ton nötig – vor dem ersten pygame-Import setzen
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random, statistics, time
+import pygame
+
+from config import GRID_WIDTH, GRID_HEIGHT
+
+
+def fill_projectiles(game, count, boss_share=0.5):
+    """`count` Projektile wie beim Spawn anlegen (Sprite-Handle inklusive)."""
+    from modules.game_core import PLAYER_PROJECTILE_SPRITE, BOSS_PROJECTILE_SPRITES
+    game.projectiles = []
+    for _ in range(count):
+        pos = (random.uniform(0, GRID_WIDTH - 1), random.uniform(0, GRID_HEIGHT - 1))
+        proj = {'pos': pos, 'prev_pos': pos, 'dir': (random.uniform(-1, 1), random.uniform(-1, 1)),
+                "effect": "damage", "sprite": PLAYER_PROJECTILE_SPRITE}
+        if random.random() < boss_share:
+            proj.update({"from_boss": True, "sprite": random.choice(BOSS_PROJECTILE_SPRITES)})
+        game.projectiles.append(proj)
+
+
+def move_projectiles(game):
+    for proj in game.projectiles:
+        x, y = proj['pos']
+        dx, dy = proj['dir']
+        proj['prev_pos'] = proj['pos']
+        proj['pos'] = ((x + dx) % GRID_WIDTH, (y + dy) % GRID_HEIGHT)
+
+
+def run_bench(projectiles=500, frames=300, warmup=10, seed=0):
+    """Liefert Frame-Zeiten von draw_game in Millisekunden (Mittel, Median, p95, Max)."""
+    pygame.init()
+    from modules.game import Game
+    from modules.sim_clock import SIM_CLOCK
+    random.seed(seed)
+    game = Game()
+    game.start_game(1)
+    fill_projectiles(game, projectiles)
+    SIM_CLOCK.alpha = 0.5  # Interpolation wie zwischen zwei Ticks
+    times = []
+    for frame in range(warmup + frames):
+        move_projectiles(game)
+        start = time.perf_counter()
+        game.draw_game()
+        if frame >= warmup:
+            times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return {
+        "projectiles": projectiles,
+        "frames": frames,
+        "mean_ms": round(statistics.fmean(times), 3),
+        "median_ms": round(statistics.median(times), 3),
+        "p95_ms": round(times[int(len(times) * 0.95) - 1], 3),
+        "max_ms": round(times[-1], 3),
+    }
+
+
+if __name__ == "__main__":
+    import argparse, json
+    parser = argparse.ArgumentParser(description="Dark-Snake Render-Benchmark (headless)")
+    parser.add_argument("--projectiles", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(run_bench(args.projectiles, args.frames, seed=args.seed), indent=2))
@@ -0,0 +1,147 @@
+"""
+Modul: rollout.py
+Zweck: Headless-Rollouts über einen multiprocessing-Pool. Jeder Worker spielt komplette
+       Spiele mit GameCore (Seed + Settings pro Spiel) und liefert Rohdaten; der Runner
+       fasst sie zu Statistiken zusammen (Score-Verteilung, erreichtes Level,
+       Todesursache, Zeit bis zum ersten Boss). Gedacht für Balance-Sweeps auf allen Kernen.
+
+Aufruf (aus dem Ordner Dark_Snake):
+    python -m modules.rollout --games 200 --difficulty 1.5 --boss-health 0.8
+"""
+
+import os
+# Worker brauchen weder Fenster noch Ton – vor dem ersten pygame-Import setzen
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Ohne eigene Signal-Handler von SDL lassen sich die Worker per SIGTERM beenden (sonst hängt der Pool)
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+
+import sys, random, statistics
+from collections import Counter
+from multiprocessing import get_context
+
+from modules.enums import GameState, Direction
+from modules.game_core import GameCore
+from modules.sim_clock import SIM_CLOCK
+
+# Settings, die ein Sweep pro Spiel überschreiben darf
+SWEEP_SETTINGS = ('difficulty', 'enemy_spawn_rate', 'boss_health_multiplier', 'projectile_speed_factor')
+DEFAULT_MAX_SECONDS = 600  # Spielzeit-Obergrenze pro Rollout (Simulationssekunden)
+
+
+def greedy_controller(core):
+    """Einfacher Bot: nächstes Item ansteuern, keine Umkehr, eigene Segmente meiden."""
+    snake = core.snake if core.player_count == 1 else core.snake1
+    if not snake:
+        return
+    head = snake[0]
+    current = core.snake_direction if core.player_count == 1 else core.snake_direction1
+    options = [d for d in Direction if d.value != (-current.value[0], -current.value[1])]
+    if core.items:
+        target = min(core.items, key=lambda i: abs(i.x - head[0]) + abs(i.y - head[1]))
+        options.sort(key=lambda d: abs(target.x - head[0] - d.value[0]) + abs(target.y - head[1] - d.value[1]))
+    for d in options:
+        cell = ((head[0] + d.value[0]) % core.occupancy.width, (head[1] + d.value[1]) % core.occupancy.height)
+        if not snake.hits_body(cell, skip_tail=True):
+            break
+    else:
+        d = options[0]
+    if core.player_count == 1:
+        core.next_direction = d
+    else:
+        core.next_direction1 = d
+
+
+def play_game(job):
+    """Ein Spiel headless bis Game Over oder Zeitlimit spielen (läuft im Worker)."""
+    seed, settings, players, max_seconds, controller = job
+    random.seed(seed)
+    SIM_CLOCK.reset()
+    core = GameCore()
+    core.settings.update({k: v for k, v in settings.items() if k in SWEEP_SETTINGS})
+    core.start_game(players)
+    max_ticks = int(max_seconds * SIM_CLOCK.tick_rate)
+    ticks = 0
+    while ticks < max_ticks and core.game_state in (GameState.GAME, GameState.BOSS_FIGHT):
+        if controller:
+            controller(core)
+        core.step()
+        ticks += 1
+    game_over = core.game_state == GameState.GAME_OVER
+    return {
+        "seed": seed,
+        "score": core.score,
+        "level": core.level,
+        "death_cause": core.death_cause if game_over else "timeout",
+        "first_boss_time": core.first_boss_time,
+        "sim_seconds": ticks / SIM_CLOCK.tick_rate,
+    }
+
+
+def _quiet_worker():
+    # Debug-Ausgaben der Spiellogik in den Workern unterdrücken
+    sys.stdout = open(os.devnull, "w")
+
+
+def summarize(results):
+    scores = sorted(r["score"] for r in results)
+    boss_times = [r["first_boss_time"] for r in results if r["first_boss_time"] is not None]
+    deciles = statistics.quantiles(scores, n=10, method="inclusive") if len(scores) > 1 else scores * 9
+    return {
+        "games": len(results),
+        "score": {
+            "mean": statistics.fmean(scores),
+            "median": statistics.median(scores),
+            "min": scores[0],
+            "max": scores[-1],
+            "p10": deciles[0],
+            "p90": deciles[-1],
+        },
+        "levels": dict(sorted(Counter(r["level"] for r in results).items())),
+        "death_causes": dict(Counter(r["death_cause"] for r in results).most_common()),
+        "first_boss": {
+            "reached": len(boss_times),
+            "mean_seconds": statistics.fmean(boss_times) if boss_times else None,
+            "median_seconds": statistics.median(boss_times) if boss_times else None,
+        },
+        "mean_sim_seconds": statistics.fmean(r["sim_seconds"] for r in results),
+    }
+
+
+def run_rollouts(seeds, settings=None, players=1, max_seconds=DEFAULT_MAX_SECONDS,
+                 controller=greedy_controller, processes=None, quiet=True):
+    """
+    Spiele für alle `seeds` auf `processes` Worker verteilen (Standard: alle Kerne).
+    `controller` muss picklebar sein (Funktion auf Modulebene). Liefert (summary, results).
+    """
+    settings = settings or {}
+    jobs = [(seed, settings, players, max_seconds, controller) for seed in seeds]
+    chunksize = max(1, len(jobs) // ((processes or os.cpu_count() or 1) * 4))
+    # "spawn": Worker starten ohne geerbten pygame/SDL-Zustand des Aufrufers
+    pool = get_context("spawn").Pool(processes, initializer=_quiet_worker if quiet else None)
+    try:
+        results = pool.map(play_game, jobs, chunksize=chunksize)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    return summarize(results), results
+
+
+if __name__ == "__main__":
+    import argparse, json
+    parser = argparse.ArgumentParser(description="Dark-Snake Headless-Rollouts")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="erster Seed; Spiele nutzen seed .. seed+games-1")
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--difficulty", type=float)
+    parser.add_argument("--enemy-spawn-rate", type=float)
+    parser.add_argument("--boss-health", type=float, dest="boss_health_multiplier")
+    parser.add_argument("--projectile-speed", type=float, dest="projectile_speed_factor")
+    args = parser.parse_args()
+    sweep = {k: getattr(args, k) for k in SWEEP_SETTINGS if getattr(args, k) is not None}
+    summary, _ = run_rollouts(range(args.seed, args.seed + args.games), sweep, args.players,
+                              args.max_seconds, processes=args.processes)
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
@@ -0,0 +1,63 @@
+"""
+Modul: sim_clock.py
+Zweck: Simulationsuhr mit fester Tickrate. Game.run sammelt die echte Frame-Zeit in einem
+       Akkumulator und führt daraus eine feste Anzahl Simulationsticks aus; alle Spiel-Timer
+       (Gegnerbewegung, Boss, AoE-Zonen, Effekte) lesen `sim_time()` statt `time.time()`.
+       Damit bleibt das Spielverhalten gleich, egal wie schnell gerendert wird.
+"""
+
+import time
+from config import SIM_TICK_RATE, MAX_SIM_TICKS_PER_FRAME
+
+
+class SimClock:
+    def __init__(self, tick_rate=SIM_TICK_RATE, max_ticks_per_frame=MAX_SIM_TICKS_PER_FRAME):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.tick = 0
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Anteil des nächsten Ticks für die Render-Interpolation (0..1)
+        self._last_real = None
+
+    def now(self):
+        """Simulationszeit in Sekunden (Tickzähler * Tickdauer)."""
+        return self.tick * self.dt
+
+    def advance(self):
+        self.tick += 1
+
+    def reset(self):
+        """Zurück auf Tick 0 (z. B. vor jedem Headless-Rollout für reproduzierbare Seeds)."""
+        self.tick = 0
+        self.pause()
+
+    def begin_frame(self):
+        """
+        Echte Zeit seit dem letzten Frame aufsammeln und die Anzahl fälliger Ticks liefern.
+        Bei starken Einbrüchen wird auf `max_ticks_per_frame` gekappt, statt die Simulation
+        hinterherlaufen zu lassen.
+        """
+        real = time.perf_counter()
+        if self._last_real is None:
+            self._last_real = real - self.dt
+        self.accumulator += real - self._last_real
+        self._last_real = real
+        self.accumulator = min(self.accumulator, self.max_ticks_per_frame * self.dt)
+        ticks = int(self.accumulator / self.dt)
+        self.accumulator -= ticks * self.dt
+        self.alpha = self.accumulator / self.dt
+        return ticks
+
+    def pause(self):
+        """Außerhalb des Spiels (Menü, Pause) keine echte Zeit nachholen."""
+        self._last_real = None
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+
+SIM_CLOCK = SimClock()
+
+
+def sim_time():
+    return SIM_CLOCK.now()
@@ -0,0 +1,137 @@
+"""
+Modul: snake_body.py
+Zweck: Schlangenkörper als deque plus gemeinsames Belegungsraster (Occupancy-Grid).
+       Kopf setzen, Schwanz entfernen und Selbstkollision kosten O(1); Spawn- und
+       Kollisionscode fragen das Raster direkt ab, statt Segmentlisten zu durchsuchen.
+       Das Raster führt zusätzlich einen Index aller freien Zellen, damit Items in O(1)
+       gespawnt werden können.
+"""
+
+import random
+from collections import deque
+from config import GRID_WIDTH, GRID_HEIGHT
+
+
+class OccupancyGrid:
+    """
+    Zählt pro Zelle, wie viele Objekte dort liegen: Schlangensegmente (snake, snake1 und
+    snake2 teilen sich ein Raster), Items und Gegner. Zähler statt Bits, da sich Objekte
+    überlappen dürfen (z. B. beim Respawn im 2-Spieler-Modus oder unter Unbesiegbarkeit).
+
+    Freie Zellen stehen in einem Swap-Remove-Array (`_free`), `_slot` merkt sich die
+    Position jeder Zelle darin (-1 = belegt). Belegen/Freigeben und Ziehen einer
+    zufälligen freien Zelle kosten damit O(1).
+    """
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.cells = [0] * (width * height)
+        self._free = list(range(width * height))
+        self._slot = list(range(width * height))
+
+    def add(self, cell):
+        i = cell[1] * self.width + cell[0]
+        if self.cells[i] == 0:
+            self._take(i)
+        self.cells[i] += 1
+
+    def remove(self, cell):
+        i = cell[1] * self.width + cell[0]
+        self.cells[i] -= 1
+        if self.cells[i] == 0:
+            self._release(i)
+
+    def _take(self, i):
+        slot = self._slot[i]
+        last = self._free.pop()
+        if last != i:
+            self._free[slot] = last
+            self._slot[last] = slot
+        self._slot[i] = -1
+
+    def _release(self, i):
+        self._slot[i] = len(self._free)
+        self._free.append(i)
+
+    def free_count(self):
+        return len(self._free)
+
+    def random_free_cell(self):
+        """Zufällige freie Zelle oder None, wenn das Spielfeld voll ist."""
+        if not self._free:
+            return None
+        i = random.choice(self._free)
+        return (i % self.width, i // self.width)
+
+    def is_occupied(self, cell):
+        return self.cells[cell[1] * self.width + cell[0]] > 0
+
+    def is_free(self, cell):
+        return self.cells[cell[1] * self.width + cell[0]] == 0
+
+
+class SnakeBody:
+    """
+    Segmente einer Schlange, Kopf an Index 0. Verhält sich beim Lesen wie die frühere
+    Liste (Index, Iteration, len, `in`), hält aber Raster und eigene Zellzähler synchron.
+    """
+    def __init__(self, grid, start=None):
+        self.grid = grid
+        self._cells = deque()
+        self._counts = {}
+        if start is not None:
+            self.push_head(start)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __iter__(self):
+        return iter(self._cells)
+
+    def __getitem__(self, index):
+        return self._cells[index]
+
+    def __setitem__(self, index, cell):
+        # z. B. Teleport: snake[0] = (x, y)
+        self._forget(self._cells[index])
+        self._cells[index] = cell
+        self._remember(cell)
+
+    def __contains__(self, cell):
+        return cell in self._counts
+
+    def _remember(self, cell):
+        self._counts[cell] = self._counts.get(cell, 0) + 1
+        self.grid.add(cell)
+
+    def _forget(self, cell):
+        count = self._counts[cell] - 1
+        if count:
+            self._counts[cell] = count
+        else:
+            del self._counts[cell]
+        self.grid.remove(cell)
+
+    def push_head(self, cell):
+        self._cells.appendleft(cell)
+        self._remember(cell)
+
+    def pop_tail(self):
+        cell = self._cells.pop()
+        self._forget(cell)
+        return cell
+
+    def hits_body(self, cell, skip_head=False, skip_tail=False):
+        """Liegt `cell` auf einem eigenen Segment (optional ohne Kopf bzw. Schwanz)?"""
+        count = self._counts.get(cell, 0)
+        if count and skip_head and self._cells[0] == cell:
+            count -= 1
+        if count and skip_tail and self._cells[-1] == cell:
+            count -= 1
+        return count > 0
+
+    def reset(self, start):
+        """Respawn: alle Segmente aus dem Raster nehmen und mit einem Segment neu beginnen."""
+        while self._cells:
+            self.pop_tail()
+        self.push_head(start)
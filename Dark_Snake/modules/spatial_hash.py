@@ -0,0 +1,55 @@
+"""
+Modul: spatial_hash.py
+Zweck: Uniformer Spatial-Hash (Raster aus Pixel-Zellen) für die Kollisionsprüfungen in
+       Game.update. Objekte werden einmal pro Tick mit ihrem Rechteck eingetragen, Abfragen
+       prüfen nur Objekte aus den überdeckten Zellen – die Kosten skalieren mit den Paaren
+       in der Nähe statt mit allen Paaren.
+"""
+
+from config import GRID_SIZE
+
+
+class SpatialHash:
+    def __init__(self, cell_size=GRID_SIZE * 2):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self._order = 0
+        self._removed = set()
+
+    def clear(self):
+        self.buckets.clear()
+        self._order = 0
+        self._removed.clear()
+
+    def _cells(self, rect):
+        cs = self.cell_size
+        x0, y0 = rect.left // cs, rect.top // cs
+        x1 = max(x0, (rect.right - 1) // cs)
+        y1 = max(y0, (rect.bottom - 1) // cs)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def insert(self, obj, rect):
+        entry = (self._order, obj, rect)
+        self._order += 1
+        for key in self._cells(rect):
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                self.buckets[key] = [entry]
+            else:
+                bucket.append(entry)
+
+    def remove(self, obj):
+        """Objekt bis zum nächsten Neuaufbau aus allen Abfragen ausblenden."""
+        self._removed.add(id(obj))
+
+    def query(self, rect):
+        """Alle eingetragenen Objekte, deren Rechteck `rect` schneidet – in Einfügereihenfolge."""
+        hits = {}
+        for key in self._cells(rect):
+            for entry in self.buckets.get(key, ()):
+                order, obj, obj_rect = entry
+                if order not in hits and id(obj) not in self._removed and obj_rect.colliderect(rect):
+                    hits[order] = obj
+        return [hits[order] for order in sorted(hits)]
@@ -1,7 +1,37 @@
 
 import pygame
+from collections import OrderedDict
 from config import DARK_GREY, WHITE, ORANGE, PURPLE, FONT_SMALL, FONT_MEDIUM, WINDOW_WIDTH, WINDOW_HEIGHT
-from modules.graphics import PLAY_BUTTON_IMG  # z. B. für Skalierung im Optionsmenü
+
+# [KS_TAG: TEXT_CACHE] – Schriften nur einmal bauen, gerenderte Texte per LRU wiederverwenden
+TEXT_CACHE_SIZE = 256
+_FONT_CACHE = {}
+_TEXT_CACHE = OrderedDict()
+
+
+def get_font(size, name='Arial', bold=False):
+    key = (name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = pygame.font.SysFont(name, size, bold=bold)
+    return font
+
+
+def render_text(text, color, size, name='Arial', bold=False):
+    """
+    Wie SysFont(name, size, bold).render(text, True, color), aber gecacht: gleiche Texte
+    (z. B. "Level: 3") werden nur einmal gerendert. Die Surface ist geteilt – nicht verändern.
+    """
+    key = (name, size, bold, text, tuple(color))
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        surf = _TEXT_CACHE[key] = get_font(size, name, bold).render(text, True, color)
+        if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surf
+
 
 class Button:
     def __init__(self, x, y, width, height, text, color=DARK_GREY, text_color=WHITE, action=None, image=None):
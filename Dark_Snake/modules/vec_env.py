@@ -0,0 +1,294 @@
+"""
+Modul: vec_env.py
+Zweck: Vektorisierte Mehrfach-Umgebung (gym-artig) für Bots. Steppt N unabhängige
+       Schlangen-Spiele gleichzeitig mit NumPy-Arrays und liefert Beobachtungen,
+       Belohnungen und Done-Flags als Arrays.
+
+Regeln: Bewegung mit Wrap-around und Selbstkollision (Schwanzzelle zählt nicht) wie in
+GameCore.update, Items über die Regeltabellen aus modules/game_core.py (ITEM_REWARDS,
+SPAWN_ITEM_TYPES, LOOT_ITEM_TYPES, dice_outcome, …). Ein Env-Schritt entspricht einem
+Schlangenschritt. Boss, Portale, Projektile und AoE-Zonen sind nicht modelliert; Gegner
+(aus SPAWN_BOLBU) laufen zufällig wie NormalEnemy und kosten bei Kontakt 10 HP.
+
+Benötigt numpy. Beispiel:
+    env = VecSnakeEnv(1024, seed=0)
+    obs = env.reset()
+    obs, rewards, dones = env.step(actions)   # actions: int-Array (0=UP, 1=DOWN, 2=LEFT, 3=RIGHT)
+"""
+
+import numpy as np
+
+from config import GRID_WIDTH, GRID_HEIGHT, START_SPEED
+from modules.enums import Direction, ItemType
+from modules.game_core import (ITEM_REWARDS, SPAWN_ITEM_TYPES, LOOT_ITEM_TYPES, BOLBU_SPAWN_RANGE,
+                               BOLBU_SPAWN_SCORE, ITEM_SPAWN_CHANCE, MAX_ITEMS, dice_outcome)
+
+# Aktionen = Reihenfolge von Direction (UP, DOWN, LEFT, RIGHT)
+DIRECTIONS = list(Direction)
+DX = np.array([d.value[0] for d in DIRECTIONS], dtype=np.int64)
+DY = np.array([d.value[1] for d in DIRECTIONS], dtype=np.int64)
+OPPOSITE = np.array([DIRECTIONS.index(Direction((-d.value[0], -d.value[1]))) for d in DIRECTIONS], dtype=np.int64)
+
+# Item-Codes = Index in ITEM_TYPES; Tabellen aus den Regeln in game_core abgeleitet
+ITEM_TYPES = list(ItemType)
+ITEM_CODE = {t: i for i, t in enumerate(ITEM_TYPES)}
+ITEM_SCORE = np.array([ITEM_REWARDS.get(t, (0, 0))[0] for t in ITEM_TYPES], dtype=np.int64)
+ITEM_EXP = np.array([ITEM_REWARDS.get(t, (0, 0))[1] for t in ITEM_TYPES], dtype=np.int64)
+SPAWN_CODES = np.array([ITEM_CODE[t] for t in SPAWN_ITEM_TYPES], dtype=np.int64)
+LOOT_CODES = np.array([ITEM_CODE[t] for t in LOOT_ITEM_TYPES], dtype=np.int64)
+FOOD = ITEM_CODE[ItemType.FOOD]
+LOOT_BOX = ITEM_CODE[ItemType.LOOT_BOX]
+DICE_EVENT = ITEM_CODE[ItemType.DICE_EVENT]
+SPAWN_BOLBU = ITEM_CODE[ItemType.SPAWN_BOLBU]
+# Würfel: Index = Wurf (1..20), Erfahrung -1 = bis zum Level-Up auffüllen
+DICE_SCORE = np.zeros(21, dtype=np.int64)
+DICE_EXP = np.zeros(21, dtype=np.int64)
+for _roll in range(1, 21):
+    _, _score, _exp = dice_outcome(_roll)
+    DICE_SCORE[_roll] = _score
+    DICE_EXP[_roll] = -1 if _exp is None else _exp
+
+# Beobachtungs-Codes je Zelle
+OBS_EMPTY, OBS_BODY, OBS_HEAD, OBS_ENEMY, OBS_ITEM = 0, 1, 2, 3, 4  # Item: OBS_ITEM + Item-Code
+
+MAX_ENEMIES = 8
+ENEMY_MOVE_CHANCE = 1.0 / START_SPEED  # NormalEnemy: ~1 Feld/s, Schlange: START_SPEED Felder/s
+ENEMY_DAMAGE = 10
+START_LIVES = 3
+START_HEALTH = 100
+
+
+class VecSnakeEnv:
+    def __init__(self, num_envs, width=GRID_WIDTH, height=GRID_HEIGHT, difficulty=1.0, seed=None):
+        self.num_envs = n = num_envs
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.difficulty = difficulty
+        self.rng = np.random.default_rng(seed)
+        self._rows = np.arange(n)
+        self.start_cell = (height // 2) * width + width // 2
+        # Schlange als Ringpuffer von Zellindizes (Kopf = head_ptr, Schwanz = tail_ptr)
+        self.body = np.zeros((n, self.cells), dtype=np.int64)
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.tail_ptr = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.occ = np.zeros((n, self.cells), dtype=np.int16)        # Schlangensegmente pro Zelle
+        self.item_at = np.full((n, self.cells), -1, dtype=np.int16)  # Item-Code pro Zelle (-1 = leer)
+        self.item_count = np.zeros(n, dtype=np.int64)
+        self.enemy_cell = np.full((n, MAX_ENEMIES), -1, dtype=np.int64)
+        self.enemy_occ = np.zeros((n, self.cells), dtype=np.int16)
+        self.dirs = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.experience = np.zeros(n, dtype=np.int64)
+        self.exp_to_next = np.zeros(n, dtype=np.int64)
+        self.level = np.zeros(n, dtype=np.int64)
+        self.health = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.steps = np.zeros(n, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Reset
+    # ------------------------------------------------------------------
+    def reset(self):
+        self._reset_envs(self._rows)
+        return self.observe()
+
+    def _reset_envs(self, idx):
+        if not len(idx):
+            return
+        self.occ[idx] = 0
+        self.item_at[idx] = -1
+        self.item_count[idx] = 0
+        self.enemy_cell[idx] = -1
+        self.enemy_occ[idx] = 0
+        self.score[idx] = 0
+        self.experience[idx] = 0
+        self.exp_to_next[idx] = 100
+        self.level[idx] = 1
+        self.lives[idx] = START_LIVES
+        self.steps[idx] = 0
+        self._respawn_snakes(idx)
+        self._spawn_items(idx, np.full(len(idx), FOOD))
+
+    def _respawn_snakes(self, idx):
+        """Wie handle_self_collision/handle_death: eine Zelle in der Mitte, Richtung RIGHT, volle HP."""
+        self.occ[idx] = 0
+        self.body[idx, 0] = self.start_cell
+        self.head_ptr[idx] = 0
+        self.tail_ptr[idx] = 0
+        self.length[idx] = 1
+        self.occ[idx, self.start_cell] = 1
+        self.dirs[idx] = DIRECTIONS.index(Direction.RIGHT)
+        self.health[idx] = START_HEALTH
+
+    # ------------------------------------------------------------------
+    # Spawns
+    # ------------------------------------------------------------------
+    def _free_cells(self, idx, tries=16):
+        """Zufällige freie Zelle je Env (-1, falls nach `tries` Versuchen keine gefunden)."""
+        cells = np.full(len(idx), -1, dtype=np.int64)
+        pending = np.arange(len(idx))
+        for _ in range(tries):
+            if not len(pending):
+                break
+            cand = self.rng.integers(0, self.cells, len(pending))
+            rows = idx[pending]
+            ok = (self.occ[rows, cand] == 0) & (self.item_at[rows, cand] < 0) & (self.enemy_occ[rows, cand] == 0)
+            cells[pending[ok]] = cand[ok]
+            pending = pending[~ok]
+        return cells
+
+    def _spawn_items(self, idx, codes):
+        cells = self._free_cells(idx)
+        ok = cells >= 0
+        self.item_at[idx[ok], cells[ok]] = codes[ok]
+        self.item_count[idx[ok]] += 1
+
+    def _spawn_enemies(self, idx, counts):
+        for k in range(int(counts.max(initial=0))):
+            rows = idx[counts > k]
+            if not len(rows):
+                break
+            slot = np.argmax(self.enemy_cell[rows] < 0, axis=1)
+            has_slot = self.enemy_cell[rows, slot] < 0
+            rows, slot = rows[has_slot], slot[has_slot]
+            cells = self._free_cells(rows)
+            ok = cells >= 0
+            rows, slot, cells = rows[ok], slot[ok], cells[ok]
+            self.enemy_cell[rows, slot] = cells
+            self.enemy_occ[rows, cells] += 1
+
+    def _move_enemies(self):
+        active = self.enemy_cell >= 0
+        moving = active & (self.rng.random(active.shape) < ENEMY_MOVE_CHANCE)
+        rows, slots = np.nonzero(moving)
+        if not len(rows):
+            return
+        old = self.enemy_cell[rows, slots]
+        x = np.clip(old % self.width + self.rng.integers(-1, 2, len(old)), 0, self.width - 1)
+        y = np.clip(old // self.width + self.rng.integers(-1, 2, len(old)), 0, self.height - 1)
+        new = y * self.width + x
+        np.subtract.at(self.enemy_occ, (rows, old), 1)
+        np.add.at(self.enemy_occ, (rows, new), 1)
+        self.enemy_cell[rows, slots] = new
+
+    # ------------------------------------------------------------------
+    # Schritt
+    # ------------------------------------------------------------------
+    def step(self, actions):
+        """
+        Einen Schlangenschritt in allen Envs ausführen. Umkehr in die Gegenrichtung wird
+        wie in Game.handle_events ignoriert. Beendete Envs werden automatisch zurückgesetzt;
+        Endstände stehen danach in `self.final_score`.
+        """
+        rows = self._rows
+        actions = np.asarray(actions, dtype=np.int64)
+        self.dirs = np.where(actions == OPPOSITE[self.dirs], self.dirs, actions)
+        prev_score = self.score.copy()
+        self.steps += 1
+
+        head = self.body[rows, self.head_ptr]
+        tail = self.body[rows, self.tail_ptr]
+        new = ((head // self.width + DY[self.dirs]) % self.height) * self.width + \
+              (head % self.width + DX[self.dirs]) % self.width
+        # Selbstkollision wie SnakeBody.hits_body(new_head, skip_tail=True)
+        hit_self = (self.occ[rows, new] - (new == tail)) > 0
+
+        # Kopf setzen
+        mv = rows[~hit_self]
+        new_mv = new[~hit_self]
+        self.head_ptr[mv] = (self.head_ptr[mv] + 1) % self.cells
+        self.body[mv, self.head_ptr[mv]] = new_mv
+        self.occ[mv, new_mv] += 1
+        self.length[mv] += 1
+
+        # Item aufnehmen (jedes Item lässt die Schlange wachsen) oder Schwanz entfernen
+        code = self.item_at[mv, new_mv].astype(np.int64)
+        eaten = code >= 0
+        grow_not = mv[~eaten]
+        t = self.tail_ptr[grow_not]
+        self.occ[grow_not, self.body[grow_not, t]] -= 1
+        self.tail_ptr[grow_not] = (t + 1) % self.cells
+        self.length[grow_not] -= 1
+        if eaten.any():
+            self._pickup(mv[eaten], new_mv[eaten], code[eaten])
+
+        # Zufälliger Item-Spawn pro Schritt (wie in GameCore.update)
+        spawn = (self.rng.random(len(rows)) < ITEM_SPAWN_CHANCE * self.difficulty) & (self.item_count < MAX_ITEMS)
+        if spawn.any():
+            idx = rows[spawn]
+            self._spawn_items(idx, SPAWN_CODES[self.rng.integers(0, len(SPAWN_CODES), len(idx))])
+
+        # Gegner bewegen, Kontakt mit dem Kopf kostet HP
+        self._move_enemies()
+        head = self.body[rows, self.head_ptr]
+        self.health -= ENEMY_DAMAGE * (self.enemy_occ[rows, head] > 0)
+
+        # Leben verlieren (Selbstkollision oder HP leer) → Respawn bzw. Game Over
+        lost = hit_self | (self.health <= 0)
+        self.lives -= lost
+        respawn = rows[lost & (self.lives > 0)]
+        if len(respawn):
+            self._respawn_snakes(respawn)
+
+        rewards = (self.score - prev_score).astype(np.float32)
+        dones = self.lives <= 0
+        self.final_score = np.where(dones, self.score, -1)
+        self._reset_envs(rows[dones])
+        return self.observe(), rewards, dones
+
+    def _pickup(self, idx, cells, codes):
+        """Item-Regeln aus game_core, vektorisiert (Reihenfolge wie handle_item_pickup)."""
+        self.item_at[idx, cells] = -1
+        self.item_count[idx] -= 1
+        score = ITEM_SCORE[codes].copy()
+        exp = ITEM_EXP[codes].copy()
+        # Lootbox: Inhalt ziehen (kann erneut eine Lootbox sein)
+        resolved = codes.copy()
+        loot = resolved == LOOT_BOX
+        while loot.any():
+            drawn = LOOT_CODES[self.rng.integers(0, len(LOOT_CODES), int(loot.sum()))]
+            resolved[loot] = drawn
+            score[loot] += ITEM_SCORE[drawn]
+            exp[loot] += ITEM_EXP[drawn]
+            loot = resolved == LOOT_BOX
+        self.score[idx] += score
+        self.experience[idx] += exp
+        # Futter respawnt sofort
+        food = idx[resolved == FOOD]
+        if len(food):
+            self._spawn_items(food, np.full(len(food), FOOD))
+        # Würfel-Event
+        dice = resolved == DICE_EVENT
+        if dice.any():
+            d_idx = idx[dice]
+            roll = self.rng.integers(1, 21, len(d_idx))
+            self.score[d_idx] += DICE_SCORE[roll]
+            fill = DICE_EXP[roll] < 0
+            self.experience[d_idx] = np.where(fill, self.exp_to_next[d_idx], self.experience[d_idx] + DICE_EXP[roll])
+        # Bolbu-Kapsel: 1–3 Gegner
+        bolbu = resolved == SPAWN_BOLBU
+        if bolbu.any():
+            b_idx = idx[bolbu]
+            counts = self.rng.integers(BOLBU_SPAWN_RANGE[0], BOLBU_SPAWN_RANGE[1] + 1, len(b_idx))
+            self.score[b_idx] += BOLBU_SPAWN_SCORE * counts
+            self._spawn_enemies(b_idx, counts)
+        # Level-Up wie GameCore.level_up (ohne Boss)
+        up = idx[self.experience[idx] >= self.exp_to_next[idx]]
+        if len(up):
+            self.level[up] += 1
+            self.experience[up] -= self.exp_to_next[up]
+            self.exp_to_next[up] = (self.exp_to_next[up] * 3) // 2
+            self.score[up] += 50 * self.level[up]
+
+    # ------------------------------------------------------------------
+    # Beobachtung
+    # ------------------------------------------------------------------
+    def observe(self):
+        """uint8-Array (N, H, W) mit OBS_*-Codes; Items als OBS_ITEM + Item-Code."""
+        obs = np.where(self.item_at >= 0, self.item_at + OBS_ITEM, OBS_EMPTY).astype(np.uint8)
+        obs[self.enemy_occ > 0] = OBS_ENEMY
+        obs[self.occ > 0] = OBS_BODY
+        obs[self._rows, self.body[self._rows, self.head_ptr]] = OBS_HEAD
+        return obs.reshape(self.num_envs, self.height, self.width)
@@ -0,0 +1,14 @@
+"""
+Gemeinsame Test-Einrichtung: Module werden wie im Spiel aus dem Ordner Dark_Snake importiert
+(config, modules.*); pygame läuft ohne Fenster und Ton.
+"""
+
+import os, sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+# Asset-Pfade im Spiel sind relativ zu Dark_Snake
+os.chdir(GAME_DIR)
@@ -0,0 +1,132 @@
+import pygame
+import pytest
+
+import modules.level_editor as level_editor
+from config import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT
+from modules.level_editor import LevelEditor, MAP_TOP, TOOLBAR_W, ZOOM
+
+
+class DummyGame:
+    pass
+
+
+@pytest.fixture
+def editor(monkeypatch):
+    pygame.init()
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (0, 0))
+    ed = LevelEditor(DummyGame())
+    ed.active = True
+    ed.current_tile = "stone"
+    return ed
+
+
+def cell_pos(x, y):
+    return (int(TOOLBAR_W + (x + 0.5) * GRID_SIZE * ZOOM), int(MAP_TOP + (y + 0.5) * GRID_SIZE * ZOOM))
+
+
+def stroke(ed, monkeypatch, cells):
+    """Malstrich wie mit der Maus: Drücken, Bewegen über alle Zellen, Loslassen."""
+    points = [cell_pos(x, y) for x, y in cells]
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: points[0])
+    ed.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=points[0]))
+    for pos in points[1:]:
+        ed.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(1, 0, 0)))
+    ed.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=points[-1]))
+
+
+def snapshot(ed):
+    return [row[:] for row in ed.map]
+
+
+def test_stroke_is_one_undo_entry(editor, monkeypatch):
+    before = snapshot(editor)
+    stroke(editor, monkeypatch, [(2, 3), (3, 3), (4, 3), (3, 3)])
+    after = snapshot(editor)
+
+    assert len(editor.undo_stack) == 1
+    name, changes = editor.undo_stack[0]
+    assert name == "Malen"
+    assert sorted((x, y) for x, y, _, _ in changes) == [(2, 3), (3, 3), (4, 3)]
+    assert editor.undo_cells == 3
+
+    editor.undo()
+    assert editor.map == before
+    assert editor.undo_stack == [] and len(editor.redo_stack) == 1
+    editor.redo()
+    assert editor.map == after
+    assert editor.redo_stack == [] and editor.undo_cells == 3
+
+
+def test_stroke_keeps_value_from_before_the_stroke(editor, monkeypatch):
+    stroke(editor, monkeypatch, [(1, 1)])
+    editor.current_tile = "lava"
+    stroke(editor, monkeypatch, [(1, 1), (2, 1)])
+    editor.undo()
+    assert editor.map[1][1] == "stone" and editor.map[1][2] is None
+
+
+def test_bulk_operations_and_redo_reset(editor):
+    editor.fill_middle()
+    editor.current_tile = "wall"
+    editor.set_border()
+    assert [name for name, _ in editor.undo_stack] == ["Mittelfeld", "Rand"]
+    assert editor.undo_cells == (GRID_WIDTH - 2) * (GRID_HEIGHT - 2) + 2 * (GRID_WIDTH + GRID_HEIGHT) - 4
+
+    editor.undo()
+    assert editor.map[0][0] is None and editor.map[1][1] == "stone"
+    editor.current_tile = "lava"
+    editor.set_border()
+    assert editor.redo_stack == []
+
+
+def test_undo_cap_evicts_oldest_entry(editor, monkeypatch):
+    border_cells = 2 * (GRID_WIDTH + GRID_HEIGHT) - 4
+    monkeypatch.setattr(level_editor, "UNDO_MAX_CELLS", 2 * border_cells)
+    for tile in ("a", "b", "c"):
+        editor.current_tile = tile
+        editor.set_border()
+
+    assert len(editor.undo_stack) == 2
+    assert editor.undo_cells == 2 * border_cells
+    editor.undo()
+    editor.undo()
+    editor.undo()  # ältester Eintrag wurde verworfen – Rand bleibt "a"
+    assert editor.map[0][0] == "a"
+
+
+def test_load_is_undoable(editor, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    editor.set_border()
+    editor.save_map()
+    editor.undo()
+    editor.load_map()
+    assert editor.map[0][0] == "stone"
+    assert editor.undo_stack[-1][0] == "Laden"
+    editor.undo()
+    assert editor.map[0][0] is None
+
+
+def test_wheel_and_undo_do_not_break_a_stroke(editor, monkeypatch):
+    start = cell_pos(2, 3)
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: start)
+    editor.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=start))
+    editor.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=cell_pos(3, 3), rel=(0, 0), buttons=(1, 0, 0)))
+    # Mausrad-Tick während des Strichs: SDL2 schickt Button 4 down/up
+    editor.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=4, pos=cell_pos(3, 3)))
+    editor.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, button=4, pos=cell_pos(3, 3)))
+    editor.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=cell_pos(4, 3), rel=(0, 0), buttons=(1, 0, 0)))
+    editor.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=cell_pos(4, 3)))
+    assert len(editor.undo_stack) == 1
+    editor.undo()
+    assert editor.map[3][2:5] == [None, None, None]
+
+    # Undo mitten im Strich schließt ihn ab – weitere Bewegung malt nicht mehr einzeln weiter
+    editor.redo()
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: cell_pos(5, 5))
+    editor.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=cell_pos(5, 5)))
+    editor.undo()
+    assert not editor.drawing and editor.map[5][5] is None
+    for x in (6, 7, 8):
+        editor.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=cell_pos(x, 5), rel=(0, 0), buttons=(1, 0, 0)))
+    assert editor.map[5][6:9] == [None, None, None]
+    assert len(editor.redo_stack) == 1
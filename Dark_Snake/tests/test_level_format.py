@@ -0,0 +1,61 @@
+import pytest
+
+from modules.level_format import decode_level, encode_level, load_level, save_level
+
+
+def sample_layers():
+    ground = [["wall"] * 6] + [["wall", "floor", "floor", None, "floor", "wall"] for _ in range(3)] + [["wall"] * 6]
+    ground[2][3] = "lava"
+    decor = [[None] * 6 for _ in range(5)]
+    decor[1][1] = "torch"
+    decor[3][4] = "Ö-tile"
+    return [ground, decor]
+
+
+def test_roundtrip_multiple_layers(tmp_path):
+    layers = sample_layers()
+    assert decode_level(encode_level(layers)) == layers
+
+    path = tmp_path / "level.dslv"
+    save_level(str(path), *layers)
+    loaded = load_level(str(path))
+    assert loaded == layers
+    # Gleiche Zeilen werden geteilt gespeichert, beim Laden aber als eigene Listen geliefert
+    loaded[0][0][0] = "changed"
+    assert loaded[0][4][0] == "wall"
+
+
+def test_truncated_input_raises_value_error():
+    data = encode_level(sample_layers())
+    for end in range(len(data)):
+        with pytest.raises(ValueError):
+            decode_level(data[:end])
+
+
+def test_corrupted_input_raises_only_value_error():
+    data = encode_level(sample_layers())
+    for pos in range(len(data)):
+        for value in (0x00, 0xFF):
+            broken = bytearray(data)
+            broken[pos] = value
+            try:
+                decode_level(bytes(broken))
+            except ValueError:
+                pass
+
+
+def test_bad_header_is_rejected():
+    data = encode_level(sample_layers())
+    with pytest.raises(ValueError, match="Keine"):
+        decode_level(b"XXXX" + data[4:])
+    with pytest.raises(ValueError, match="Version"):
+        decode_level(data[:4] + bytes([99]) + data[5:])
+
+
+def test_encode_rejects_invalid_levels():
+    with pytest.raises(ValueError):
+        encode_level([])
+    with pytest.raises(ValueError):
+        encode_level([[["a", "b"]], [["a"]]])
+    with pytest.raises(ValueError):
+        encode_level([[["a"]]] * 256)